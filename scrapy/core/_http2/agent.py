@@ -6,68 +6,109 @@ from typing import TYPE_CHECKING
 from twisted.internet import defer
 from twisted.internet.defer import Deferred
 from twisted.python.failure import Failure
-from twisted.web.client import URI, BrowserLikePolicyForHTTPS, _StandardEndpointFactory
+from twisted.web.client import (
+    URI,
+    BrowserLikePolicyForHTTPS,
+    ResponseFailed,
+    _StandardEndpointFactory,
+)
 from twisted.web.error import SchemeNotSupported
 
 from scrapy.core._http2.protocol import H2ClientFactory, H2ClientProtocol
+from scrapy.core._http2.stream import UnprocessedStreamClosed
 from scrapy.core.downloader.contextfactory import _AcceptableProtocolsContextFactory
+from scrapy.utils._download_handlers import TimingEndpoint
 
 if TYPE_CHECKING:
     from twisted.internet.base import ReactorBase
     from twisted.internet.endpoints import HostnameEndpoint
+    from twisted.internet.interfaces import IStreamClientEndpoint
 
     from scrapy.crawler import Crawler
     from scrapy.http import Request, Response
     from scrapy.spiders import Spider
+    from scrapy.utils._download_handlers import DownloadTiming
 
 
 ConnectionKeyT = tuple[bytes, bytes, int]
 
+# Number of streams that h2 allows by default, used as the expected capacity
+# of connections that are not established yet
+_DEFAULT_MAX_CONCURRENT_STREAMS = 100
+
 
 class H2ConnectionPool:
     def __init__(self, crawler: Crawler) -> None:
         self._crawler = crawler
 
         # Store a dictionary which is used to get the respective
-        # H2ClientProtocolInstance using the  key as Tuple(scheme, hostname, port)
-        self._connections: dict[ConnectionKeyT, H2ClientProtocol] = {}
+        # H2ClientProtocol instances using the key as Tuple(scheme, hostname, port)
+        self._connections: dict[ConnectionKeyT, list[H2ClientProtocol]] = {}
 
-        # Save all requests that arrive before the connection is established
+        # Save all requests that arrive before a connection is established,
+        # with a separate queue for each connection being established
         self._pending_requests: dict[
-            ConnectionKeyT, deque[Deferred[H2ClientProtocol]]
+            ConnectionKeyT, list[deque[Deferred[H2ClientProtocol]]]
         ] = {}
 
+        self._max_connections: int = max(
+            crawler.settings.getint("HTTP2_MAX_CONNECTIONS"), 1
+        )
         self._tls_verbose_logging: bool = crawler.settings.getbool(
             "DOWNLOADER_CLIENT_TLS_VERBOSE_LOGGING"
         )
 
     def get_connection(
-        self, key: ConnectionKeyT, uri: URI, endpoint: HostnameEndpoint
+        self, key: ConnectionKeyT, uri: URI, endpoint: IStreamClientEndpoint
     ) -> Deferred[H2ClientProtocol]:
-        if key in self._pending_requests:
-            # Received a request while connecting to remote
-            # Create a deferred which will fire with the H2ClientProtocol
-            # instance
-            d: Deferred[H2ClientProtocol] = Deferred()
-            self._pending_requests[key].append(d)
-            return d
-
-        # Check if we already have a connection to the remote
-        conn = self._connections.get(key, None)
-        if conn:
+        connections = [
+            conn for conn in self._connections.get(key, ()) if conn.accepts_streams
+        ]
+
+        # Check if we already have a connection to the remote with free streams
+        available = [
+            conn
+            for conn in connections
+            if conn.stream_load < conn.allowed_max_concurrent_streams
+        ]
+        if available:
             # Return this connection instance wrapped inside a deferred
-            return defer.succeed(conn)
+            return defer.succeed(min(available, key=lambda conn: conn.stream_load))
+
+        # Received a request while connecting to remote
+        # Create a deferred which will fire with the H2ClientProtocol
+        # instance
+        pending = self._pending_requests.get(key, [])
+        for waiting in pending:
+            if len(waiting) < _DEFAULT_MAX_CONCURRENT_STREAMS:
+                return self._wait_for_connection(waiting)
 
-        # No connection is established for the given URI
+        # All the streams are in use, open a new connection if allowed
+        if len(connections) + len(pending) < self._max_connections:
+            return self._new_connection(key, uri, endpoint)
+
+        # Otherwise queue the request in the least busy connection
+        if connections:
+            return defer.succeed(min(connections, key=lambda conn: conn.stream_load))
+        if pending:
+            return self._wait_for_connection(min(pending, key=len))
         return self._new_connection(key, uri, endpoint)
 
+    @staticmethod
+    def _wait_for_connection(
+        waiting: deque[Deferred[H2ClientProtocol]],
+    ) -> Deferred[H2ClientProtocol]:
+        d: Deferred[H2ClientProtocol] = Deferred()
+        waiting.append(d)
+        return d
+
     def _new_connection(
-        self, key: ConnectionKeyT, uri: URI, endpoint: HostnameEndpoint
+        self, key: ConnectionKeyT, uri: URI, endpoint: IStreamClientEndpoint
     ) -> Deferred[H2ClientProtocol]:
-        self._pending_requests[key] = deque()
+        waiting: deque[Deferred[H2ClientProtocol]] = deque()
+        self._pending_requests.setdefault(key, []).append(waiting)
 
         conn_lost_deferred: Deferred[None] = Deferred()
-        conn_lost_deferred.addCallback(self._remove_connection, key)
 
         factory = H2ClientFactory(
             uri,
@@ -76,37 +117,97 @@ class H2ConnectionPool:
             tls_verbose_logging=self._tls_verbose_logging,
         )
         conn_d = endpoint.connect(factory)
-        conn_d.addCallback(self.put_connection, key)
+        conn_d.addCallbacks(
+            self.put_connection,
+            self._connection_failed,
+            callbackArgs=(key, waiting, conn_lost_deferred),
+            errbackArgs=(key, waiting),
+        )
+        self._crawler.stats.inc_value("downloader/h2/connections_opened")
 
-        d: Deferred[H2ClientProtocol] = Deferred()
-        self._pending_requests[key].append(d)
-        return d
+        return self._wait_for_connection(waiting)
 
     def put_connection(
-        self, conn: H2ClientProtocol, key: ConnectionKeyT
+        self,
+        conn: H2ClientProtocol,
+        key: ConnectionKeyT,
+        waiting: deque[Deferred[H2ClientProtocol]],
+        conn_lost_deferred: Deferred[None],
     ) -> H2ClientProtocol:
-        self._connections[key] = conn
+        self._connections.setdefault(key, []).append(conn)
+        conn_lost_deferred.addCallback(self._remove_connection, key, conn)
+        self._remove_pending(key, waiting)
 
         # Now as we have established a proper HTTP/2 connection
         # we fire all the deferred's with the connection instance
-        pending_requests = self._pending_requests.pop(key, None)
-        while pending_requests:
-            d = pending_requests.popleft()
+        while waiting:
+            d = waiting.popleft()
             d.callback(conn)
 
         return conn
 
-    def _remove_connection(self, _: None, key: ConnectionKeyT) -> None:
-        self._connections.pop(key)
+    def _connection_failed(
+        self,
+        failure: Failure,
+        key: ConnectionKeyT,
+        waiting: deque[Deferred[H2ClientProtocol]],
+    ) -> None:
+        self._remove_pending(key, waiting)
+        while waiting:
+            d = waiting.popleft()
+            d.errback(failure)
+
+    def _remove_pending(
+        self, key: ConnectionKeyT, waiting: deque[Deferred[H2ClientProtocol]]
+    ) -> None:
+        pending = self._pending_requests[key]
+        pending.remove(waiting)
+        if not pending:
+            del self._pending_requests[key]
+
+    def stream_capacity(self, key: ConnectionKeyT) -> int | None:
+        """Return the number of streams that can be open at the same time
+        to the remote identified by *key*, as negotiated through
+        ``SETTINGS_MAX_CONCURRENT_STREAMS``, across the maximum number of
+        connections allowed for *key*, or ``None`` if there is no established
+        connection for *key*."""
+        connections = self._connections.get(key)
+        if not connections:
+            return None
+        streams = max(conn.allowed_max_concurrent_streams for conn in connections)
+        return streams * self._max_connections
+
+    def connection_stats(self, key: ConnectionKeyT) -> list[dict[str, int]]:
+        """Return the stream and flow control statistics of every established
+        connection for *key*."""
+        return [conn.stats for conn in self._connections.get(key, ())]
+
+    def stream_migrated(self) -> None:
+        """Record that a request was sent again over a new connection because
+        the remote closed the previous one without processing it."""
+        self._crawler.stats.inc_value("downloader/h2/streams_migrated")
+
+    def _remove_connection(
+        self, _: None, key: ConnectionKeyT, conn: H2ClientProtocol
+    ) -> None:
+        connections = self._connections[key]
+        connections.remove(conn)
+        if not connections:
+            del self._connections[key]
 
     def close_connections(self) -> None:
         """Close all the HTTP/2 connections and remove them from pool."""
-        for conn in self._connections.values():
-            assert conn.transport is not None  # typing
-            conn.transport.abortConnection()
+        for connections in self._connections.values():
+            for conn in connections:
+                assert conn.transport is not None  # typing
+                conn.transport.abortConnection()
 
 
 class H2Agent:
+    # Maximum number of times a request is sent over a new connection after
+    # the remote closes a connection without processing it
+    MAX_MIGRATIONS = 3
+
     def __init__(
         self,
         reactor: ReactorBase,
@@ -134,16 +235,78 @@ class H2Agent:
         """
         return uri.scheme, uri.host, uri.port
 
-    def request(self, request: Request, spider: Spider) -> Deferred[Response]:
+    def request(
+        self, request: Request, spider: Spider, timing: DownloadTiming | None = None
+    ) -> Deferred[Response]:
         uri = URI.fromBytes(bytes(request.url, encoding="utf-8"))
         try:
-            endpoint = self.get_endpoint(uri)
+            endpoint: IStreamClientEndpoint = self.get_endpoint(uri)
         except SchemeNotSupported:
             return defer.fail(Failure())
+        if timing is not None:
+            endpoint = TimingEndpoint(endpoint, timing)
 
         key = self.get_key(uri)
+        d = self._request(request, spider, key, uri, endpoint, 0, timing)
+        d.addCallback(self._cb_stream_capacity, request, key)
+        return d
+
+    def _request(
+        self,
+        request: Request,
+        spider: Spider,
+        key: ConnectionKeyT,
+        uri: URI,
+        endpoint: IStreamClientEndpoint,
+        migrations: int,
+        timing: DownloadTiming | None = None,
+    ) -> Deferred[Response]:
         d: Deferred[H2ClientProtocol] = self._pool.get_connection(key, uri, endpoint)
         d2: Deferred[Response] = d.addCallback(
-            lambda conn: conn.request(request, spider)
+            lambda conn: conn.request(request, spider, timing)
+        )
+        d2.addErrback(
+            self._eb_unprocessed,
+            request,
+            spider,
+            key,
+            uri,
+            endpoint,
+            migrations,
+            timing,
         )
         return d2
+
+    def _eb_unprocessed(
+        self,
+        failure: Failure,
+        request: Request,
+        spider: Spider,
+        key: ConnectionKeyT,
+        uri: URI,
+        endpoint: IStreamClientEndpoint,
+        migrations: int,
+        timing: DownloadTiming | None = None,
+    ) -> Failure | Deferred[Response]:
+        """Send the request over a different connection if the remote sent a
+        GOAWAY frame without processing it."""
+        if migrations >= self.MAX_MIGRATIONS or not failure.check(ResponseFailed):
+            return failure
+        assert isinstance(failure.value, ResponseFailed)  # typing
+        if not any(
+            isinstance(reason, UnprocessedStreamClosed)
+            for reason in failure.value.reasons
+        ):
+            return failure
+        self._pool.stream_migrated()
+        return self._request(
+            request, spider, key, uri, endpoint, migrations + 1, timing
+        )
+
+    def _cb_stream_capacity(
+        self, response: Response, request: Request, key: ConnectionKeyT
+    ) -> Response:
+        capacity = self._pool.stream_capacity(key)
+        if capacity is not None:
+            request.meta["h2_max_concurrent_streams"] = capacity
+        return response
@@ -4,15 +4,17 @@ import ipaddress
 import itertools
 import logging
 from collections import deque
+from time import monotonic
 from typing import TYPE_CHECKING, Any, cast
 
 from h2.config import H2Configuration
-from h2.connection import H2Connection
+from h2.connection import ConnectionState, H2Connection
 from h2.errors import ErrorCodes
 from h2.events import (
     ConnectionTerminated,
     DataReceived,
     Event,
+    RemoteSettingsChanged,
     ResponseReceived,
     SettingsAcknowledged,
     StreamEnded,
@@ -41,12 +43,14 @@ from scrapy.utils.ssl import _log_ssl_conn_debug_info
 if TYPE_CHECKING:
     from ipaddress import IPv4Address, IPv6Address
 
+    from hyperframe.frame import GoAwayFrame
     from twisted.internet.defer import Deferred
     from twisted.python.failure import Failure
     from twisted.web.client import URI
 
     from scrapy.crawler import Crawler
     from scrapy.spiders import Spider
+    from scrapy.utils._download_handlers import DownloadTiming
 
 
 logger = logging.getLogger(__name__)
@@ -82,10 +86,35 @@ class MethodNotAllowed405(H2Error):
         self.remote_ip_address = remote_ip_address
 
 
+class _DrainableH2Connection(H2Connection):
+    """H2Connection that keeps receiving frames of open streams after a
+    graceful GOAWAY frame.
+
+    h2 closes the connection state machine as soon as a GOAWAY frame is
+    received, which makes any later frame a protocol error, while the remote
+    peer still completes the streams with an ID up to the last stream ID of
+    the GOAWAY frame (RFC 9113, Section 6.8).
+    """
+
+    def _receive_goaway_frame(self, frame: GoAwayFrame) -> Any:
+        previous_state = self.state_machine.state
+        result = super()._receive_goaway_frame(frame)
+        if frame.error_code == ErrorCodes.NO_ERROR and previous_state in {
+            ConnectionState.IDLE,
+            ConnectionState.CLIENT_OPEN,
+        }:
+            self.state_machine.state = previous_state
+        return result
+
+
 @implementer(IHandshakeListener)
 class H2ClientProtocol(Protocol, TimeoutMixin):
     IDLE_TIMEOUT = 240
 
+    #: Set by :class:`~scrapy.utils._download_handlers.TimingEndpoint` for the
+    #: request that opened the connection.
+    download_timing: DownloadTiming | None = None
+
     def __init__(
         self,
         uri: URI,
@@ -109,7 +138,7 @@ class H2ClientProtocol(Protocol, TimeoutMixin):
         self._tls_verbose_logging: bool = tls_verbose_logging
 
         config = H2Configuration(client_side=True, header_encoding="utf-8")
-        self.conn = H2Connection(config=config)
+        self.conn = _DrainableH2Connection(config=config)
 
         # ID of the next request stream
         # Following the convention - 'Streams initiated by a client MUST
@@ -150,6 +179,11 @@ class H2ClientProtocol(Protocol, TimeoutMixin):
             # Flag to keep track if settings were acknowledged by the remote
             # This ensures that we have established a HTTP/2 connection
             "settings_acknowledged": False,
+            # Flag to keep track if the remote sent a GOAWAY frame, after
+            # which no new streams are opened over this connection
+            "goaway_received": False,
+            # Total number of streams initiated over this connection
+            "streams_opened": 0,
         }
 
     @property
@@ -161,6 +195,37 @@ class H2ClientProtocol(Protocol, TimeoutMixin):
         assert self.transport is not None  # typing
         return bool(self.transport.connected) and self.metadata["settings_acknowledged"]
 
+    @property
+    def accepts_streams(self) -> bool:
+        """Whether new requests can be sent over this connection, i.e. it
+        has not been lost and the remote has not sent a GOAWAY frame.
+        """
+        return (
+            self.transport is not None
+            and bool(self.transport.connected)
+            and not self.transport.disconnecting
+            and not self.metadata["goaway_received"]
+        )
+
+    @property
+    def stream_load(self) -> int:
+        """Number of active streams plus the number of streams waiting to
+        be initiated."""
+        active_streams: int = self.metadata["active_streams"]
+        return active_streams + len(self._pending_request_stream_pool)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Stream and flow control statistics of this connection."""
+        return {
+            "active_streams": self.metadata["active_streams"],
+            "pending_streams": len(self._pending_request_stream_pool),
+            "max_concurrent_streams": self.allowed_max_concurrent_streams,
+            "streams_opened": self.metadata["streams_opened"],
+            "inbound_flow_control_window": self.conn.inbound_flow_control_window,
+            "outbound_flow_control_window": self.conn.outbound_flow_control_window,
+        }
+
     @property
     def allowed_max_concurrent_streams(self) -> int:
         """We keep total two streams for client (sending data) and
@@ -182,8 +247,10 @@ class H2ClientProtocol(Protocol, TimeoutMixin):
             self._pending_request_stream_pool
             and self.metadata["active_streams"] < self.allowed_max_concurrent_streams
             and self.h2_connected
+            and not self.metadata["goaway_received"]
         ):
             self.metadata["active_streams"] += 1
+            self.metadata["streams_opened"] += 1
             stream = self._pending_request_stream_pool.popleft()
             stream.initiate_request()
             self._write_to_transport()
@@ -192,10 +259,24 @@ class H2ClientProtocol(Protocol, TimeoutMixin):
         """Perform cleanup when a stream is closed"""
         stream = self.streams.pop(stream_id)
         self.metadata["active_streams"] -= 1
-        self._send_pending_requests()
+        if self.metadata["goaway_received"]:
+            self._close_if_drained()
+        else:
+            self._send_pending_requests()
         return stream
 
-    def _new_stream(self, request: Request, spider: Spider) -> Stream:
+    def _close_if_drained(self) -> None:
+        """Close the connection once all the streams that the remote agreed
+        to process after a GOAWAY frame are closed."""
+        assert self.transport is not None  # typing
+        if not self.streams and not self.transport.disconnecting:
+            self.conn.close_connection()
+            self._write_to_transport()
+            self.transport.loseConnection()
+
+    def _new_stream(
+        self, request: Request, spider: Spider, timing: DownloadTiming | None = None
+    ) -> Stream:
         """Instantiates a new Stream object"""
         if hasattr(spider, "download_maxsize"):  # pragma: no cover
             warn_on_deprecated_spider_attribute("download_maxsize", "DOWNLOAD_MAXSIZE")
@@ -215,6 +296,7 @@ class H2ClientProtocol(Protocol, TimeoutMixin):
             download_warnsize=getattr(
                 spider, "download_warnsize", self.metadata["default_download_warnsize"]
             ),
+            timing=timing,
         )
         self.streams[stream.stream_id] = stream
         return stream
@@ -230,13 +312,15 @@ class H2ClientProtocol(Protocol, TimeoutMixin):
         data = self.conn.data_to_send()
         self.transport.write(data)
 
-    def request(self, request: Request, spider: Spider) -> Deferred[Response]:
+    def request(
+        self, request: Request, spider: Spider, timing: DownloadTiming | None = None
+    ) -> Deferred[Response]:
         if not isinstance(request, Request):
             raise TypeError(
                 f"Expected scrapy.http.Request, received {request.__class__.__qualname__}"
             )
 
-        stream = self._new_stream(request, spider)
+        stream = self._new_stream(request, spider, timing)
         d: Deferred[Response] = stream.get_response()
 
         # Add the stream to the request pool
@@ -276,6 +360,9 @@ class H2ClientProtocol(Protocol, TimeoutMixin):
         """
         Close the connection if it's not made via the expected protocol
         """
+        if self.download_timing is not None:
+            self.download_timing.tls_end = monotonic()
+            self.download_timing = None
         assert self.transport is not None  # typing
         if (
             self.transport.negotiatedProtocol is not None
@@ -398,14 +485,39 @@ class H2ClientProtocol(Protocol, TimeoutMixin):
                 self.window_updated(event)
             elif isinstance(event, SettingsAcknowledged):
                 self.settings_acknowledged(event)
+            elif isinstance(event, RemoteSettingsChanged):
+                self.remote_settings_changed(event)
             elif isinstance(event, UnknownFrameReceived):
                 logger.warning("Unknown frame received: %s", event.frame)
 
     # Event handler functions starts here
     def connection_terminated(self, event: ConnectionTerminated) -> None:
-        self._lose_connection_with_error(
-            [RemoteTerminatedConnection(self.metadata["ip_address"], event)]
-        )
+        self.metadata["goaway_received"] = True
+        error = RemoteTerminatedConnection(self.metadata["ip_address"], event)
+
+        # Streams that the remote did not and will not process can be safely
+        # retried over a different connection (RFC 9113, Section 6.8)
+        last_stream_id = event.last_stream_id
+        if last_stream_id is None:
+            last_stream_id = 2**31 - 1
+        unprocessed = [
+            stream
+            for stream in self.streams.values()
+            if stream.stream_id > last_stream_id or not stream.metadata["request_sent"]
+        ]
+        self._pending_request_stream_pool.clear()
+        for stream in unprocessed:
+            del self.streams[stream.stream_id]
+            if stream.metadata["request_sent"]:
+                self.metadata["active_streams"] -= 1
+            stream.close(StreamCloseReason.UNPROCESSED, [error], from_protocol=True)
+
+        if event.error_code != ErrorCodes.NO_ERROR:
+            self._lose_connection_with_error([error])
+            return
+
+        # Graceful shutdown: let the remaining streams complete
+        self._close_if_drained()
 
     def data_received(self, event: DataReceived) -> None:
         try:
@@ -434,6 +546,12 @@ class H2ClientProtocol(Protocol, TimeoutMixin):
         assert self.transport is not None  # typing
         self.metadata["certificate"] = Certificate(self.transport.getPeerCertificate())
 
+    def remote_settings_changed(self, event: RemoteSettingsChanged) -> None:
+        # The remote may raise SETTINGS_MAX_CONCURRENT_STREAMS at any time,
+        # in which case streams waiting in the pending pool can be started
+        if SettingCodes.MAX_CONCURRENT_STREAMS in event.changed_settings:
+            self._send_pending_requests()
+
     def stream_ended(self, event: StreamEnded) -> None:
         try:
             stream = self.pop_stream(event.stream_id)
@@ -4,6 +4,7 @@ import logging
 from contextlib import suppress
 from enum import Enum
 from io import BytesIO
+from time import monotonic
 from typing import TYPE_CHECKING, Any
 
 from h2.errors import ErrorCodes
@@ -30,6 +31,7 @@ if TYPE_CHECKING:
     from scrapy.core._http2.protocol import H2ClientProtocol
     from scrapy.crawler import Crawler
     from scrapy.http import Request, Response
+    from scrapy.utils._download_handlers import DownloadTiming
 
 
 logger = logging.getLogger(__name__)
@@ -47,6 +49,17 @@ class InactiveStreamClosed(ConnectionClosed):
         self.request = request
 
 
+class UnprocessedStreamClosed(ConnectionClosed):
+    """The remote sent a GOAWAY frame before processing the stream, so its
+    request can be safely sent again over a different connection."""
+
+    def __init__(self, request: Request) -> None:
+        super().__init__(
+            f"The remote closed the connection without processing the request {request!r}"
+        )
+        self.request = request
+
+
 class InvalidHostname(H2Error):
     def __init__(
         self, request: Request, expected_hostname: str, expected_netloc: str
@@ -89,6 +102,9 @@ class StreamCloseReason(Enum):
     # A signal handler raised StopDownload
     STOP_DOWNLOAD = 9
 
+    # The remote sent a GOAWAY frame without processing the stream
+    UNPROCESSED = 10
+
 
 class Stream:
     """Represents a single HTTP/2 Stream.
@@ -109,6 +125,7 @@ class Stream:
         crawler: Crawler,
         download_maxsize: int = 0,
         download_warnsize: int = 0,
+        timing: DownloadTiming | None = None,
     ) -> None:
         """
         Arguments:
@@ -116,11 +133,14 @@ class Stream:
             request -- The HTTP request associated to the stream
             protocol -- Parent H2ClientProtocol instance
             crawler -- The crawler the request belongs to
+            timing -- Where to record when the request is sent and when the
+                response headers are received
         """
         self.stream_id: int = stream_id
         self._request: Request = request
         self._protocol: H2ClientProtocol = protocol
         self._crawler: Crawler = crawler
+        self._timing: DownloadTiming | None = timing
         self._stop_download: StopDownload | None = None
 
         self._download_maxsize = self._request.meta.get(
@@ -270,6 +290,8 @@ class Stream:
             headers = self._get_request_headers()
             self._protocol.conn.send_headers(self.stream_id, headers, end_stream=False)
             self.metadata["request_sent"] = True
+            if self._timing is not None:
+                self._timing.request_sent = monotonic()
             self.send_data()
         else:
             # Close this stream calling the response errback
@@ -370,6 +392,8 @@ class Stream:
         )
 
     def receive_headers(self, headers: list[tuple[str, str]]) -> None:
+        if self._timing is not None:
+            self._timing.headers_received = monotonic()
         for name, value in headers:
             if name == ":status":
                 # it's a pseudo-header
@@ -496,6 +520,10 @@ class Stream:
             errors = (InactiveStreamClosed(self._request), *errors)
             self._deferred_response.errback(ResponseFailed(errors))
 
+        elif reason is StreamCloseReason.UNPROCESSED:
+            errors = (UnprocessedStreamClosed(self._request), *errors)
+            self._deferred_response.errback(ResponseFailed(errors))
+
         else:
             assert reason is StreamCloseReason.INVALID_HOSTNAME
             self._deferred_response.errback(
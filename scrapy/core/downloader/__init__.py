@@ -4,12 +4,9 @@ import random
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from time import monotonic
+from time import monotonic, perf_counter
 from typing import TYPE_CHECKING, Any
 
-from twisted.internet.defer import Deferred, inlineCallbacks
-from twisted.python.failure import Failure
-
 from scrapy import Request, Spider, signals
 from scrapy.core.downloader.handlers import DownloadHandlers
 from scrapy.core.downloader.middleware import DownloaderMiddlewareManager
@@ -22,25 +19,57 @@ from scrapy.utils.asyncio import (
 )
 from scrapy.utils.decorators import _warn_spider_arg
 from scrapy.utils.defer import (
+    _create_waiter,
+    _fire_waiter,
     _process_pending_io,
     _schedule_coro,
     deferred_from_coro,
-    maybe_deferred_to_future,
 )
 from scrapy.utils.httpobj import urlparse_cached
 from scrapy.utils.misc import build_from_crawler
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from asyncio import Future
+    from collections.abc import Coroutine
 
+    from twisted.internet.defer import Deferred
     from twisted.internet.task import LoopingCall
 
     from scrapy.crawler import Crawler
+    from scrapy.extensions.stagetiming import StageTiming
     from scrapy.http import Response
     from scrapy.settings import BaseSettings
     from scrapy.signalmanager import SignalManager
 
 
+# Phases of the download_timing meta key aggregated by slots
+_TIMING_PHASES = ("dns", "connect", "tls", "ttfb", "transfer", "total")
+
+
+@dataclass(slots=True, eq=False)
+class _TimingAggregate:
+    """Aggregate of the :reqmeta:`download_timing` meta keys of responses."""
+
+    responses: int = 0
+    reused_connections: int = 0
+    totals: dict[str, float] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+
+    def record(self, timing: dict[str, Any]) -> None:
+        self.responses += 1
+        if timing.get("connection_reused"):
+            self.reused_connections += 1
+        for phase in _TIMING_PHASES:
+            value = timing.get(phase)
+            if value is None:
+                continue
+            self.totals[phase] = self.totals.get(phase, 0.0) + value
+            self.counts[phase] = self.counts.get(phase, 0) + 1
+
+    def average(self, phase: str) -> float:
+        return self.totals[phase] / self.counts[phase]
+
+
 @dataclass(slots=True, eq=False)
 class Slot:
     """Downloader slot"""
@@ -50,12 +79,15 @@ class Slot:
     randomize_delay: bool
 
     active: set[Request] = field(default_factory=set, init=False, repr=False)
-    queue: deque[tuple[Request, Deferred[Response]]] = field(
+    queue: deque[tuple[Request, Future[Response] | Deferred[Response]]] = field(
         default_factory=deque, init=False, repr=False
     )
     transferring: set[Request] = field(default_factory=set, init=False, repr=False)
     lastseen: float = field(default=0, init=False, repr=False)
     latercall: CallLaterResult | None = field(default=None, init=False, repr=False)
+    _timing: _TimingAggregate = field(
+        default_factory=_TimingAggregate, init=False, repr=False
+    )
 
     def free_transfer_slots(self) -> int:
         return self.concurrency - len(self.transferring)
@@ -65,6 +97,28 @@ class Slot:
             return random.uniform(0.5 * self.delay, 1.5 * self.delay)  # noqa: S311
         return self.delay
 
+    @property
+    def timed_responses(self) -> int:
+        """Number of responses with a :reqmeta:`download_timing` meta key."""
+        return self._timing.responses
+
+    @property
+    def reused_connections(self) -> int:
+        """Number of those responses downloaded over a reused connection."""
+        return self._timing.reused_connections
+
+    def record_timing(self, timing: dict[str, Any]) -> None:
+        """Add the :reqmeta:`download_timing` of a response to the slot."""
+        self._timing.record(timing)
+
+    def average_timing(self) -> dict[str, float]:
+        """Return the average duration, in seconds, of each
+        :reqmeta:`download_timing` phase of the slot responses.
+
+        Phases that no response has reported are missing.
+        """
+        return {phase: self._timing.average(phase) for phase in self._timing.totals}
+
     def close(self) -> None:
         if self.latercall:
             self.latercall.cancel()
@@ -107,20 +161,32 @@ class Downloader:
         self.per_slot_settings: dict[str, dict[str, Any]] = self.settings.getdict(
             "DOWNLOAD_SLOTS"
         )
+        self._h2_stream_concurrency: bool = self.settings.getbool(
+            "HTTP2_STREAM_CONCURRENCY_ENABLED"
+        )
+        # Set by the StageTiming extension.
+        self._stage_timing: StageTiming | None = None
+        self._timing: _TimingAggregate = _TimingAggregate()
 
-    @inlineCallbacks
     @_warn_spider_arg
     def fetch(
         self, request: Request, spider: Spider | None = None
-    ) -> Generator[Deferred[Any], Any, Response | Request]:
+    ) -> Deferred[Response | Request]:
+        return deferred_from_coro(self._start_fetch(request))
+
+    def _start_fetch(self, request: Request) -> Coroutine[Any, Any, Response | Request]:
+        """Count *request* as active and return a coroutine that downloads it.
+
+        The request is counted right away, before the coroutine runs, so that
+        :meth:`needs_backout` accounts for it even if the coroutine is
+        scheduled as a task that starts later.
+        """
         self.active.add(request)
+        return self._fetch(request)
+
+    async def _fetch(self, request: Request) -> Response | Request:
         try:
-            result: Response | Request = yield (
-                deferred_from_coro(
-                    self.middleware.download_async(self._enqueue_request, request)
-                )
-            )
-            return result
+            return await self.middleware.download_async(self._enqueue_request, request)
         finally:
             self.active.remove(request)
 
@@ -167,11 +233,13 @@ class Downloader:
             request=request,
             spider=self.crawler.spider,
         )
-        d: Deferred[Response] = Deferred()
-        slot.queue.append((request, d))
+        waiter: Future[Response] | Deferred[Response] = _create_waiter()
+        if self._stage_timing is not None:
+            self._stage_timing.start("downloader_slot", request)
+        slot.queue.append((request, waiter))
         self._process_queue(slot)
         try:
-            return await maybe_deferred_to_future(d)  # fired in _wait_for_download()
+            return await waiter  # fired in _wait_for_download()
         finally:
             slot.active.remove(request)
 
@@ -192,13 +260,32 @@ class Downloader:
         # Process enqueued requests if there are free slots to transfer for this slot
         while slot.queue and slot.free_transfer_slots() > 0:
             slot.lastseen = now
-            request, queue_dfd = slot.queue.popleft()
-            _schedule_coro(self._wait_for_download(slot, request, queue_dfd))
+            request, waiter = slot.queue.popleft()
+            if self._stage_timing is not None:
+                self._stage_timing.stop(
+                    "downloader_slot", request, request.meta[self.DOWNLOAD_SLOT]
+                )
+            _schedule_coro(self._wait_for_download(slot, request, waiter))
             # prevent burst if inter-request delays were configured
             if delay:
                 self._process_queue(slot)
                 break
 
+    def _record_timing_stats(self, timing: dict[str, Any]) -> None:
+        self._timing.record(timing)
+        stats = self.crawler.stats
+        stats.set_value("downloader/timing/response_count", self._timing.responses)
+        stats.set_value(
+            "downloader/timing/reused_connection_count",
+            self._timing.reused_connections,
+        )
+        for phase in _TIMING_PHASES:
+            if timing.get(phase) is not None:
+                stats.set_value(
+                    f"downloader/timing/{phase}",
+                    round(self._timing.average(phase), 6),
+                )
+
     def _latercall(self, slot: Slot) -> None:
         slot.latercall = None
         self._process_queue(slot)
@@ -208,7 +295,19 @@ class Downloader:
         slot.transferring.add(request)
         try:
             # 1. Download the response
+            start = perf_counter()
             response: Response = await self.handlers.download_request_async(request)
+            if self._stage_timing is not None:
+                self._stage_timing.record(
+                    "download",
+                    perf_counter() - start,
+                    request.meta[self.DOWNLOAD_SLOT],
+                )
+            if (timing := request.meta.get("download_timing")) is not None:
+                slot.record_timing(timing)
+                self._record_timing_stats(timing)
+            if self._h2_stream_concurrency:
+                self._update_slot_concurrency(slot, request)
             # 2. Notify response_downloaded listeners about the recent download
             # before querying queue for next request
             self.signals.send_catch_log(
@@ -234,15 +333,31 @@ class Downloader:
                 spider=self.crawler.spider,
             )
 
+    def _update_slot_concurrency(self, slot: Slot, request: Request) -> None:
+        """Make the concurrency of *slot* follow the number of concurrent
+        streams that the HTTP/2 server of *request* allows."""
+        streams: int | None = request.meta.get("h2_max_concurrent_streams")
+        if streams is None:
+            return
+        slot_settings = self.per_slot_settings.get(request.meta[self.DOWNLOAD_SLOT])
+        if slot_settings and "concurrency" in slot_settings:
+            return
+        if self.total_concurrency:
+            streams = min(streams, self.total_concurrency)
+        slot.concurrency = max(streams, 1)
+
     async def _wait_for_download(
-        self, slot: Slot, request: Request, queue_dfd: Deferred[Response]
+        self,
+        slot: Slot,
+        request: Request,
+        waiter: Future[Response] | Deferred[Response],
     ) -> None:
         try:
             response = await self._download(slot, request)
-        except Exception:
-            queue_dfd.errback(Failure())
+        except Exception as exception:
+            _fire_waiter(waiter, exception=exception)
         else:
-            queue_dfd.callback(response)  # awaited in _enqueue_request()
+            _fire_waiter(waiter, response)  # awaited in _enqueue_request()
 
     def close(self) -> None:
         self._stop_slot_gc()
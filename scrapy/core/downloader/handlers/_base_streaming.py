@@ -15,6 +15,7 @@ from scrapy.exceptions import (
     ResponseDataLossError,
 )
 from scrapy.utils._download_handlers import (
+    DownloadTiming,
     check_stop_download,
     get_dataloss_msg,
     get_maxsize_msg,
@@ -98,11 +99,14 @@ class BaseStreamingDownloadHandler(BaseHttpDownloadHandler, ABC, Generic[_Respon
 
     @abstractmethod
     def _make_request(
-        self, request: Request, timeout: float
+        self, request: Request, timeout: float, timing: DownloadTiming
     ) -> AbstractAsyncContextManager[_ResponseT]:
         """Return an async context manager yielding the library-specific response.
 
         Exceptions raised by the library should be reraised as Scrapy-specific ones.
+
+        The network phases that the library reports should be recorded in
+        *timing*.
         """
         raise NotImplementedError
 
@@ -149,10 +153,15 @@ class BaseStreamingDownloadHandler(BaseHttpDownloadHandler, ABC, Generic[_Respon
         timeout: float = request.meta.get(
             "download_timeout", self._DEFAULT_CONNECT_TIMEOUT
         )
-        start_time = time.monotonic()
-        async with self._make_request(request, timeout) as response:
-            request.meta["download_latency"] = time.monotonic() - start_time
-            return await self._read_response(response, request)
+        timing = DownloadTiming()
+        async with self._make_request(request, timeout, timing) as response:
+            now = time.monotonic()
+            if timing.headers_received is None:
+                timing.headers_received = now
+            request.meta["download_latency"] = now - timing.start
+            result = await self._read_response(response, request)
+        request.meta["download_timing"] = timing.to_dict()
+        return result
 
     async def _read_response(self, response: _ResponseT, request: Request) -> Response:
         maxsize: int = request.meta.get("download_maxsize", self._default_maxsize)
@@ -6,7 +6,8 @@ import ipaddress
 import ssl
 from contextlib import asynccontextmanager
 from socket import gaierror
-from typing import TYPE_CHECKING, ClassVar
+from time import monotonic
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from scrapy.exceptions import (
     CannotResolveHostError,
@@ -28,12 +29,13 @@ from scrapy.utils.ssl import (
 from ._base_streaming import BaseStreamingDownloadHandler, _BaseResponseArgs
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Callable, Coroutine
 
     from httpcore2 import AsyncNetworkStream
 
     from scrapy import Request
     from scrapy.crawler import Crawler
+    from scrapy.utils._download_handlers import DownloadTiming
 
 
 HAS_SOCKS = HAS_HTTP2 = False
@@ -146,9 +148,31 @@ class HttpxDownloadHandler(_Base):
         self._proxy_clients[proxy_url] = client
         return client
 
+    @staticmethod
+    def _make_trace(
+        timing: DownloadTiming,
+    ) -> Callable[[str, dict[str, Any]], Coroutine[Any, Any, None]]:
+        """Return an httpcore ``trace`` extension that records the network
+        phases in *timing*. Name resolution is part of ``connect_tcp``."""
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            event = event_name.split(".", 1)[1]
+            if event == "connect_tcp.started":
+                timing.connection_started()
+            elif event == "connect_tcp.complete":
+                timing.connect_end = monotonic()
+            elif event == "start_tls.complete":
+                timing.tls_end = monotonic()
+            elif event == "send_request_headers.started":
+                timing.request_sent = monotonic()
+            elif event == "receive_response_headers.complete":
+                timing.headers_received = monotonic()
+
+        return trace
+
     @asynccontextmanager
     async def _make_request(
-        self, request: Request, timeout: float
+        self, request: Request, timeout: float, timing: DownloadTiming
     ) -> AsyncIterator[httpx.Response]:
         proxy = self._extract_proxy_url_with_creds(request)
         if proxy and proxy.startswith("socks") and not HAS_SOCKS:  # pragma: no cover
@@ -165,6 +189,7 @@ class HttpxDownloadHandler(_Base):
                 content=request.body,
                 headers=headers,
                 timeout=timeout,
+                extensions={"trace": self._make_trace(timing)},
             ) as response:
                 yield response
         except httpx.TimeoutException as e:
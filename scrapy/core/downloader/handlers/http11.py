@@ -15,6 +15,7 @@ from urllib.parse import urldefrag, urlparse
 from twisted.internet import ssl
 from twisted.internet.defer import Deferred, succeed
 from twisted.internet.endpoints import TCP4ClientEndpoint
+from twisted.internet.interfaces import IHandshakeListener
 from twisted.internet.protocol import Factory, Protocol, connectionDone
 from twisted.python.failure import Failure
 from twisted.web._newclient import (
@@ -49,6 +50,9 @@ from scrapy.exceptions import (
 )
 from scrapy.http import Headers, Response
 from scrapy.utils._download_handlers import (
+    DownloadTiming,
+    TimingEndpoint,
+    TimingReactor,
     check_stop_download,
     get_dataloss_msg,
     get_maxsize_msg,
@@ -68,7 +72,7 @@ from ._base_http import BaseHttpDownloadHandler
 
 if TYPE_CHECKING:
     from twisted.internet.base import ReactorBase
-    from twisted.internet.interfaces import IAddress, IConsumer
+    from twisted.internet.interfaces import IAddress, IConsumer, IStreamClientEndpoint
     from twisted.web._newclient import Request as TxRequest
 
     # typing.NotRequired requires Python 3.11
@@ -391,6 +395,31 @@ class _ScrapyProxyAgent(Agent):
         )
 
 
+class _TimingConnectionPool:
+    """Wrapper of an :class:`~twisted.web.client.HTTPConnectionPool` that
+    records in a :class:`~scrapy.utils._download_handlers.DownloadTiming`
+    object whether the connection of a request is new and when it is ready.
+    """
+
+    def __init__(self, pool: HTTPConnectionPool, timing: DownloadTiming):
+        self._pool: HTTPConnectionPool = pool
+        self._timing: DownloadTiming = timing
+        self.persistent: bool = pool.persistent
+
+    def getConnection(
+        self, key: Any, endpoint: IStreamClientEndpoint
+    ) -> Deferred[HTTP11ClientProtocol]:
+        d: Deferred[HTTP11ClientProtocol] = self._pool.getConnection(
+            key, TimingEndpoint(endpoint, self._timing)
+        )
+        d.addCallback(self._cb_connection)
+        return d
+
+    def _cb_connection(self, protocol: HTTP11ClientProtocol) -> HTTP11ClientProtocol:
+        self._timing.request_sent = monotonic()
+        return protocol
+
+
 class _ScrapyAgent:
     def __init__(
         self,
@@ -416,9 +445,19 @@ class _ScrapyAgent:
         self._crawler: Crawler = crawler
         self._tls_verbose_logging: bool = tls_verbose_logging
 
-    def _get_agent(self, request: Request, timeout: float) -> Agent:
+    def _get_agent(
+        self, request: Request, timeout: float, timing: DownloadTiming
+    ) -> Agent:
         from twisted.internet import reactor
 
+        # Record name resolutions and new connections of this request
+        timing_reactor = cast("ReactorBase", TimingReactor(reactor, timing))
+        pool = cast(
+            "HTTPConnectionPool",
+            _TimingConnectionPool(
+                self._pool or HTTPConnectionPool(reactor, persistent=False), timing
+            ),
+        )
         bindaddress = request.meta.get("bindaddress") or self._bindAddress
         bindaddress = normalize_bind_address(bindaddress)
         proxy = request.meta.get("proxy")
@@ -438,35 +477,36 @@ class _ScrapyAgent:
                 proxyAuth = request.headers.get(b"Proxy-Authorization", None)
                 proxyConf = (proxy_host, proxy_port, proxyAuth)
                 return _TunnelingAgent(
-                    reactor=reactor,
+                    reactor=timing_reactor,
                     proxyConf=proxyConf,
                     contextFactory=self._contextFactory,
                     connectTimeout=timeout,
                     bindAddress=bindaddress,
-                    pool=self._pool,
+                    pool=pool,
                 )
             return _ScrapyProxyAgent(
-                reactor=reactor,
+                reactor=timing_reactor,
                 proxyURI=to_bytes(proxy, encoding="ascii"),
                 contextFactory=self._contextFactory,
                 connectTimeout=timeout,
                 bindAddress=bindaddress,
-                pool=self._pool,
+                pool=pool,
             )
 
         return Agent(
-            reactor=reactor,
+            reactor=timing_reactor,
             contextFactory=self._contextFactory,
             connectTimeout=timeout,
             bindAddress=bindaddress,
-            pool=self._pool,
+            pool=pool,
         )
 
     def download_request(self, request: Request) -> Deferred[Response]:
         from twisted.internet import reactor
 
         timeout = request.meta.get("download_timeout") or self._connectTimeout
-        agent = self._get_agent(request, timeout)
+        timing = DownloadTiming()
+        agent = self._get_agent(request, timeout, timing)
 
         # request details
         url = urldefrag(request.url)[0]
@@ -475,7 +515,6 @@ class _ScrapyAgent:
         if isinstance(agent, _TunnelingAgent):
             headers.removeHeader(b"Proxy-Authorization")
         bodyproducer = _RequestBodyProducer(request.body) if request.body else None
-        start_time = monotonic()
         d: Deferred[IResponse] = agent.request(
             method,
             to_bytes(url, encoding="ascii"),
@@ -483,10 +522,11 @@ class _ScrapyAgent:
             cast("IBodyProducer", bodyproducer),
         )
         # set download latency
-        d.addCallback(self._cb_latency, request, start_time)
+        d.addCallback(self._cb_latency, request, timing)
         # response body is ready to be consumed
         d2: Deferred[_ResultT] = d.addCallback(self._cb_bodyready, request)
         d3: Deferred[Response] = d2.addCallback(self._cb_bodydone, url)
+        d3.addCallback(self._cb_timing, request, timing)
         # check download timeout
         self._timeout_cl = reactor.callLater(timeout, d3.cancel)
         d3.addBoth(self._cb_timeout, request, url, timeout)
@@ -503,10 +543,18 @@ class _ScrapyAgent:
 
         raise DownloadTimeoutError(f"Getting {url} took longer than {timeout} seconds.")
 
-    def _cb_latency(self, result: _T, request: Request, start_time: float) -> _T:
-        request.meta["download_latency"] = monotonic() - start_time
+    def _cb_latency(self, result: _T, request: Request, timing: DownloadTiming) -> _T:
+        timing.headers_received = monotonic()
+        request.meta["download_latency"] = timing.headers_received - timing.start
         return result
 
+    @staticmethod
+    def _cb_timing(
+        response: Response, request: Request, timing: DownloadTiming
+    ) -> Response:
+        request.meta["download_timing"] = timing.to_dict()
+        return response
+
     @staticmethod
     def _headers_from_twisted_response(response: TxResponse) -> Headers:
         headers = Headers()
@@ -800,9 +848,19 @@ class _LenientHTTPClientParser(HTTPClientParser):
             self._partialHeader.append(line)  # type: ignore[union-attr]
 
 
+@implementer(IHandshakeListener)
 class _LenientHTTP11ClientProtocol(HTTP11ClientProtocol):
     """Protocol that parses responses with :class:`_LenientHTTPClientParser`."""
 
+    #: Set by :class:`~scrapy.utils._download_handlers.TimingEndpoint` for the
+    #: request that opened the connection.
+    download_timing: DownloadTiming | None = None
+
+    def handshakeCompleted(self) -> None:
+        if self.download_timing is not None:
+            self.download_timing.tls_end = monotonic()
+            self.download_timing = None
+
     def request(self, request: TxRequest) -> Deferred[IResponse]:
         d: Deferred[IResponse] = super().request(request)
         # HTTP11ClientProtocol.request() hardcodes the parser class, so the
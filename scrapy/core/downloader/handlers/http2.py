@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from time import monotonic
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 from urllib.parse import urldefrag
 
 from scrapy.core._http2.agent import H2Agent, H2ConnectionPool
@@ -14,6 +14,8 @@ from scrapy.exceptions import (
     UnsupportedURLSchemeError,
 )
 from scrapy.utils._download_handlers import (
+    DownloadTiming,
+    TimingReactor,
     normalize_bind_address,
     wrap_twisted_exceptions,
 )
@@ -21,7 +23,7 @@ from scrapy.utils.defer import maybe_deferred_to_future
 from scrapy.utils.httpobj import urlparse_cached
 
 if TYPE_CHECKING:
-    from twisted.internet.base import DelayedCall
+    from twisted.internet.base import DelayedCall, ReactorBase
     from twisted.internet.defer import Deferred
     from twisted.web.iweb import IPolicyForHTTPS
 
@@ -80,7 +82,9 @@ class _ScrapyH2Agent:
         self._pool = pool
         self._crawler = crawler
 
-    def _get_agent(self, request: Request, timeout: float | None) -> H2Agent:
+    def _get_agent(
+        self, request: Request, timeout: float | None, timing: DownloadTiming
+    ) -> H2Agent:
         from twisted.internet import reactor
 
         if request.meta.get("proxy"):
@@ -88,7 +92,8 @@ class _ScrapyH2Agent:
         bind_address = request.meta.get("bindaddress") or self._bind_address
         bind_address = normalize_bind_address(bind_address)
         return H2Agent(
-            reactor=reactor,
+            # Record name resolutions of new connections of this request
+            reactor=cast("ReactorBase", TimingReactor(reactor, timing)),
             context_factory=self._context_factory,
             connect_timeout=timeout,
             bind_address=bind_address,
@@ -99,11 +104,11 @@ class _ScrapyH2Agent:
         from twisted.internet import reactor
 
         timeout = request.meta.get("download_timeout") or self._connect_timeout
-        agent = self._get_agent(request, timeout)
+        timing = DownloadTiming()
+        agent = self._get_agent(request, timeout, timing)
 
-        start_time = monotonic()
-        d = agent.request(request, spider)
-        d.addCallback(self._cb_latency, request, start_time)
+        d = agent.request(request, spider, timing)
+        d.addCallback(self._cb_latency, request, timing)
 
         timeout_cl = reactor.callLater(timeout, d.cancel)
         d.addBoth(self._cb_timeout, request, timeout, timeout_cl)
@@ -111,9 +116,11 @@ class _ScrapyH2Agent:
 
     @staticmethod
     def _cb_latency(
-        response: Response, request: Request, start_time: float
+        response: Response, request: Request, timing: DownloadTiming
     ) -> Response:
-        request.meta["download_latency"] = monotonic() - start_time
+        end = monotonic()
+        request.meta["download_latency"] = end - timing.start
+        request.meta["download_timing"] = timing.to_dict(end)
         return response
 
     @staticmethod
@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING, Any
 
 from scrapy.exceptions import ScrapyDeprecationWarning, _InvalidOutput
 from scrapy.http import Request, Response
-from scrapy.middleware import MiddlewareManager
+from scrapy.middleware import MiddlewareManager, _needs_await
 from scrapy.utils.conf import build_component_list
 from scrapy.utils.defer import (
     _process_pending_io,
@@ -20,7 +20,6 @@ from scrapy.utils.defer import (
     ensure_awaitable,
     maybe_deferred_to_future,
 )
-from scrapy.utils.python import global_object_name
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Coroutine
@@ -28,6 +27,7 @@ if TYPE_CHECKING:
     from twisted.internet.defer import Deferred
 
     from scrapy import Spider
+    from scrapy.middleware import _CompiledMethod
     from scrapy.settings import BaseSettings
 
 
@@ -87,26 +87,33 @@ class DownloaderMiddlewareManager(MiddlewareManager):
             result = await self._process_exception(ex, request)
         return await self._process_response(result, request)
 
-    def _handle_mw_method(self, method: Callable[..., Any], **kwargs: Any) -> Any:
-        if method in self._mw_methods_requiring_spider:
+    def _handle_mw_method(self, compiled: _CompiledMethod, **kwargs: Any) -> Any:
+        if compiled.requires_spider:
             kwargs["spider"] = self._spider
-
-        return method(**kwargs)
+        return compiled.method(**kwargs)
+
+    @staticmethod
+    def _is_final(result: Any) -> bool:
+        """Return whether *result*, returned by a middleware method that is not
+        a coroutine function, can be used without awaiting it."""
+        return (
+            result is None
+            or isinstance(result, (Response, Request))
+            or not _needs_await(result)
+        )
 
     async def _process_request(
         self,
         request: Request,
         download_func: Callable[[Request], Coroutine[Any, Any, Response]],
     ) -> Response | Request:
-        for method in self.methods["process_request"]:
-            assert method is not None
-            response = await ensure_awaitable(
-                self._handle_mw_method(method, request=request),
-                _warn=global_object_name(method),
-            )
+        for compiled in self._get_chain("process_request"):
+            response = self._handle_mw_method(compiled, request=request)
+            if compiled.is_async or not self._is_final(response):
+                response = await ensure_awaitable(response, _warn=compiled.name)
             if response is not None and not isinstance(response, (Response, Request)):
                 raise _InvalidOutput(
-                    f"Middleware {method.__qualname__} must return None, Response or "
+                    f"Middleware {compiled.method.__qualname__} must return None, Response or "
                     f"Request, got {response.__class__.__name__}"
                 )
             if response:
@@ -121,16 +128,16 @@ class DownloaderMiddlewareManager(MiddlewareManager):
         if isinstance(response, Request):
             return response
 
-        for method in self.methods["process_response"]:
-            assert method is not None
-            response = await ensure_awaitable(
-                self._handle_mw_method(method, request=request, response=response),
-                _warn=global_object_name(method),
+        for compiled in self._get_chain("process_response"):
+            response = self._handle_mw_method(
+                compiled, request=request, response=response
             )
+            if compiled.is_async or not self._is_final(response):
+                response = await ensure_awaitable(response, _warn=compiled.name)
 
             if not isinstance(response, (Response, Request)):
                 raise _InvalidOutput(
-                    f"Middleware {method.__qualname__} must return Response or Request, "
+                    f"Middleware {compiled.method.__qualname__} must return Response or Request, "
                     f"got {type(response)}"
                 )
             if isinstance(response, Request):
@@ -140,15 +147,15 @@ class DownloaderMiddlewareManager(MiddlewareManager):
     async def _process_exception(
         self, exception: Exception, request: Request | Response
     ) -> Response | Request:
-        for method in self.methods["process_exception"]:
-            assert method is not None
-            response = await ensure_awaitable(
-                self._handle_mw_method(method, request=request, exception=exception),
-                _warn=global_object_name(method),
+        for compiled in self._get_chain("process_exception"):
+            response = self._handle_mw_method(
+                compiled, request=request, exception=exception
             )
+            if compiled.is_async or not self._is_final(response):
+                response = await ensure_awaitable(response, _warn=compiled.name)
             if response is not None and not isinstance(response, (Response, Request)):
                 raise _InvalidOutput(
-                    f"Middleware {method.__qualname__} must return None, Response or "
+                    f"Middleware {compiled.method.__qualname__} must return None, Response or "
                     f"Request, got {type(response)}"
                 )
             if response:
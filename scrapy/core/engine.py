@@ -11,15 +11,15 @@ import asyncio
 import contextlib
 import logging
 import warnings
-from functools import partial
 from time import time
 from traceback import format_exc
 from typing import TYPE_CHECKING, Any
 
-from twisted.internet.defer import CancelledError, Deferred, inlineCallbacks
+from twisted.internet.defer import CancelledError, Deferred, fail
 from twisted.python.failure import Failure
 
 from scrapy import signals
+from scrapy.core.downloader import Downloader
 from scrapy.core.scheduler import BaseScheduler
 from scrapy.core.scraper import Scraper
 from scrapy.exceptions import (
@@ -41,18 +41,18 @@ from scrapy.utils.defer import (
     maybe_deferred_to_future,
 )
 from scrapy.utils.deprecate import argument_is_required
-from scrapy.utils.log import failure_to_exc_info, logformatter_adapter
+from scrapy.utils.log import logformatter_adapter
 from scrapy.utils.misc import build_from_crawler, load_object
 from scrapy.utils.python import global_object_name
 from scrapy.utils.reactor import CallLaterOnce
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Callable, Coroutine, Generator
+    from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
 
     from twisted.internet.task import LoopingCall
 
-    from scrapy.core.downloader import Downloader
     from scrapy.crawler import Crawler
+    from scrapy.extensions.stagetiming import StageTiming
     from scrapy.logformatter import LogFormatter
     from scrapy.settings import BaseSettings, Settings
     from scrapy.signalmanager import SignalManager
@@ -74,6 +74,8 @@ class _Slot:
         self.close_if_idle: bool = close_if_idle
         self.nextcall: CallLaterOnce[None] = nextcall
         self.scheduler: BaseScheduler = scheduler
+        # Requests got from the scheduler that could not be started yet.
+        self.unstarted: list[Request] = []
         self.heartbeat: AsyncioLoopingCall | LoopingCall = create_looping_call(
             nextcall.schedule
         )
@@ -101,6 +103,9 @@ class _Slot:
 
 class ExecutionEngine:
     _SLOT_HEARTBEAT_INTERVAL: float = 5.0
+    # Maximum number of requests to get from the scheduler at once when the
+    # downloader has no global concurrency limit.
+    _MAX_SCHEDULER_BATCH_SIZE: int = 100
 
     def __init__(
         self,
@@ -131,6 +136,8 @@ class ExecutionEngine:
         self._start_request_processing_awaitable: (
             asyncio.Future[None] | Deferred[None] | None
         ) = None
+        # Set by the StageTiming extension.
+        self._stage_timing: StageTiming | None = None
         downloader_cls: type[Downloader] = load_object(self.settings["DOWNLOADER"])
         try:
             self.scheduler_cls: type[BaseScheduler] = self._get_scheduler_class(
@@ -346,8 +353,17 @@ class ExecutionEngine:
             return
 
         while not self.needs_backout():
-            if not self._start_scheduled_request():
+            requests = self._next_scheduled_requests()
+            if not requests:
+                self.signals.send_catch_log(signals.scheduler_empty)
                 break
+            for i, request in enumerate(requests):
+                # Responses can reach the scraper while a batch is being
+                # started, e.g. from the HTTP cache
+                if i and self.needs_backout():
+                    self._slot.unstarted.extend(requests[i:])
+                    break
+                self._start_scheduled_request(request)
 
         if self.spider_is_idle() and self._slot.close_if_idle:
             self._spider_idle()
@@ -367,52 +383,66 @@ class ExecutionEngine:
             or self.scraper.slot.needs_backout()
         )
 
-    def _remove_request(self, _: Any, request: Request) -> None:
-        assert self._slot
-        self._slot.remove_request(request)
-
-    def _start_scheduled_request(self) -> bool:
+    def _next_scheduled_requests(self) -> list[Request]:
+        """Return as many requests from the scheduler as the downloader can
+        start right away, or an empty list if the scheduler returns none."""
         assert self._slot is not None  # typing
-        assert self.spider is not None  # typing
-
-        request = self._slot.scheduler.next_request()
-        if request is None:
-            self.signals.send_catch_log(signals.scheduler_empty)
-            return False
-
-        d: Deferred[Response | Request] = self._download(request)
-        d.addBoth(self._handle_downloader_output, request)
-        d.addErrback(
-            lambda f: logger.info(
+        if self._slot.unstarted:
+            unstarted, self._slot.unstarted = self._slot.unstarted, []
+            return unstarted
+        scheduler = self._slot.scheduler
+        # Schedulers that do not subclass BaseScheduler may lack next_requests
+        next_requests = getattr(scheduler, "next_requests", None)
+        if next_requests is None:
+            request = scheduler.next_request()
+            return [] if request is None else [request]
+        requests: list[Request] = next_requests(self._free_download_capacity())
+        return requests
+
+    def _free_download_capacity(self) -> int:
+        total_concurrency = getattr(self.downloader, "total_concurrency", 1)
+        if total_concurrency <= 0:
+            return self._MAX_SCHEDULER_BATCH_SIZE
+        return max(1, total_concurrency - len(self.downloader.active))
+
+    def _start_scheduled_request(self, request: Request) -> None:
+        if self._stage_timing is not None:
+            self._stage_timing.stop("scheduler", request)
+        download = self._start_download(request)
+        _schedule_coro(self._process_scheduled_request(request, download))
+
+    async def _process_scheduled_request(
+        self, request: Request, download: Awaitable[Response | Request]
+    ) -> None:
+        result: Response | Request | Failure
+        try:
+            result = await download
+        except Exception:
+            result = Failure()
+        try:
+            await self._handle_downloader_output(result, request)
+        except Exception:
+            logger.info(
                 "Error while handling downloader output",
-                exc_info=failure_to_exc_info(f),
-                extra={"spider": self.spider},
-            )
-        )
-
-        d2: Deferred[None] = d.addBoth(partial(self._remove_request, request=request))
-        d2.addErrback(
-            lambda f: logger.info(
-                "Error while removing request from slot",
-                exc_info=failure_to_exc_info(f),
+                exc_info=True,
                 extra={"spider": self.spider},
             )
-        )
+        # Removing the last request can close the slot
         slot = self._slot
-        d2.addBoth(lambda _: slot.nextcall.schedule())
-        d2.addErrback(
-            lambda f: logger.info(
-                "Error while scheduling new request",
-                exc_info=failure_to_exc_info(f),
+        assert slot is not None  # typing
+        try:
+            slot.remove_request(request)
+        except Exception:
+            logger.info(
+                "Error while removing request from slot",
+                exc_info=True,
                 extra={"spider": self.spider},
             )
-        )
-        return True
+        slot.nextcall.schedule()
 
-    @inlineCallbacks
-    def _handle_downloader_output(
+    async def _handle_downloader_output(
         self, result: Request | Response | Failure, request: Request
-    ) -> Generator[Deferred[Any], Any, None]:
+    ) -> None:
         if not isinstance(result, (Request, Response, Failure)):
             raise TypeError(
                 f"Incorrect type: expected Request, Response or Failure, got {type(result)}: {result!r}"
@@ -424,7 +454,7 @@ class ExecutionEngine:
             return
 
         try:
-            yield self.scraper.enqueue_scrape(result, request)
+            await self.scraper._enqueue_scrape(result, request)
         except Exception:
             assert self.spider is not None
             logger.error(
@@ -442,6 +472,8 @@ class ExecutionEngine:
             return False
         if self._start is not None:  # not all start requests are handled
             return False
+        if self._slot.unstarted:
+            return False
         return not self._slot.scheduler.has_pending_requests()
 
     def crawl(self, request: Request) -> None:
@@ -486,9 +518,7 @@ class ExecutionEngine:
             raise RuntimeError(f"No open spider to crawl: {request}")
         while True:
             try:
-                response_or_request = await maybe_deferred_to_future(
-                    self._download(request)
-                )
+                response_or_request = await self._start_download(request)
             finally:
                 assert self._slot is not None
                 self._slot.remove_request(request)
@@ -496,20 +526,38 @@ class ExecutionEngine:
                 return response_or_request
             request = response_or_request
 
-    @inlineCallbacks
-    def _download(
-        self, request: Request
-    ) -> Generator[Deferred[Any], Any, Response | Request]:
+    def _start_download(self, request: Request) -> Awaitable[Response | Request]:
+        """Start downloading *request* and return an awaitable for the result.
+
+        The request is counted as in progress by the engine and the downloader
+        before this returns, so that :meth:`needs_backout` accounts for it
+        right away.
+        """
+        assert self._slot is not None  # typing
+        self._slot.add_request(request)
+        fetch: Awaitable[Response | Request]
+        try:
+            fetch = self._start_fetch(request)
+        except Exception:
+            fetch = maybe_deferred_to_future(fail())
+        return self._download(request, fetch)
+
+    def _start_fetch(self, request: Request) -> Awaitable[Response | Request]:
+        if getattr(type(self.downloader), "fetch", None) is Downloader.fetch:
+            # Skip the Deferred that Downloader.fetch() wraps its coroutine in
+            return self.downloader._start_fetch(request)
+        if self._downloader_fetch_needs_spider:
+            return ensure_awaitable(self.downloader.fetch(request, self.spider))
+        return ensure_awaitable(self.downloader.fetch(request))
+
+    async def _download(
+        self, request: Request, fetch: Awaitable[Response | Request]
+    ) -> Response | Request:
         assert self._slot is not None  # typing
         assert self.spider is not None
 
-        self._slot.add_request(request)
         try:
-            result: Response | Request
-            if self._downloader_fetch_needs_spider:
-                result = yield self.downloader.fetch(request, self.spider)
-            else:
-                result = yield self.downloader.fetch(request)
+            result = await fetch
             if not isinstance(result, (Response, Request)):
                 raise TypeError(
                     f"Incorrect type: expected Response or Request, got {type(result)}: {result!r}"
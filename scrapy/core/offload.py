@@ -0,0 +1,420 @@
+"""
+Run spider callbacks outside of the event loop.
+
+See documentation in docs/topics/optimize.rst
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import os
+import pickle
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from twisted.internet.defer import Deferred
+
+from scrapy.http import Request
+from scrapy.spiders import Spider
+from scrapy.utils.asyncio import is_asyncio_available, run_in_thread
+from scrapy.utils.misc import arg_to_iter
+from scrapy.utils.request import request_from_dict
+
+if TYPE_CHECKING:
+    import concurrent.futures
+    from collections.abc import Callable, Iterable
+
+    from scrapy.crawler import Crawler
+    from scrapy.http import Response
+
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+_CallableT = TypeVar("_CallableT", bound="Callable[..., Any]")
+
+#: Valid values of :setting:`CALLBACK_EXECUTOR` and of the
+#: :reqmeta:`callback_executor` meta key.
+CALLBACK_EXECUTORS = (None, "process", "thread")
+
+# Response bodies of at least this size are sent to worker processes through
+# shared memory instead of being pickled into the pipe to the worker.
+_SHARED_MEMORY_MIN_SIZE = 64 * 1024
+
+# Spider attributes that are never sent to worker processes.
+_LOCAL_SPIDER_ATTRIBUTES = {"crawler", "settings"}
+
+
+def callback_executor(executor: str | None) -> Callable[[_CallableT], _CallableT]:
+    """Decorator that sets the :setting:`CALLBACK_EXECUTOR` of a spider
+    callback.
+
+    .. versionadded:: VERSION
+
+    The :reqmeta:`callback_executor` meta key of a request takes precedence.
+
+    .. code-block:: python
+
+        from scrapy import Spider
+        from scrapy.core.offload import callback_executor
+
+
+        class MySpider(Spider):
+            name = "example"
+
+            @callback_executor("thread")
+            def parse(self, response):
+                yield {"title": response.css("title::text").get()}
+    """
+    if executor not in CALLBACK_EXECUTORS:
+        raise ValueError(
+            f"Unknown callback executor {executor!r}, expected one of"
+            f" {CALLBACK_EXECUTORS!r}."
+        )
+
+    def decorator(func: _CallableT) -> _CallableT:
+        func._scrapy_callback_executor = executor  # type: ignore[attr-defined]
+        return func
+
+    return decorator
+
+
+def get_callback_executor(
+    request: Request, callback: Callable[..., Any], default: str | None
+) -> str | None:
+    """Return the executor that must run *callback* for *request*: the value
+    of the :reqmeta:`callback_executor` meta key, of the
+    :func:`callback_executor` decorator or *default*, in that order of
+    precedence.
+
+    Coroutine and asynchronous generator callbacks always run in the event
+    loop, unless the request or the callback ask otherwise explicitly, in
+    which case :exc:`ValueError` is raised.
+    """
+    if getattr(callback, "__func__", None) is Spider._parse:
+        # The default callback of requests without one, which calls parse()
+        callback = callback.__self__.parse  # type: ignore[attr-defined]
+    executor: str | None
+    if "callback_executor" in request.meta:
+        executor = request.meta["callback_executor"]
+    elif hasattr(callback, "_scrapy_callback_executor"):
+        executor = callback._scrapy_callback_executor
+    elif default is None or _is_async(callback):
+        return None
+    else:
+        executor = default
+    if executor not in CALLBACK_EXECUTORS:
+        raise ValueError(
+            f"Unknown callback executor {executor!r} for {request}, expected"
+            f" one of {CALLBACK_EXECUTORS!r}."
+        )
+    if executor is not None and _is_async(callback):
+        raise ValueError(
+            f"{callback!r} cannot run in the {executor!r} callback executor,"
+            f" only synchronous callbacks can."
+        )
+    return executor
+
+
+def _is_async(callback: Callable[..., Any]) -> bool:
+    return inspect.iscoroutinefunction(callback) or inspect.isasyncgenfunction(callback)
+
+
+class _RemoteTraceback(Exception):
+    """Cause of the exceptions raised by callbacks in worker processes,
+    holding the traceback from the worker."""
+
+    def __init__(self, tb: str):
+        super().__init__(tb)
+        self.tb: str = tb
+
+    def __str__(self) -> str:
+        return self.tb
+
+
+class _CallbackPool:
+    def __init__(self, crawler: Crawler):
+        self.crawler: Crawler = crawler
+        self._executor: concurrent.futures.Executor | None = None
+
+    async def close(self) -> None:
+        if self._executor is None:
+            return
+        executor, self._executor = self._executor, None
+        await run_in_thread(executor.shutdown, cancel_futures=True)
+
+
+class CallbackProcessPool(_CallbackPool):
+    """Runs spider callbacks in a pool of worker processes.
+
+    .. versionadded:: VERSION
+
+    The pool is started on the first call of :meth:`call`, with
+    :setting:`CALLBACK_PROCESS_POOL_SIZE` worker processes. Each worker
+    process gets a copy of the spider, with the spider attributes that can be
+    pickled at that point, except for ``crawler`` and ``settings``.
+    """
+
+    def __init__(self, crawler: Crawler):
+        super().__init__(crawler)
+        self.size: int = (
+            crawler.settings.getint("CALLBACK_PROCESS_POOL_SIZE") or os.cpu_count() or 1
+        )
+
+    def _start(self, spider: Spider) -> ProcessPoolExecutor:
+        state = {}
+        for key, value in vars(spider).items():
+            if key in _LOCAL_SPIDER_ATTRIBUTES:
+                continue
+            try:
+                pickle.dumps(value)
+            except Exception:
+                logger.debug(
+                    "Spider attribute %(key)s cannot be pickled, it will be"
+                    " missing in callback worker processes",
+                    {"key": key},
+                    extra={"spider": spider},
+                )
+                continue
+            state[key] = value
+        logger.info(
+            "Starting %(size)d worker processes for spider callbacks",
+            {"size": self.size},
+            extra={"spider": spider},
+        )
+        return ProcessPoolExecutor(
+            max_workers=self.size,
+            initializer=_init_worker,
+            initargs=(type(spider), state),
+        )
+
+    async def call(
+        self, callback: Callable[..., Any], response: Response
+    ) -> Iterable[Any]:
+        """Call *callback* with *response* in a worker process and return its
+        output.
+
+        Requests in the output are rebuilt with the callbacks of the spider in
+        this process. If the callback raises an exception after some output,
+        the returned iterable raises it once that output has been consumed.
+        """
+        spider = self.crawler.spider
+        assert spider is not None
+        if self._executor is None:
+            self._executor = self._start(spider)
+        assert response.request is not None
+        shm, data = _dump_response(response, spider)
+        try:
+            outputs, exception, tb = await _wait_for_future(
+                self._executor.submit(
+                    _run_callback, _get_callback_reference(callback, spider), data
+                )
+            )
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+        if exception is not None:
+            assert tb is not None
+            exception.__cause__ = _RemoteTraceback(tb)
+        self.crawler.stats.inc_value("callback_executor/process/count")
+        return _load_outputs(outputs, exception, spider)
+
+
+class CallbackThreadPool(_CallbackPool):
+    """Runs spider callbacks in a pool of threads.
+
+    .. versionadded:: VERSION
+
+    The pool is started on the first call of :meth:`call`, with
+    :setting:`CALLBACK_THREAD_POOL_SIZE` threads.
+    """
+
+    def __init__(self, crawler: Crawler):
+        super().__init__(crawler)
+        self.size: int = (
+            crawler.settings.getint("CALLBACK_THREAD_POOL_SIZE") or os.cpu_count() or 1
+        )
+
+    def _start(self, spider: Spider) -> ThreadPoolExecutor:
+        logger.info(
+            "Starting %(size)d threads for spider callbacks%(gil)s",
+            {"size": self.size, "gil": "" if _is_gil_enabled() else " (GIL disabled)"},
+            extra={"spider": spider},
+        )
+        return ThreadPoolExecutor(
+            max_workers=self.size, thread_name_prefix="scrapy-callback"
+        )
+
+    async def call(
+        self, callback: Callable[..., Any], response: Response
+    ) -> Iterable[Any]:
+        """Call *callback* with *response* in a thread and return its output.
+
+        If the callback raises an exception after some output, the returned
+        iterable raises it once that output has been consumed.
+        """
+        if self._executor is None:
+            assert self.crawler.spider is not None
+            self._executor = self._start(self.crawler.spider)
+        outputs, exception = await _wait_for_future(
+            self._executor.submit(_collect_outputs, callback, response)
+        )
+        self.crawler.stats.inc_value("callback_executor/thread/count")
+        return _iter_outputs(outputs, exception)
+
+
+def _is_gil_enabled() -> bool:
+    if sys.version_info >= (3, 13):
+        return sys._is_gil_enabled()
+    return True
+
+
+async def _wait_for_future(future: concurrent.futures.Future[_T]) -> _T:
+    if is_asyncio_available():
+        return await asyncio.wrap_future(future)
+
+    from twisted.internet import reactor
+
+    d: Deferred[_T] = Deferred()
+
+    def fire(future: concurrent.futures.Future[_T]) -> None:
+        exception = future.exception()
+        if exception is not None:
+            d.errback(exception)
+        else:
+            d.callback(future.result())
+
+    future.add_done_callback(lambda future: reactor.callFromThread(fire, future))
+    return await d
+
+
+def _get_callback_reference(
+    callback: Callable[..., Any], spider: Spider
+) -> str | Callable[..., Any]:
+    """Return the name of *callback* if it is a method of *spider*, so that the
+    worker process can get it from its own copy of the spider, or *callback*
+    itself otherwise."""
+    if inspect.ismethod(callback) and callback.__self__ is spider:
+        name = callback.__func__.__name__
+        if getattr(getattr(spider, name, None), "__func__", None) is callback.__func__:
+            return name
+    return callback
+
+
+def _dump_request(request: Request, spider: Spider) -> dict[str, Any]:
+    try:
+        return request.to_dict(spider=spider)
+    except ValueError:
+        # The callback or errback are not spider methods, they are not needed
+        # to call the callback
+        return request.replace(callback=None, errback=None).to_dict()
+
+
+def _dump_response(
+    response: Response, spider: Spider
+) -> tuple[shared_memory.SharedMemory | None, dict[str, Any]]:
+    assert response.request is not None
+    data: dict[str, Any] = {
+        key: getattr(response, key)
+        for key in response.attributes
+        if key not in {"body", "certificate", "request"}
+    }
+    data["_class"] = type(response)
+    data["request"] = _dump_request(response.request, spider)
+    body = response.body
+    if len(body) < _SHARED_MEMORY_MIN_SIZE:
+        data["body"] = body
+        return None, data
+    shm = shared_memory.SharedMemory(create=True, size=len(body))
+    assert shm.buf is not None
+    shm.buf[: len(body)] = body
+    data["_shared_body"] = (shm.name, len(body))
+    return shm, data
+
+
+def _load_outputs(
+    outputs: list[tuple[bool, Any]], exception: Exception | None, spider: Spider
+) -> Iterable[Any]:
+    yield from _iter_outputs(
+        [
+            request_from_dict(output, spider=spider) if is_request else output
+            for is_request, output in outputs
+        ],
+        exception,
+    )
+
+
+def _iter_outputs(outputs: list[Any], exception: Exception | None) -> Iterable[Any]:
+    yield from outputs
+    if exception is not None:
+        raise exception
+
+
+def _collect_outputs(
+    callback: Callable[..., Any], response: Response
+) -> tuple[list[Any], Exception | None]:
+    """Call *callback* with *response* and return its output as a list, and
+    the exception that stopped it, if any."""
+    assert response.request is not None
+    outputs: list[Any] = []
+    try:
+        for output in arg_to_iter(callback(response, **response.request.cb_kwargs)):
+            outputs.append(output)  # noqa: PERF402
+    except Exception as exception:
+        return outputs, exception
+    return outputs, None
+
+
+# Code that runs in worker processes
+
+_worker_spider: Spider | None = None
+
+
+def _init_worker(spidercls: type[Spider], state: dict[str, Any]) -> None:
+    global _worker_spider  # noqa: PLW0603
+    spider = spidercls.__new__(spidercls)
+    spider.__dict__.update(state)
+    _worker_spider = spider
+
+
+def _load_body(name: str, size: int) -> bytes:
+    # The process that created the shared memory block unlinks it. Before
+    # Python 3.13 attaching to it registers it again, but in the resource
+    # tracker that worker processes share with that process, so it is a no-op.
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        shm = shared_memory.SharedMemory(name=name)
+    assert shm.buf is not None
+    try:
+        return bytes(shm.buf[:size])
+    finally:
+        shm.close()
+
+
+def _run_callback(
+    callback: str | Callable[..., Any], data: dict[str, Any]
+) -> tuple[list[tuple[bool, Any]], Exception | None, str | None]:
+    spider = _worker_spider
+    assert spider is not None
+    if "_shared_body" in data:
+        data["body"] = _load_body(*data.pop("_shared_body"))
+    data["request"] = request_from_dict(data["request"], spider=spider)
+    response: Response = data.pop("_class")(**data)
+    func = getattr(spider, callback) if isinstance(callback, str) else callback
+    outputs, exception = _collect_outputs(func, response)
+    dumped_outputs = [
+        (True, output.to_dict(spider=spider))
+        if isinstance(output, Request)
+        else (False, output)
+        for output in outputs
+    ]
+    if exception is None:
+        return dumped_outputs, None, None
+    return dumped_outputs, exception, "".join(traceback.format_exception(exception))
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any, cast
 # working around https://github.com/sphinx-doc/sphinx/issues/10400
 from twisted.internet.defer import Deferred  # noqa: TC002
 
+from scrapy.pqueues import DownloaderAwarePriorityQueue
 from scrapy.spiders import Spider  # noqa: TC001
 from scrapy.utils.job import job_dir
 from scrapy.utils.misc import build_from_crawler, load_object
@@ -123,6 +124,30 @@ class BaseScheduler(metaclass=BaseSchedulerMeta):
         """
         raise NotImplementedError
 
+    def next_requests(self, count: int) -> list[Request]:
+        """
+        Return up to *count* :class:`~scrapy.Request` objects to be processed,
+        in the order in which :meth:`next_request` would return them.
+
+        The engine calls this method instead of :meth:`next_request`, if
+        defined, with the number of requests that the downloader can start
+        right away. Returning an empty list has the same meaning as returning
+        ``None`` from :meth:`next_request`.
+
+        The default implementation calls :meth:`next_request` until it returns
+        ``None`` or *count* requests have been returned. Schedulers can
+        override it to get requests from their queues in batches.
+
+        .. versionadded:: VERSION
+        """
+        requests: list[Request] = []
+        while len(requests) < count:
+            request = self.next_request()
+            if request is None:
+                break
+            requests.append(request)
+        return requests
+
 
 class Scheduler(BaseScheduler):
     r"""Default scheduler.
@@ -405,6 +430,36 @@ class Scheduler(BaseScheduler):
             self.stats.inc_value("scheduler/dequeued")
         return request
 
+    def next_requests(self, count: int) -> list[Request]:
+        """
+        Return up to *count* :class:`~scrapy.Request` objects, in the same
+        order as :meth:`next_request`.
+
+        Stats are incremented once for all the returned requests. If a
+        subclass overrides :meth:`next_request`, it is called for each
+        returned request instead.
+
+        With :class:`~scrapy.pqueues.DownloaderAwarePriorityQueue`, requests
+        are taken from download slots as if each returned request started
+        downloading before the next one is chosen (see
+        :meth:`~scrapy.pqueues.DownloaderAwarePriorityQueue.pop_many`).
+        """
+        if type(self).next_request is not Scheduler.next_request:
+            return super().next_requests(count)
+        requests = self._pop_requests(self.mqs, count)
+        memory = len(requests)
+        if memory < count and self.dqs is not None:
+            requests += self._pop_requests(self.dqs, count - memory)
+        disk = len(requests) - memory
+        assert self.stats is not None
+        if memory:
+            self.stats.inc_value("scheduler/dequeued/memory", memory)
+        if disk:
+            self.stats.inc_value("scheduler/dequeued/disk", disk)
+        if requests:
+            self.stats.inc_value("scheduler/dequeued", len(requests))
+        return requests
+
     def __len__(self) -> int:
         """
         Return the total amount of enqueued requests
@@ -438,6 +493,15 @@ class Scheduler(BaseScheduler):
     def _mqpush(self, request: Request) -> None:
         self.mqs.push(request)
 
+    @staticmethod
+    def _pop_requests(queue: ScrapyPriorityQueue, count: int) -> list[Request]:
+        if isinstance(queue, DownloaderAwarePriorityQueue):
+            return queue.pop_many(count)
+        requests: list[Request] = []
+        while len(requests) < count and (request := queue.pop()) is not None:
+            requests.append(request)
+        return requests
+
     def _dqpop(self) -> Request | None:
         if self.dqs is not None:
             return self.dqs.pop()
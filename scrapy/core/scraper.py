@@ -4,15 +4,24 @@ extracts information from them"""
 from __future__ import annotations
 
 import logging
+import types
 import warnings
+from asyncio import Future
 from collections import deque
 from collections.abc import AsyncIterator
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar
 
 from twisted.internet.defer import Deferred, inlineCallbacks
 from twisted.python.failure import Failure
 
 from scrapy import Spider, signals
+from scrapy.core.offload import (
+    CALLBACK_EXECUTORS,
+    CallbackProcessPool,
+    CallbackThreadPool,
+    get_callback_executor,
+)
 from scrapy.core.spidermw import SpiderMiddlewareManager
 from scrapy.exceptions import (
     CloseSpider,
@@ -20,10 +29,13 @@ from scrapy.exceptions import (
     IgnoreRequest,
     ScrapyDeprecationWarning,
 )
-from scrapy.http import Request, Response
-from scrapy.pipelines import ItemPipelineManager
+from scrapy.http import HtmlResponse, Request, Response, TextResponse, XmlResponse
+from scrapy.pipelines import ItemPipelineManager, _get_item_size
+from scrapy.utils.asyncgen import as_async_generator
 from scrapy.utils.asyncio import _parallel_asyncio, is_asyncio_available
 from scrapy.utils.defer import (
+    _create_waiter,
+    _fire_waiter,
     _process_pending_io,
     _schedule_coro,
     aiter_errback,
@@ -45,9 +57,10 @@ from scrapy.utils.python import global_object_name
 from scrapy.utils.spider import iterate_spider_output
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterable
+    from collections.abc import Callable, Coroutine, Generator, Iterable
 
     from scrapy.crawler import Crawler
+    from scrapy.extensions.stagetiming import StageTiming
     from scrapy.logformatter import LogFormatter
     from scrapy.signalmanager import SignalManager
 
@@ -56,34 +69,79 @@ logger = logging.getLogger(__name__)
 
 
 _T = TypeVar("_T")
-QueueTuple: TypeAlias = tuple[Response | Failure, Request, Deferred[None]]
+QueueTuple: TypeAlias = tuple[
+    Response | Failure, Request, Future[None] | Deferred[None]
+]
 
 
 class Slot:
     """Scraper slot (one per running spider)"""
 
     MIN_RESPONSE_SIZE = 1024
+    # Memory taken by a node of a parsed HTML or XML document, for each "<" in
+    # the response body, as measured with lxml.
+    TREE_NODE_SIZE = 200
 
-    def __init__(self, max_active_size: int = 5000000):
+    def __init__(self, max_active_size: int = 5000000, estimate_memory: bool = False):
         self.max_active_size: int = max_active_size
+        self.estimate_memory: bool = estimate_memory
         self.queue: deque[QueueTuple] = deque()
         self.active: set[Request] = set()
         self.active_size: int = 0
+        # Sizes added to active_size by the queued and active responses
+        self._response_sizes: dict[Request, int] = {}
         self.itemproc_size: int = 0
         self.closing: Deferred[Spider] | None = None
 
+    def response_size(self, result: Response | Failure) -> int:
+        """Return the size that *result* adds to :attr:`active_size`.
+
+        That is the size of the response body or, if :attr:`estimate_memory`
+        is ``True``, an estimate of the memory that the response takes once
+        its text is decoded and, for HTML and XML, parsed.
+        """
+        if not isinstance(result, Response):
+            return self.MIN_RESPONSE_SIZE
+        body = result.body
+        size = len(body)
+        if self.estimate_memory and isinstance(result, TextResponse):
+            # Decoded text takes a byte per character for ASCII, and up to
+            # 4 for other text; 2 is the usual case.
+            size += size if body.isascii() else 2 * size
+            if isinstance(result, (HtmlResponse, XmlResponse)):
+                size += len(body) + self.TREE_NODE_SIZE * body.count(b"<")
+        return max(size, self.MIN_RESPONSE_SIZE)
+
+    def item_size(self, item: Any) -> int:
+        """Return the size that *item* adds to :attr:`active_size` while it
+        goes through the item pipelines.
+
+        That is ``0`` unless :attr:`estimate_memory` is ``True``, in which case
+        it is an estimate of the memory that the item and its field values
+        take.
+        """
+        if not self.estimate_memory:
+            return 0
+        return _get_item_size(item)
+
     def add_response_request(
         self, result: Response | Failure, request: Request
     ) -> Deferred[None]:
         # this Deferred will be awaited in enqueue_scrape()
         deferred: Deferred[None] = Deferred()
-        self.queue.append((result, request, deferred))
-        if isinstance(result, Response):
-            self.active_size += max(len(result.body), self.MIN_RESPONSE_SIZE)
-        else:
-            self.active_size += self.MIN_RESPONSE_SIZE
+        self._add_response_request(result, request, deferred)
         return deferred
 
+    def _add_response_request(
+        self,
+        result: Response | Failure,
+        request: Request,
+        waiter: Future[None] | Deferred[None],
+    ) -> None:
+        self.queue.append((result, request, waiter))
+        size = self._response_sizes[request] = self.response_size(result)
+        self.active_size += size
+
     def next_response_request_deferred(self) -> QueueTuple:
         result, request, deferred = self.queue.popleft()
         self.active.add(request)
@@ -91,10 +149,8 @@ class Slot:
 
     def finish_response(self, result: Response | Failure, request: Request) -> None:
         self.active.remove(request)
-        if isinstance(result, Response):
-            self.active_size -= max(len(result.body), self.MIN_RESPONSE_SIZE)
-        else:
-            self.active_size -= self.MIN_RESPONSE_SIZE
+        size = self._response_sizes.pop(request, None)
+        self.active_size -= self.response_size(result) if size is None else size
 
     def is_idle(self) -> bool:
         return not (self.queue or self.active or self.itemproc_size)
@@ -103,6 +159,132 @@ class Slot:
         return self.active_size > self.max_active_size
 
 
+class _OutputTimer:
+    """Measures the processing of the output of a callback."""
+
+    def __init__(self, concurrency: int):
+        #: Value of :setting:`CONCURRENT_ITEMS` used to process the output.
+        self.concurrency: int = concurrency
+        self.outputs: int = 0
+        #: Time spent processing outputs, adding up concurrent processing.
+        self.busy: float = 0.0
+        #: Part of :attr:`busy` during which the processing of outputs was
+        #: running, as opposed to waiting, e.g. for a database.
+        self.running: float = 0.0
+        self._start: float = perf_counter()
+        self.elapsed: float = 0.0
+
+    def wrap(
+        self, func: Callable[[Any, Response | Failure], Coroutine[Any, Any, None]]
+    ) -> Callable[[Any, Response | Failure], Coroutine[Any, Any, None]]:
+        """Return a version of *func* that measures its calls."""
+
+        async def process(output: Any, response: Response | Failure) -> None:
+            start = perf_counter()
+            try:
+                await self._run(func(output, response))
+            finally:
+                self._add_output(start)
+
+        return process
+
+    def wrap_deferred(
+        self, func: Callable[[Any, Response | Failure], Deferred[None]]
+    ) -> Callable[[Any, Response | Failure], Deferred[None]]:
+        """Return a version of *func* that measures its calls.
+
+        Only the synchronous part of each call counts as running.
+        """
+
+        def process(output: Any, response: Response | Failure) -> Deferred[None]:
+            start = perf_counter()
+            try:
+                dfd = func(output, response)
+            except Exception:
+                self._add_output(start)
+                raise
+            finally:
+                self.running += perf_counter() - start
+
+            def done(result: Any) -> Any:
+                self._add_output(start)
+                return result
+
+            return dfd.addBoth(done)
+
+        return process
+
+    def _add_output(self, start: float) -> None:
+        self.busy += perf_counter() - start
+        self.outputs += 1
+
+    @types.coroutine
+    def _run(self, coro: Coroutine[Any, Any, None]) -> Generator[Any, Any, None]:
+        # Run the coroutine step by step, timing each step, and pass what it
+        # awaits to the event loop or Deferred that drives it.
+        send: Callable[[Any], Any] = coro.send
+        value: Any = None
+        while True:
+            start = perf_counter()
+            try:
+                awaited = send(value)
+            except StopIteration:
+                return
+            finally:
+                self.running += perf_counter() - start
+            try:
+                value = yield awaited
+            except GeneratorExit:
+                coro.close()
+                raise
+            except BaseException as exc:
+                send, value = coro.throw, exc
+            else:
+                send = coro.send
+
+    def stop(self) -> None:
+        self.elapsed = perf_counter() - self._start
+
+
+class _AdaptiveConcurrentItems:
+    """Adjusts :setting:`CONCURRENT_ITEMS` to the parallelism that
+    processing the output of callbacks reaches.
+
+    See :setting:`CONCURRENT_ITEMS_ADAPTIVE`.
+    """
+
+    def __init__(self, crawler: Crawler, start: int, maximum: int):
+        self.crawler: Crawler = crawler
+        self.value: int = max(1, min(start, maximum))
+        self.maximum: int = maximum
+
+    def update(self, timer: _OutputTimer) -> int:
+        """Update the item concurrency with the measures of *timer* and
+        return the new value."""
+        used = timer.concurrency
+        if used != self.value or timer.outputs < 2 or timer.elapsed <= 0:
+            # Outdated or insufficient measures.
+            return self.value
+        value = used
+        if timer.running >= 0.9 * timer.busy:
+            # Outputs were processed with hardly any waiting, e.g. by
+            # synchronous item pipelines, so processing them concurrently
+            # only adds overhead.
+            value = max(used // 2, 1)
+        elif timer.outputs > used and timer.busy >= 0.75 * used * timer.elapsed:
+            # All slots were busy waiting, more could have been.
+            value = min(used * 2, self.maximum)
+        if value != self.value:
+            logger.debug(
+                "Changing CONCURRENT_ITEMS from %(old)d to %(new)d",
+                {"old": self.value, "new": value},
+                extra={"crawler": self.crawler},
+            )
+            self.value = value
+            self.crawler.stats.set_value("scraper/concurrent_items", value)
+        return value
+
+
 class Scraper:
     def __init__(self, crawler: Crawler) -> None:
         self.slot: Slot | None = None
@@ -122,9 +304,27 @@ class Scraper:
             self._check_deprecated_itemproc_method(method)
 
         self.concurrent_items: int = crawler.settings.getint("CONCURRENT_ITEMS")
+        self._adaptive_items: _AdaptiveConcurrentItems | None = None
+        if crawler.settings.getbool("CONCURRENT_ITEMS_ADAPTIVE"):
+            self._adaptive_items = _AdaptiveConcurrentItems(
+                crawler,
+                self.concurrent_items,
+                crawler.settings.getint("CONCURRENT_ITEMS_MAX"),
+            )
+            self.concurrent_items = self._adaptive_items.value
+        self._callback_executor: str | None = crawler.settings.get("CALLBACK_EXECUTOR")
+        if self._callback_executor not in CALLBACK_EXECUTORS:
+            raise ValueError(
+                f"Invalid CALLBACK_EXECUTOR value {self._callback_executor!r},"
+                f" expected one of {CALLBACK_EXECUTORS!r}."
+            )
+        self.process_pool: CallbackProcessPool = CallbackProcessPool(crawler)
+        self.thread_pool: CallbackThreadPool = CallbackThreadPool(crawler)
         self.crawler: Crawler = crawler
         self.signals: SignalManager = crawler.signals
         self.logformatter: LogFormatter = crawler.logformatter
+        # Set by the StageTiming extension.
+        self._stage_timing: StageTiming | None = None
 
     def _check_deprecated_itemproc_method(self, method: str) -> None:
         itemproc_cls = type(self.itemproc)
@@ -168,11 +368,18 @@ class Scraper:
 
         .. versionadded:: 2.14
         """
-        self.slot = Slot(self.crawler.settings.getint("SCRAPER_SLOT_MAX_ACTIVE_SIZE"))
+        self.slot = Slot(
+            self.crawler.settings.getint("SCRAPER_SLOT_MAX_ACTIVE_SIZE"),
+            self.crawler.settings.getbool("SCRAPER_SLOT_ESTIMATE_MEMORY"),
+        )
         if not self.crawler.spider:
             raise RuntimeError(
                 "Scraper.open_spider() called before Crawler.spider is set."
             )
+        if self._adaptive_items is not None:
+            self.crawler.stats.set_value(
+                "scraper/concurrent_items", self._adaptive_items.value
+            )
         if self._itemproc_has_async["open_spider"]:
             await self.itemproc.open_spider_async()
         else:
@@ -198,6 +405,8 @@ class Scraper:
         self.slot.closing = Deferred()
         self._check_if_closing()
         await maybe_deferred_to_future(self.slot.closing)
+        await self.process_pool.close()
+        await self.thread_pool.close()
         if self._itemproc_has_async["close_spider"]:
             await self.itemproc.close_spider_async()
         else:
@@ -238,11 +447,37 @@ class Scraper:
             self._check_if_closing()
             self._scrape_next()
 
+    async def _enqueue_scrape(
+        self, result: Response | Failure, request: Request
+    ) -> None:
+        """Coroutine version of :meth:`enqueue_scrape` that does not wrap its
+        waiting into Deferreds if asyncio is available."""
+        if self.slot is None:
+            raise RuntimeError("Scraper slot not assigned")
+        waiter: Future[None] | Deferred[None] = _create_waiter()
+        self.slot._add_response_request(result, request, waiter)
+        self._scrape_next()
+        try:
+            await waiter  # fired in _wait_for_processing()
+        except Exception:
+            logger.error(
+                "Scraper bug processing %(request)s",
+                {"request": request},
+                exc_info=True,
+                extra={"spider": self.crawler.spider},
+            )
+        finally:
+            self.slot.finish_response(result, request)
+            self._check_if_closing()
+            self._scrape_next()
+
     def _scrape_next(self) -> None:
         assert self.slot is not None  # typing
         while self.slot.queue:
-            result, request, queue_dfd = self.slot.next_response_request_deferred()
-            _schedule_coro(self._wait_for_processing(result, request, queue_dfd))
+            result, request, waiter = self.slot.next_response_request_deferred()
+            if self._stage_timing is not None:
+                self._stage_timing.start("scraper_queue", request)
+            _schedule_coro(self._wait_for_processing(result, request, waiter))
 
     async def _scrape(self, result: Response | Failure, request: Request) -> None:
         """Handle the downloaded response or failure through the spider callback/errback."""
@@ -251,12 +486,17 @@ class Scraper:
                 f"Incorrect type: expected Response or Failure, got {type(result)}: {result!r}"
             )
 
+        call_spider = (
+            self.call_spider_async
+            if self._stage_timing is None
+            else self._call_spider_timed
+        )
         output: Iterable[Any] | AsyncIterator[Any]
         if isinstance(result, Response):
             try:
                 # call the spider middlewares and the request callback with the response
                 output = await self.spidermw.scrape_response_async(
-                    self.call_spider_async, result, request
+                    call_spider, result, request
                 )
             except Exception:
                 self.handle_spider_error(Failure(), request, result)
@@ -266,7 +506,7 @@ class Scraper:
 
         try:
             # call the request errback with the downloader error
-            output = await self.call_spider_async(result, request)
+            output = await call_spider(result, request)
         except Exception as spider_exc:
             # the errback didn't silence the exception
             assert self.crawler.spider
@@ -286,14 +526,19 @@ class Scraper:
             await self.handle_spider_output_async(output, request, result)
 
     async def _wait_for_processing(
-        self, result: Response | Failure, request: Request, queue_dfd: Deferred[None]
+        self,
+        result: Response | Failure,
+        request: Request,
+        waiter: Future[None] | Deferred[None],
     ) -> None:
+        if self._stage_timing is not None:
+            self._stage_timing.stop("scraper_queue", request)
         try:
             await self._scrape(result, request)
-        except Exception:
-            queue_dfd.errback(Failure())
+        except Exception as exception:
+            _fire_waiter(waiter, exception=exception)
         else:
-            queue_dfd.callback(None)  # awaited in enqueue_scrape()
+            _fire_waiter(waiter)  # awaited in enqueue_scrape()
 
     def call_spider(
         self, result: Response | Failure, request: Request, spider: Spider | None = None
@@ -320,6 +565,13 @@ class Scraper:
             assert result.request
             callback = result.request.callback or self.crawler.spider._parse
             warn_on_generator_with_return_value(self.crawler.spider, callback)
+            executor = get_callback_executor(
+                result.request, callback, self._callback_executor
+            )
+            if executor == "process":
+                return await self.process_pool.call(callback, result)
+            if executor == "thread":
+                return await self.thread_pool.call(callback, result)
             output = callback(result, **result.request.cb_kwargs)
             if isinstance(output, Deferred):
                 warnings.warn(
@@ -348,6 +600,34 @@ class Scraper:
                 )
         return await ensure_awaitable(iterate_spider_output(output))
 
+    async def _call_spider_timed(
+        self, result: Response | Failure, request: Request
+    ) -> AsyncIterator[Any]:
+        """Call :meth:`call_spider_async` and record, as the ``callback``
+        stage, the time spent in it and in the iteration of its output."""
+        start = perf_counter()
+        output = await self.call_spider_async(result, request)
+        return self._iter_timed(output, perf_counter() - start)
+
+    async def _iter_timed(
+        self, output: Iterable[Any] | AsyncIterator[Any], elapsed: float
+    ) -> AsyncIterator[Any]:
+        assert self._stage_timing is not None
+        if not isinstance(output, AsyncIterator):
+            output = as_async_generator(output)
+        try:
+            while True:
+                start = perf_counter()
+                try:
+                    value = await anext(output)
+                except StopAsyncIteration:
+                    break
+                finally:
+                    elapsed += perf_counter() - start
+                yield value
+        finally:
+            self._stage_timing.record("callback", elapsed)
+
     def handle_spider_error(
         self,
         _failure: Failure,
@@ -406,35 +686,52 @@ class Scraper:
 
         .. versionadded:: 2.13
         """
+        adaptive_items = self._adaptive_items
+        if adaptive_items is None:
+            await self._process_outputs(
+                result,
+                request,
+                response,
+                self._process_spidermw_output_async,
+                self._process_spidermw_output,
+            )
+            return
+        timer = _OutputTimer(self.concurrent_items)
+        await self._process_outputs(
+            result,
+            request,
+            response,
+            timer.wrap(self._process_spidermw_output_async),
+            timer.wrap_deferred(self._process_spidermw_output),
+        )
+        timer.stop()
+        self.concurrent_items = adaptive_items.update(timer)
+
+    async def _process_outputs(
+        self,
+        result: Iterable[_T] | AsyncIterator[_T],
+        request: Request,
+        response: Response | Failure,
+        process: Callable[[Any, Response | Failure], Coroutine[Any, Any, None]],
+        process_dfd: Callable[[Any, Response | Failure], Deferred[None]],
+    ) -> None:
         it: Iterable[_T] | AsyncIterator[_T]
         if is_asyncio_available():
             if isinstance(result, AsyncIterator):
                 it = aiter_errback(result, self.handle_spider_error, request, response)
             else:
                 it = iter_errback(result, self.handle_spider_error, request, response)
-            await _parallel_asyncio(
-                it, self.concurrent_items, self._process_spidermw_output_async, response
-            )
+            await _parallel_asyncio(it, self.concurrent_items, process, response)
             return
         if isinstance(result, AsyncIterator):
             it = aiter_errback(result, self.handle_spider_error, request, response)
             await maybe_deferred_to_future(
-                parallel_async(
-                    it,
-                    self.concurrent_items,
-                    self._process_spidermw_output,
-                    response,
-                )
+                parallel_async(it, self.concurrent_items, process_dfd, response)
             )
             return
         it = iter_errback(result, self.handle_spider_error, request, response)
         await maybe_deferred_to_future(
-            parallel(
-                it,
-                self.concurrent_items,
-                self._process_spidermw_output,
-                response,
-            )
+            parallel(it, self.concurrent_items, process_dfd, response)
         )
 
     def _process_spidermw_output(
@@ -506,6 +803,8 @@ class Scraper:
         assert self.slot is not None  # typing
         assert self.crawler.spider is not None  # typing
         self.slot.itemproc_size += 1
+        item_size = self.slot.item_size(item)
+        self.slot.active_size += item_size
         try:
             if self._itemproc_has_async["process_item"]:
                 output = await self.itemproc.process_item_async(item)
@@ -556,3 +855,4 @@ class Scraper:
             )
         finally:
             self.slot.itemproc_size -= 1
+            self.slot.active_size -= item_size
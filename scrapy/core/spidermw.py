@@ -78,16 +78,15 @@ class SpiderMiddlewareManager(MiddlewareManager):
         response: Response,
         request: Request,
     ) -> Iterable[_T] | AsyncIterator[_T]:
-        for method in self.methods["process_spider_input"]:
-            assert method is not None
+        for compiled in self._get_chain("process_spider_input"):
             try:
-                if method in self._mw_methods_requiring_spider:
-                    result = method(response=response, spider=self._spider)
+                if compiled.requires_spider:
+                    result = compiled.method(response=response, spider=self._spider)
                 else:
-                    result = method(response=response)
+                    result = compiled.method(response=response)
                 if result is not None:
                     msg = (
-                        f"{global_object_name(method)} must return None "
+                        f"{compiled.name} must return None "
                         f"or raise an exception, got {type(result)}"
                     )
                     raise _InvalidOutput(msg)
@@ -44,6 +44,7 @@ from scrapy.utils.reactorless import (
     install_reactor_import_hook,
     uninstall_reactor_import_hook,
 )
+from scrapy.utils.url import _set_url_cache_size
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Generator, Iterable
@@ -170,6 +171,8 @@ class Crawler:
             self,
         )
 
+        _set_url_cache_size(self.settings.getint("URL_CACHE_SIZE"))
+
         use_reactor = self.settings.getbool("TWISTED_REACTOR_ENABLED")
         if use_reactor:
             # We either install a reactor or expect one to be installed.
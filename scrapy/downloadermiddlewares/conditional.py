@@ -0,0 +1,204 @@
+"""
+Conditional request middleware
+
+See documentation in docs/topics/downloader-middleware.rst
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+from scrapy import signals
+from scrapy.exceptions import IgnoreRequest, NotConfigured
+from scrapy.utils.misc import load_object
+from scrapy.utils.project import data_path
+from scrapy.utils.python import to_unicode
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    # typing.Self requires Python 3.11
+    from typing_extensions import Self
+
+    from scrapy.crawler import Crawler
+    from scrapy.http import Request, Response
+    from scrapy.settings import BaseSettings
+    from scrapy.spiders import Spider
+    from scrapy.statscollectors import StatsCollector
+    from scrapy.utils.request import RequestFingerprinterProtocol
+
+
+logger = logging.getLogger(__name__)
+
+
+class DbmValidatorStorage:
+    """Validator storage that keeps the validators of each request, by request
+    fingerprint, in a DBM database per spider."""
+
+    def __init__(self, settings: BaseSettings):
+        self.dir: str = data_path(settings["CONDITIONAL_REQUESTS_DIR"], createdir=True)
+        self.dbmodule: ModuleType = import_module(
+            settings["CONDITIONAL_REQUESTS_DBM_MODULE"]
+        )
+        self.db: Any = None  # the real type is private
+
+    def open_spider(self, spider: Spider) -> None:
+        dbpath = Path(self.dir, f"{spider.name}.db")
+        self.db = self.dbmodule.open(str(dbpath), "c")
+
+        logger.debug(
+            "Using DBM validator storage in %(dbpath)s",
+            {"dbpath": dbpath},
+            extra={"spider": spider},
+        )
+
+        self._fingerprinter: RequestFingerprinterProtocol = (
+            spider.crawler.request_fingerprinter
+        )
+
+    def close_spider(self, spider: Spider) -> None:
+        self.db.close()
+
+    def retrieve_validators(
+        self, spider: Spider, request: Request
+    ) -> dict[str, Any] | None:
+        key = self._fingerprinter.fingerprint(request).hex()
+        if key not in self.db:
+            return None
+        return cast("dict[str, Any]", json.loads(self.db[key]))
+
+    def store_validators(
+        self, spider: Spider, request: Request, validators: dict[str, Any]
+    ) -> None:
+        key = self._fingerprinter.fingerprint(request).hex()
+        self.db[key] = json.dumps(validators)
+
+
+class ConditionalRequestMiddleware:
+    """Make conditional requests for pages downloaded in previous crawls.
+
+    .. versionadded:: VERSION
+
+    For every successful response to a ``GET`` request, this middleware
+    stores the ``ETag`` and ``Last-Modified`` headers of the response and a
+    hash of its body in the storage set in
+    :setting:`CONDITIONAL_REQUESTS_STORAGE`, which by default persists them
+    across crawls. Response bodies are not stored.
+
+    When the same request is sent again, the middleware adds the
+    ``If-None-Match`` and ``If-Modified-Since`` headers for the stored
+    validators, so that servers can reply with a ``304 Not Modified``
+    response with no body. Responses with the same body hash as the stored one
+    are also considered unchanged, which covers servers that do not support
+    conditional requests.
+
+    If :setting:`CONDITIONAL_REQUESTS_SKIP_UNCHANGED` is ``True``, unchanged
+    responses are dropped with :exc:`~scrapy.exceptions.IgnoreRequest`, so
+    their callback is not called. Otherwise, they get an ``"unchanged"`` flag.
+
+    Requests with the :reqmeta:`dont_revalidate` meta key set to ``True`` and
+    responses from
+    :class:`~scrapy.downloadermiddlewares.httpcache.HttpCacheMiddleware` are
+    ignored.
+    """
+
+    def __init__(self, crawler: Crawler):
+        settings = crawler.settings
+        if not settings.getbool("CONDITIONAL_REQUESTS_ENABLED"):
+            raise NotConfigured
+        self.crawler: Crawler = crawler
+        self.stats: StatsCollector = crawler.stats
+        self.storage = load_object(settings["CONDITIONAL_REQUESTS_STORAGE"])(settings)
+        self.skip_unchanged: bool = settings.getbool(
+            "CONDITIONAL_REQUESTS_SKIP_UNCHANGED"
+        )
+        crawler.signals.connect(self.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(self.spider_closed, signal=signals.spider_closed)
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler) -> Self:
+        return cls(crawler)
+
+    def spider_opened(self, spider: Spider) -> None:
+        self.storage.open_spider(spider)
+
+    def spider_closed(self, spider: Spider) -> None:
+        self.storage.close_spider(spider)
+
+    @staticmethod
+    def _should_revalidate(request: Request) -> bool:
+        return request.method == "GET" and not request.meta.get("dont_revalidate")
+
+    @staticmethod
+    def _remove_validators(request: Request) -> None:
+        # Requests can come back with the validators of another URL, e.g.
+        # redirect requests, which copy the meta and headers of the original
+        # request
+        request.meta.pop("_conditional_validators", None)
+        for name in request.meta.pop("_conditional_headers", ()):
+            request.headers.pop(name, None)
+
+    def process_request(self, request: Request) -> None:
+        self._remove_validators(request)
+        if not self._should_revalidate(request):
+            return
+        validators = self.storage.retrieve_validators(self.crawler.spider, request)
+        if validators is None:
+            return
+        request.meta["_conditional_validators"] = validators
+        added: list[bytes] = []
+        if validators.get("etag") and b"If-None-Match" not in request.headers:
+            request.headers[b"If-None-Match"] = validators["etag"]
+            added.append(b"If-None-Match")
+        if (
+            validators.get("last_modified")
+            and b"If-Modified-Since" not in request.headers
+        ):
+            request.headers[b"If-Modified-Since"] = validators["last_modified"]
+            added.append(b"If-Modified-Since")
+        if added:
+            request.meta["_conditional_headers"] = added
+            self.stats.inc_value("conditional/revalidate")
+
+    def process_response(
+        self, request: Request, response: Response
+    ) -> Request | Response:
+        validators: dict[str, Any] | None = request.meta.pop(
+            "_conditional_validators", None
+        )
+        if not self._should_revalidate(request) or "cached" in response.flags:
+            return response
+        if response.status == 304:
+            if validators is None:
+                return response
+            return self._unchanged(response)
+        if not 200 <= response.status < 300:
+            return response
+
+        new_validators = {
+            "etag": self._get_header(response, b"ETag"),
+            "last_modified": self._get_header(response, b"Last-Modified"),
+            "hash": hashlib.sha1(response.body).hexdigest(),  # noqa: S324
+        }
+        self.storage.store_validators(self.crawler.spider, request, new_validators)
+        self.stats.inc_value("conditional/store")
+        if validators is not None and validators.get("hash") == new_validators["hash"]:
+            return self._unchanged(response)
+        return response
+
+    @staticmethod
+    def _get_header(response: Response, name: bytes) -> str | None:
+        value = response.headers.get(name)
+        return None if value is None else to_unicode(value, errors="replace")
+
+    def _unchanged(self, response: Response) -> Response:
+        self.stats.inc_value("conditional/unchanged")
+        if self.skip_unchanged:
+            raise IgnoreRequest(f"Ignored unchanged response: {response}")
+        response.flags.append("unchanged")
+        return response
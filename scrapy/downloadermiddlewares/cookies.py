@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
+import pickle
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import monotonic
 from typing import TYPE_CHECKING, Any
 
 from tldextract import TLDExtract
 
+from scrapy import signals
 from scrapy.exceptions import NotConfigured
 from scrapy.http import Response
 from scrapy.http.cookies import CookieJar
 from scrapy.utils.decorators import _warn_spider_arg
 from scrapy.utils.httpobj import urlparse_cached
+from scrapy.utils.misc import load_object
 from scrapy.utils.python import to_unicode
 from scrapy.utils.request import _decode_cookie, _to_verbose_cookies
 
@@ -24,6 +30,7 @@ if TYPE_CHECKING:
     from scrapy import Request, Spider
     from scrapy.crawler import Crawler
     from scrapy.http.request import VerboseCookie
+    from scrapy.statscollectors import StatsCollector
 
 
 logger = logging.getLogger(__name__)
@@ -38,23 +45,154 @@ def _is_public_domain(domain: str) -> bool:
     return not parts.domain
 
 
+def _cookie_expiration(cookie: Cookie) -> float:
+    return cookie.expires if cookie.expires is not None else float("inf")
+
+
 class CookiesMiddleware:
     """This middleware enables working with sites that need cookies"""
 
     crawler: Crawler
 
-    def __init__(self, debug: bool = False):
-        self.jars: defaultdict[Any, CookieJar] = defaultdict(CookieJar)
+    def __init__(
+        self,
+        debug: bool = False,
+        jar_class: type[CookieJar] = CookieJar,
+        *,
+        max_jars: int = 0,
+        jar_ttl: float = 0,
+        jars_dir: str | None = None,
+        max_cookies_per_jar: int = 0,
+        max_cookies: int = 0,
+    ):
+        self.jars: defaultdict[Any, CookieJar] = defaultdict(jar_class)
         self.debug: bool = debug
+        self.stats: StatsCollector | None = None
+        self.max_jars: int = max_jars
+        self.jar_ttl: float = jar_ttl
+        self.max_cookies_per_jar: int = max_cookies_per_jar
+        self.max_cookies: int = max_cookies
+        self._limited: bool = bool(
+            max_jars or jar_ttl or max_cookies_per_jar or max_cookies
+        )
+        # Jar keys in least recently used order, with the time of their last
+        # use, and the number of cookies of each jar if max_cookies is set.
+        self._jar_usage: OrderedDict[Any, float] = OrderedDict()
+        self._cookie_counts: dict[Any, int] = {}
+        self._total_cookies: int = 0
+        self._jars_dir: TemporaryDirectory[str] | None = (
+            TemporaryDirectory(prefix="cookiejars-", dir=jars_dir) if jars_dir else None
+        )
+        self._spilled_jars: dict[Any, Path] = {}
+        self._spilled_count: int = 0
 
     @classmethod
     def from_crawler(cls, crawler: Crawler) -> Self:
         if not crawler.settings.getbool("COOKIES_ENABLED"):
             raise NotConfigured
-        o = cls(crawler.settings.getbool("COOKIES_DEBUG"))
+        settings = crawler.settings
+        o = cls(
+            settings.getbool("COOKIES_DEBUG"),
+            jar_class=load_object(settings["COOKIES_JAR_CLASS"]),
+            max_jars=settings.getint("COOKIES_JARS_MAX"),
+            jar_ttl=settings.getfloat("COOKIES_JARS_TTL"),
+            jars_dir=settings.get("COOKIES_JARS_DIR"),
+            max_cookies_per_jar=settings.getint("COOKIES_PER_JAR_MAX"),
+            max_cookies=settings.getint("COOKIES_MAX"),
+        )
         o.crawler = crawler
+        o.stats = crawler.stats
+        crawler.signals.connect(o.spider_closed, signal=signals.spider_closed)
         return o
 
+    def spider_closed(self) -> None:
+        if self._jars_dir is not None:
+            self._jars_dir.cleanup()
+            self._spilled_jars.clear()
+
+    def _get_jar(self, key: Any) -> CookieJar:
+        if key not in self.jars:
+            spilled_path = self._spilled_jars.pop(key, None)
+            if spilled_path is not None:
+                self.jars[key] = pickle.loads(spilled_path.read_bytes())  # noqa: S301
+                spilled_path.unlink()
+                if self.max_cookies:
+                    self._set_cookie_count(key, len(self.jars[key]))
+                self._inc_stat("cookies/jars_restored")
+            jar = self.jars[key]
+            self._set_stat("cookies/jars", len(self.jars))
+        else:
+            jar = self.jars[key]
+        if self._limited:
+            now = monotonic()
+            self._jar_usage[key] = now
+            self._jar_usage.move_to_end(key)
+            self._evict_jars(now, keep=key)
+        return jar
+
+    def _evict_jars(self, now: float, keep: Any) -> None:
+        """Evict the least recently used jars other than *keep* while there
+        are more jars or cookies than allowed, or they have not been used in
+        :attr:`jar_ttl` seconds."""
+        while self._jar_usage:
+            key, last_used = next(iter(self._jar_usage.items()))
+            if key == keep:
+                break
+            if not (
+                (self.max_jars and len(self.jars) > self.max_jars)
+                or (self.jar_ttl and now - last_used > self.jar_ttl)
+                or (self.max_cookies and self._total_cookies > self.max_cookies)
+            ):
+                break
+            self._evict_jar(key)
+
+    def _evict_jar(self, key: Any) -> None:
+        del self._jar_usage[key]
+        self._total_cookies -= self._cookie_counts.pop(key, 0)
+        jar = self.jars.pop(key, None)
+        if jar is None:
+            return
+        if self._jars_dir is not None:
+            self._spilled_count += 1
+            path = Path(self._jars_dir.name, f"{self._spilled_count}.pickle")
+            path.write_bytes(pickle.dumps(jar, protocol=pickle.HIGHEST_PROTOCOL))
+            self._spilled_jars[key] = path
+        self._inc_stat("cookies/jars_evicted")
+        self._set_stat("cookies/jars", len(self.jars))
+
+    def _limit_cookies(self, key: Any, jar: CookieJar) -> None:
+        """Drop cookies of *jar* beyond the per-jar and global limits: expired
+        cookies first, then those that expire the soonest, session cookies
+        last."""
+        if not (self.max_cookies_per_jar or self.max_cookies):
+            return
+        max_cookies = min(
+            limit for limit in (self.max_cookies_per_jar, self.max_cookies) if limit
+        )
+        count = len(jar)
+        if count > max_cookies:
+            jar.jar.clear_expired_cookies()
+            cookies = sorted(jar, key=_cookie_expiration)
+            for cookie in cookies[: len(cookies) - max_cookies]:
+                jar.clear(cookie.domain, cookie.path, cookie.name)
+            self._inc_stat("cookies/dropped", count - len(jar))
+            count = len(jar)
+        if self.max_cookies:
+            self._set_cookie_count(key, count)
+            self._evict_jars(monotonic(), keep=key)
+
+    def _set_cookie_count(self, key: Any, count: int) -> None:
+        self._total_cookies += count - self._cookie_counts.get(key, 0)
+        self._cookie_counts[key] = count
+
+    def _inc_stat(self, key: str, count: int = 1) -> None:
+        if self.stats is not None:
+            self.stats.inc_value(key, count)
+
+    def _set_stat(self, key: str, value: int) -> None:
+        if self.stats is not None:
+            self.stats.set_value(key, value)
+
     def _process_cookies(
         self, cookies: Iterable[Cookie], *, jar: CookieJar, request: Request
     ) -> None:
@@ -81,9 +219,11 @@ class CookiesMiddleware:
             return None
 
         cookiejarkey = request.meta.get("cookiejar")
-        jar = self.jars[cookiejarkey]
+        jar = self._get_jar(cookiejarkey)
         cookies = self._get_request_cookies(jar, request)
         self._process_cookies(cookies, jar=jar, request=request)
+        if cookies and self._limited:
+            self._limit_cookies(cookiejarkey, jar)
 
         # set Cookie header
         request.headers.pop("Cookie", None)
@@ -100,9 +240,11 @@ class CookiesMiddleware:
 
         # extract cookies from Set-Cookie and drop invalid/expired cookies
         cookiejarkey = request.meta.get("cookiejar")
-        jar = self.jars[cookiejarkey]
+        jar = self._get_jar(cookiejarkey)
         cookies = jar.make_cookies(response, request)
         self._process_cookies(cookies, jar=jar, request=request)
+        if cookies and self._limited:
+            self._limit_cookies(cookiejarkey, jar)
 
         self._debug_set_cookie(response)
 
@@ -8,8 +8,11 @@ from scrapy import Request, Spider, signals
 from scrapy.exceptions import IgnoreRequest
 from scrapy.utils.decorators import _warn_spider_arg
 from scrapy.utils.httpobj import urlparse_cached
+from scrapy.utils.url import _is_from_domains
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     # typing.Self requires Python 3.11
     from typing_extensions import Self
 
@@ -52,12 +55,14 @@ class OffsiteMiddleware:
     """
 
     crawler: Crawler
-    host_regex: re.Pattern[str]
 
     def __init__(self, stats: StatsCollector):
         self.stats = stats
         self.domains_seen: set[str] = set()
-        self._allowed_domains: list[str] | None = None
+        self._allowed_domains: Collection[str] | None = None
+        # Allowed domains, or None to allow all domains.
+        self._domains: frozenset[str] | None = None
+        self._host_regex: re.Pattern[str] | None = None
 
     @classmethod
     def from_crawler(cls, crawler: Crawler) -> Self:
@@ -70,11 +75,40 @@ class OffsiteMiddleware:
     def spider_opened(self, spider: Spider) -> None:
         self._update_host_regex(spider)
 
+    @property
+    def host_regex(self) -> re.Pattern[str]:
+        if self._host_regex is not None:
+            return self._host_regex
+        assert self.crawler.spider
+        return self.get_host_regex(self.crawler.spider)
+
+    @host_regex.setter
+    def host_regex(self, value: re.Pattern[str]) -> None:
+        self._host_regex = value
+
     def _update_host_regex(self, spider: Spider) -> None:
-        allowed_domains = list(getattr(spider, "allowed_domains", None) or [])
-        if allowed_domains != self._allowed_domains:
+        allowed_domains = getattr(spider, "allowed_domains", None) or []
+        if allowed_domains is self._allowed_domains:
+            return
+        if not isinstance(allowed_domains, (list, tuple, frozenset)):
+            allowed_domains = list(allowed_domains)
+        if allowed_domains == self._allowed_domains:
+            return
+        # Mutable values are copied to notice later changes, immutable ones are
+        # kept to skip comparing them on every request.
+        if isinstance(allowed_domains, list):
+            self._allowed_domains = allowed_domains.copy()
+        else:
             self._allowed_domains = allowed_domains
-            self.host_regex = self.get_host_regex(spider)
+        if type(self).get_host_regex is not OffsiteMiddleware.get_host_regex:
+            # A subclass defines its own regular expression.
+            self._host_regex = self.get_host_regex(spider)
+            return
+        # Compiling a regular expression for many domains is slow, so domains
+        # are looked up by host name suffix instead.
+        self._host_regex = None
+        domains = [domain for domain in allowed_domains if domain is not None]
+        self._domains = frozenset(domains) if allowed_domains else None
 
     def request_scheduled(self, request: Request, spider: Spider) -> None:
         self.process_request(request)
@@ -119,10 +153,11 @@ class OffsiteMiddleware:
                     return urlparse_cached(request).hostname in spider.allowed_domains
         """
         self._update_host_regex(spider)
-        regex = self.host_regex
         # hostname can be None for wrong urls (like javascript links)
         host = urlparse_cached(request).hostname or ""
-        return bool(regex.search(host))
+        if self._host_regex is not None:
+            return bool(self._host_regex.search(host))
+        return self._domains is None or _is_from_domains(host, self._domains)
 
     def get_host_regex(self, spider: Spider) -> re.Pattern[str]:
         allowed_domains = getattr(spider, "allowed_domains", None)
@@ -0,0 +1,259 @@
+"""
+Proxy pool middleware
+
+See documentation in docs/topics/downloader-middleware.rst
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse, urlunparse
+from urllib.request import _parse_proxy  # type: ignore[attr-defined]
+from weakref import WeakSet
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+from scrapy.utils.httpobj import urlparse_cached
+from scrapy.utils.url import add_http_if_no_scheme
+
+if TYPE_CHECKING:
+    # typing.Self requires Python 3.11
+    from typing_extensions import Self
+
+    from scrapy import Request
+    from scrapy.crawler import Crawler
+    from scrapy.http import Response
+    from scrapy.statscollectors import StatsCollector
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class ProxyState:
+    """Health data of a proxy of :class:`ProxyPoolMiddleware`."""
+
+    url: str
+    slot: str
+
+    active: WeakSet[Request] = field(default_factory=WeakSet, repr=False)
+    requests: int = 0
+    errors: int = 0
+    bans: int = 0
+    #: Consecutive failures (errors and bans), reset by a successful response.
+    failures: int = 0
+    #: Exponential moving average of the download latency, in seconds.
+    latency: float | None = None
+    cooldown_until: float = 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """Ratio of requests that ended in an error or a ban."""
+        if not self.requests:
+            return 0.0
+        return (self.errors + self.bans) / self.requests
+
+    def available(self, now: float) -> bool:
+        return self.cooldown_until <= now
+
+
+class ProxyPoolMiddleware:
+    """Send requests through a pool of proxies.
+
+    .. versionadded:: VERSION
+
+    Each request gets the least busy available proxy from
+    :setting:`PROXY_POOL_PROXIES` in its :reqmeta:`proxy` meta key, which
+    :class:`~scrapy.downloadermiddlewares.httpproxy.HttpProxyMiddleware` then
+    handles as usual. Requests that already have a :reqmeta:`proxy` meta key
+    set by other code are left untouched.
+
+    Requests are also assigned a :reqmeta:`download_slot` per proxy and target
+    host, or per proxy if :setting:`PROXY_POOL_SLOT_PER_HOST` is ``False``, so
+    that :setting:`CONCURRENT_REQUESTS_PER_DOMAIN`, :setting:`DOWNLOAD_DELAY`
+    and :setting:`PROXY_POOL_CONCURRENCY` apply to each proxy separately.
+
+    Responses with a status code in :setting:`PROXY_POOL_BAN_HTTP_CODES` count
+    as bans and download exceptions count as errors. After a failure, the
+    proxy is not used during a cooldown period that starts at
+    :setting:`PROXY_POOL_COOLDOWN` seconds and doubles with every consecutive
+    failure up to :setting:`PROXY_POOL_MAX_COOLDOWN`. A proxy that reaches
+    :setting:`PROXY_POOL_MAX_FAILURES` consecutive failures is removed from
+    the pool, unless it is the last one.
+
+    Requests retried by
+    :class:`~scrapy.downloadermiddlewares.retry.RetryMiddleware` get a new
+    proxy, so to retry banned requests through a different proxy add the ban
+    codes to :setting:`RETRY_HTTP_CODES`.
+    """
+
+    def __init__(self, crawler: Crawler):
+        settings = crawler.settings
+        if not settings.getbool("PROXY_POOL_ENABLED"):
+            raise NotConfigured
+        proxies = settings.getlist("PROXY_POOL_PROXIES")
+        if not proxies:
+            raise NotConfigured("PROXY_POOL_PROXIES is empty.")
+        self.crawler: Crawler = crawler
+        self.stats: StatsCollector = crawler.stats
+        self.proxies: dict[str, ProxyState] = {
+            url: ProxyState(url, self._get_slot(url)) for url in proxies
+        }
+        self._ban_codes: set[int] = {
+            int(code) for code in settings.getlist("PROXY_POOL_BAN_HTTP_CODES")
+        }
+        self._cooldown: float = settings.getfloat("PROXY_POOL_COOLDOWN")
+        self._max_cooldown: float = settings.getfloat("PROXY_POOL_MAX_COOLDOWN")
+        self._max_failures: int = settings.getint("PROXY_POOL_MAX_FAILURES")
+        self._concurrency: int = settings.getint("PROXY_POOL_CONCURRENCY")
+        self._slot_per_host: bool = settings.getbool("PROXY_POOL_SLOT_PER_HOST")
+        if self._concurrency:
+            crawler.signals.connect(
+                self.request_reached_downloader,
+                signal=signals.request_reached_downloader,
+            )
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler) -> Self:
+        return cls(crawler)
+
+    @staticmethod
+    def _get_slot(proxy_url: str) -> str:
+        # Credentials must not end up in slot keys, which are logged
+        parsed = urlparse(add_http_if_no_scheme(proxy_url))
+        host = parsed.hostname or ""
+        return f"{host}:{parsed.port}" if parsed.port else host
+
+    @staticmethod
+    def _strip_credentials(proxy_url: str) -> str:
+        # HttpProxyMiddleware moves proxy credentials from the proxy meta key
+        # into the Proxy-Authorization header
+        proxy_type, _, _, hostport = _parse_proxy(proxy_url)
+        url: str = urlunparse((proxy_type or "", hostport, "", "", "", ""))
+        return url
+
+    def _select_proxy(self) -> ProxyState:
+        now = monotonic()
+        available = [p for p in self.proxies.values() if p.available(now)]
+        if not available:
+            # Never send requests without a proxy, use the proxy that gets
+            # out of its cooldown first instead
+            return min(self.proxies.values(), key=lambda p: p.cooldown_until)
+        return min(
+            available, key=lambda p: (len(p.active), p.failures, p.latency or 0.0)
+        )
+
+    def _get_assigned_proxy(self, request: Request) -> ProxyState | None:
+        if (url := request.meta.get("_proxy_pool")) is None:
+            return None
+        return self.proxies.get(url)
+
+    def process_request(self, request: Request) -> None:
+        assigned_url = request.meta.get("_proxy_pool")
+        if "proxy" in request.meta and (
+            assigned_url is None
+            or request.meta["proxy"]
+            not in {assigned_url, self._strip_credentials(assigned_url)}
+        ):
+            return
+        if assigned_url is not None:
+            # Retried or redirected request, it may use a different proxy
+            if (previous := self.proxies.get(assigned_url)) is not None:
+                previous.active.discard(request)
+        elif "download_slot" in request.meta:
+            # The slot was chosen by other code, only assign a proxy
+            self._assign_proxy(request)
+            return
+
+        proxy = self._assign_proxy(request)
+        request.meta["download_slot"] = self._get_request_slot(proxy, request)
+
+    def _get_request_slot(self, proxy: ProxyState, request: Request) -> str:
+        if self._slot_per_host:
+            return f"{proxy.slot}/{urlparse_cached(request).hostname or ''}"
+        return proxy.slot
+
+    def request_reached_downloader(self, request: Request) -> None:
+        """Apply :setting:`PROXY_POOL_CONCURRENCY` to new download slots of
+        the pool."""
+        proxy = self._get_assigned_proxy(request)
+        if proxy is None:
+            return
+        key = request.meta.get("download_slot")
+        if key != self._get_request_slot(proxy, request):
+            return
+        downloader = self.crawler.engine.downloader
+        slot = downloader.slots.get(key)
+        if slot is None or "concurrency" in downloader.per_slot_settings.get(key, {}):
+            return
+        # Set the concurrency of new slots. The downloader may lower it later,
+        # e.g. with HTTP2_STREAM_CONCURRENCY_ENABLED, but not raise it.
+        if not slot.lastseen or slot.concurrency > self._concurrency:
+            slot.concurrency = self._concurrency
+
+    def _assign_proxy(self, request: Request) -> ProxyState:
+        proxy = self._select_proxy()
+        proxy.active.add(request)
+        proxy.requests += 1
+        request.meta["proxy"] = proxy.url
+        request.meta["_proxy_pool"] = proxy.url
+        self.stats.inc_value("proxy_pool/requests")
+        return proxy
+
+    def process_response(self, request: Request, response: Response) -> Response:
+        proxy = self._get_assigned_proxy(request)
+        if proxy is None:
+            return response
+        proxy.active.discard(request)
+        if response.status in self._ban_codes:
+            proxy.bans += 1
+            self.stats.inc_value("proxy_pool/bans")
+            self._record_failure(proxy)
+            return response
+        proxy.failures = 0
+        latency = request.meta.get("download_latency")
+        if latency is not None:
+            proxy.latency = (
+                latency
+                if proxy.latency is None
+                else 0.7 * proxy.latency + 0.3 * latency
+            )
+        return response
+
+    def process_exception(self, request: Request, exception: Exception) -> None:
+        proxy = self._get_assigned_proxy(request)
+        if proxy is None:
+            return
+        proxy.active.discard(request)
+        proxy.errors += 1
+        self.stats.inc_value("proxy_pool/errors")
+        self._record_failure(proxy)
+
+    def _record_failure(self, proxy: ProxyState) -> None:
+        proxy.failures += 1
+        if (
+            self._max_failures
+            and proxy.failures >= self._max_failures
+            and len(self.proxies) > 1
+        ):
+            del self.proxies[proxy.url]
+            self.stats.inc_value("proxy_pool/evicted")
+            logger.warning(
+                "Removed proxy %(proxy)s from the pool after %(failures)d "
+                "consecutive failures",
+                {"proxy": proxy.slot, "failures": proxy.failures},
+                extra={"spider": self.crawler.spider},
+            )
+            return
+        cooldown = min(self._cooldown * 2 ** (proxy.failures - 1), self._max_cooldown)
+        if cooldown > 0:
+            proxy.cooldown_until = monotonic() + cooldown
+            self.stats.inc_value("proxy_pool/cooldowns")
+            logger.debug(
+                "Proxy %(proxy)s cooling down for %(cooldown).2fs",
+                {"proxy": proxy.slot, "cooldown": cooldown},
+                extra={"spider": self.crawler.spider},
+            )
@@ -6,21 +6,30 @@ enable this middleware and enable the ROBOTSTXT_OBEY setting.
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import logging
-from typing import TYPE_CHECKING
+from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING, Any
 
 from twisted.internet.defer import Deferred
 
 from scrapy import signals
 from scrapy.exceptions import IgnoreRequest, NotConfigured
+from scrapy.extensions.httpcache import parse_cachecontrol
 from scrapy.http import Request, Response
 from scrapy.http.request import NO_CALLBACK
 from scrapy.utils.decorators import _warn_spider_arg
-from scrapy.utils.defer import maybe_deferred_to_future
+from scrapy.utils.defer import _create_waiter, _fire_waiter
 from scrapy.utils.httpobj import urlparse_cached
+from scrapy.utils.job import job_dir
 from scrapy.utils.misc import build_from_crawler, load_object
 
 if TYPE_CHECKING:
+    from asyncio import Future
+    from urllib.parse import ParseResult
+
     # typing.Self requires Python 3.11
     from typing_extensions import Self
 
@@ -33,6 +42,94 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class _RobotsTxtCache:
+    """Cache of robots.txt bodies stored in a directory, one gzip-compressed
+    file per network location.
+
+    robots.txt bodies are stored rather than parsers because parsers come
+    from :setting:`ROBOTSTXT_PARSER` and may not be serializable.
+
+    The same instance is used by all crawlers of the process that use the same
+    directory (see :func:`_get_robotstxt_cache`), so that a robots.txt file
+    that a crawler is downloading is not downloaded again by another crawler.
+    """
+
+    def __init__(self, path: Path):
+        self.path: Path = path
+        path.mkdir(parents=True, exist_ok=True)
+        self._downloading: dict[str, list[Future[Any] | Deferred[Any]]] = {}
+
+    def _get_file(self, netloc: str) -> Path:
+        return self.path / hashlib.sha1(netloc.encode()).hexdigest()  # noqa: S324
+
+    def _load(self, netloc: str) -> bytes | None:
+        file = self._get_file(netloc)
+        try:
+            data = gzip.decompress(file.read_bytes())
+            expires, _, body = data.partition(b"\n")
+            expired = float(expires) <= time()
+        except (OSError, EOFError, ValueError):
+            return None
+        if expired:
+            file.unlink(missing_ok=True)
+            return None
+        return body
+
+    async def get(self, netloc: str) -> bytes | None:
+        """Return the cached robots.txt body of *netloc*, waiting for it if
+        another crawler is downloading it.
+
+        If ``None`` is returned, the caller must download robots.txt and then
+        call :meth:`set`, with ``None`` as body if it could not be cached.
+        """
+        while True:
+            body = self._load(netloc)
+            if body is not None:
+                return body
+            waiters = self._downloading.get(netloc)
+            if waiters is None:
+                self._downloading[netloc] = []
+                return None
+            waiter = _create_waiter()
+            waiters.append(waiter)
+            await waiter
+
+    def set(self, netloc: str, body: bytes | None, expires: float = 0) -> None:
+        """Store *body* as the robots.txt body of *netloc* until the *expires*
+        timestamp, and wake up crawlers waiting for it."""
+        if body is not None:
+            file = self._get_file(netloc)
+            tmp_file = file.with_suffix(".tmp")
+            try:
+                tmp_file.write_bytes(gzip.compress(f"{expires}\n".encode() + body))
+                tmp_file.replace(file)
+            except OSError as e:
+                logger.warning(
+                    "Could not store robots.txt of %(netloc)s in %(file)s: %(e)s",
+                    {"netloc": netloc, "file": file, "e": e},
+                )
+        for waiter in self._downloading.pop(netloc, ()):
+            _fire_waiter(waiter)
+
+
+_robotstxt_caches: dict[str, _RobotsTxtCache] = {}
+
+
+def _get_robotstxt_cache(path: str | Path) -> _RobotsTxtCache:
+    """Return the robots.txt cache of *path*, shared by all crawlers of the
+    process."""
+    key = str(Path(path).resolve())
+    cache = _robotstxt_caches.get(key)
+    if cache is None:
+        cache = _robotstxt_caches[key] = _RobotsTxtCache(Path(key))
+    return cache
+
+
+def _pass_to_waiter(result: Any, waiter: Future[Any] | Deferred[Any]) -> Any:
+    _fire_waiter(waiter, result)
+    return result
+
+
 class RobotsTxtMiddleware:
     DOWNLOAD_PRIORITY: int = 1000
 
@@ -51,6 +148,17 @@ class RobotsTxtMiddleware:
         # check if parser dependencies are met, this should throw an error otherwise.
         build_from_crawler(self._parserimpl, self.crawler, b"")
 
+        self._cache_expiration: int = crawler.settings.getint(
+            "ROBOTSTXT_CACHE_EXPIRATION"
+        )
+        self._cache: _RobotsTxtCache | None = None
+        if self._cache_expiration > 0:
+            cache_dir: str | Path | None = crawler.settings["ROBOTSTXT_CACHE_DIR"]
+            if not cache_dir and (jobdir := job_dir(crawler.settings)):
+                cache_dir = Path(jobdir, "robotstxt")
+            if cache_dir:
+                self._cache = _get_robotstxt_cache(cache_dir)
+
     @classmethod
     def from_crawler(cls, crawler: Crawler) -> Self:
         return cls(crawler)
@@ -89,38 +197,99 @@ class RobotsTxtMiddleware:
 
         if netloc not in self._parsers:
             self._parsers[netloc] = Deferred()
-            robotsurl = f"{url.scheme}://{url.netloc}/robots.txt"
-            robotsreq = Request(
-                robotsurl,
-                priority=self.DOWNLOAD_PRIORITY,
-                meta={"dont_obey_robotstxt": True},
-                callback=NO_CALLBACK,
-            )
-            try:
-                resp = await self.crawler.engine.download_async(robotsreq)
-                await self._parse_robots(resp, netloc, request)
-            except Exception as e:
-                if not isinstance(e, IgnoreRequest):
+            body = None
+            if self._cache is not None:
+                body = await self._cache.get(netloc)
+            if body is not None:
+                self._stats.inc_value("robotstxt/cache/hit")
+                try:
+                    await self._build_parser(body, netloc, request)
+                except Exception as e:
                     logger.error(
-                        "Error downloading %(request)s: %(f_exception)s",
-                        {"request": request, "f_exception": e},
+                        "Error parsing cached robots.txt of %(netloc)s: %(f_exception)s",
+                        {"netloc": netloc, "f_exception": e},
                         exc_info=True,
                         extra={"spider": self.crawler.spider},
                     )
-                self._robots_error(e, netloc)
-            self._stats.inc_value("robotstxt/request_count")
+                    self._robots_error(e, netloc)
+            else:
+                await self._download_robots(url, request)
 
         parser = self._parsers[netloc]
         if isinstance(parser, Deferred):
-            return await maybe_deferred_to_future(parser)
+            # Awaiting the Deferred directly would consume its result, leaving
+            # None to other requests waiting for the same parser.
+            waiter: Future[RobotParser | None] | Deferred[RobotParser | None] = (
+                _create_waiter()
+            )
+            parser.addCallback(_pass_to_waiter, waiter)
+            return await waiter
         return parser
 
+    async def _download_robots(self, url: ParseResult, request: Request) -> None:
+        netloc = url.netloc
+        robotsurl = f"{url.scheme}://{url.netloc}/robots.txt"
+        robotsreq = Request(
+            robotsurl,
+            priority=self.DOWNLOAD_PRIORITY,
+            meta={"dont_obey_robotstxt": True},
+            callback=NO_CALLBACK,
+        )
+        parsed_response: Response | None = None
+        try:
+            resp = await self.crawler.engine.download_async(robotsreq)
+            await self._parse_robots(resp, netloc, request)
+            parsed_response = resp
+        except Exception as e:
+            if not isinstance(e, IgnoreRequest):
+                logger.error(
+                    "Error downloading %(request)s: %(f_exception)s",
+                    {"request": request, "f_exception": e},
+                    exc_info=True,
+                    extra={"spider": self.crawler.spider},
+                )
+            self._robots_error(e, netloc)
+        finally:
+            if self._cache is not None:
+                self._cache_robots(netloc, parsed_response)
+        self._stats.inc_value("robotstxt/request_count")
+
+    def _cache_robots(self, netloc: str, response: Response | None) -> None:
+        assert self._cache is not None
+        expires = None if response is None else self._get_expiration(response)
+        if response is None or expires is None:
+            self._cache.set(netloc, None)
+            return
+        self._cache.set(netloc, response.body, expires)
+        self._stats.inc_value("robotstxt/cache/store")
+
+    def _get_expiration(self, response: Response) -> float | None:
+        """Return the timestamp until which *response* may be cached, or
+        ``None`` if it must not be cached."""
+        if response.status >= 500:
+            return None
+        cc = parse_cachecontrol(response.headers.get(b"Cache-Control") or b"")
+        if b"no-store" in cc or b"no-cache" in cc:
+            return None
+        max_age = cc.get(b"max-age")
+        if max_age is not None:
+            try:
+                seconds = int(max_age)
+            except ValueError:
+                pass
+            else:
+                return time() + seconds if seconds > 0 else None
+        return time() + self._cache_expiration
+
     async def _parse_robots(
         self, response: Response, netloc: str, request: Request
     ) -> None:
         self._stats.inc_value("robotstxt/response_count")
         self._stats.inc_value(f"robotstxt/response_status_count/{response.status}")
-        rp = build_from_crawler(self._parserimpl, self.crawler, response.body)
+        await self._build_parser(response.body, netloc, request)
+
+    async def _build_parser(self, body: bytes, netloc: str, request: Request) -> None:
+        rp = build_from_crawler(self._parserimpl, self.crawler, body)
         await self.crawler.signals.send_catch_log_async(
             signal=signals.robots_parsed,
             robotparser=rp,
@@ -9,6 +9,7 @@ from time import monotonic
 from typing import TYPE_CHECKING, Any
 
 from scrapy import Spider, signals
+from scrapy.utils.url import _get_url_cache_lookups
 
 if TYPE_CHECKING:
     # typing.Self requires Python 3.11
@@ -23,6 +24,7 @@ class CoreStats:
         self.stats: StatsCollector = stats
         self.start_time: datetime | None = None
         self._start_time_mono: float | None = None
+        self._url_cache_lookups: tuple[int, int] = (0, 0)
 
     @classmethod
     def from_crawler(cls, crawler: Crawler) -> Self:
@@ -38,6 +40,7 @@ class CoreStats:
         self.start_time = datetime.now(tz=timezone.utc)
         self._start_time_mono = monotonic()
         self.stats.set_value("start_time", self.start_time)
+        self._url_cache_lookups = _get_url_cache_lookups()
 
     def spider_closed(self, spider: Spider, reason: str) -> None:
         assert self.start_time is not None
@@ -47,6 +50,21 @@ class CoreStats:
         self.stats.set_value("elapsed_time_seconds", elapsed_time_seconds)
         self.stats.set_value("finish_time", finish_time)
         self.stats.set_value("finish_reason", reason)
+        self._set_url_cache_stats()
+
+    def _set_url_cache_stats(self) -> None:
+        # URL caches are shared by all crawlers of the process, and so are
+        # their lookup counts: these stats include lookups of other crawlers
+        # running while the spider was open.
+        hits, misses = _get_url_cache_lookups()
+        hits -= self._url_cache_lookups[0]
+        misses -= self._url_cache_lookups[1]
+        if not hits + misses:
+            return
+        ratio = round(hits / (hits + misses), 4)
+        self.stats.set_value("url_cache/process_hits", hits)
+        self.stats.set_value("url_cache/process_misses", misses)
+        self.stats.set_value("url_cache/process_hit_ratio", ratio)
 
     def item_scraped(self, item: Any, spider: Spider) -> None:
         self.stats.inc_value("item_scraped_count")
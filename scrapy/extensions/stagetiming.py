@@ -0,0 +1,210 @@
+"""Extension for measuring how long requests, responses and items spend in each
+stage of their processing.
+
+See documentation in docs/topics/extensions.rst
+"""
+
+from __future__ import annotations
+
+from math import ceil, log
+from time import perf_counter
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+from scrapy import Request, signals
+from scrapy.exceptions import NotConfigured
+from scrapy.middleware import MiddlewareManager
+from scrapy.utils.asyncio import AsyncioLoopingCall, create_looping_call
+
+if TYPE_CHECKING:
+    from twisted.internet.task import LoopingCall
+
+    # typing.Self requires Python 3.11
+    from typing_extensions import Self
+
+    from scrapy.crawler import Crawler
+    from scrapy.statscollectors import StatsCollector
+
+
+#: Percentiles stored in stats for each stage.
+PERCENTILES = (50, 95, 99)
+
+
+class _Histogram:
+    """Histogram of durations, in seconds, with logarithmic buckets.
+
+    Each bucket is :attr:`GROWTH` times wider than the previous one, so
+    percentiles have a relative error below 5% while memory usage only depends
+    on the range of durations, not on their number.
+    """
+
+    GROWTH = 1.05
+    #: Upper bound of the first bucket, which holds all shorter durations.
+    MIN = 1e-6
+    _LOG_GROWTH = log(GROWTH)
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.buckets: dict[int, int] = {}
+
+    def add(self, value: float) -> None:
+        if value <= self.MIN:
+            index = 0
+        else:
+            index = ceil(log(value / self.MIN) / self._LOG_GROWTH)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+
+    def percentile(self, percent: float) -> float:
+        """Return the upper bound of the bucket holding the *percent*
+        percentile, or ``0.0`` if the histogram is empty."""
+        rank = max(1, ceil(self.count * percent / 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return self.MIN * self.GROWTH**index
+        return 0.0
+
+
+class StageTiming:
+    """Measure the time spent in each stage of the crawl.
+
+    The following stages are measured:
+
+    -   ``scheduler``: time between the scheduling of a request and its
+        dequeuing from the :ref:`scheduler <topics-scheduler>`.
+
+    -   ``downloader_slot``: time that a request waits in the queue of its
+        downloader slot, e.g. due to :setting:`DOWNLOAD_DELAY` or concurrency
+        limits.
+
+    -   ``download``: time that the :ref:`download handler
+        <topics-download-handlers>` takes to download a response.
+
+    -   ``downloader_middleware/<method>``: time spent in each
+        ``process_request``, ``process_response`` and ``process_exception``
+        method of :ref:`downloader middlewares
+        <topics-downloader-middleware>`.
+
+    -   ``scraper_queue``: time that a response waits before it is sent to
+        :ref:`spider middlewares <topics-spider-middleware>`.
+
+    -   ``spider_middleware/<method>``: time spent in each
+        ``process_spider_input`` method of spider middlewares.
+
+    -   ``callback``: time spent in the spider callback or errback of each
+        response, including the iteration of its output.
+
+    -   ``item_pipeline/<method>``: time spent in the ``process_item`` method
+        of each :ref:`item pipeline <topics-item-pipeline>`. For pipelines
+        that :ref:`process items in batches <item-pipeline-batches>`, this
+        includes the time that items wait for their batch.
+
+    For each stage, the ``stage_timing/<stage>/count`` stat holds the number
+    of measurements, and ``stage_timing/<stage>/p50``,
+    ``stage_timing/<stage>/p95`` and ``stage_timing/<stage>/p99`` hold
+    percentiles of the measured durations, in seconds. Percentile stats are
+    updated every :setting:`LOGSTATS_INTERVAL` seconds and when the spider
+    closes, so that
+    :class:`~scrapy.extensions.periodic_log.PeriodicLog` can log them, e.g.
+    with ``PERIODIC_LOG_STATS = {"include": ["stage_timing/"]}``.
+
+    Async methods are measured until they return. For synchronous methods
+    that return a :class:`~twisted.internet.defer.Deferred`, only the
+    synchronous part is measured.
+
+    This extension is disabled by default, enable it with the
+    :setting:`STAGE_TIMING_ENABLED` setting.
+    """
+
+    def __init__(self, crawler: Crawler):
+        if not crawler.settings.getbool("STAGE_TIMING_ENABLED"):
+            raise NotConfigured
+        self.crawler: Crawler = crawler
+        self.stats: StatsCollector = crawler.stats
+        self.interval: float = crawler.settings.getfloat("LOGSTATS_INTERVAL")
+        self.per_slot: bool = crawler.settings.getbool("STAGE_TIMING_PER_SLOT")
+        self.histograms: dict[str, _Histogram] = {}
+        self._starts: dict[str, WeakKeyDictionary[Request, float]] = {}
+        self.task: AsyncioLoopingCall | LoopingCall | None = None
+        crawler.signals.connect(self.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(self.spider_closed, signal=signals.spider_closed)
+        crawler.signals.connect(
+            self.request_scheduled, signal=signals.request_scheduled
+        )
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler) -> Self:
+        return cls(crawler)
+
+    def spider_opened(self) -> None:
+        engine = self.crawler.engine
+        engine._stage_timing = self
+        engine.downloader._stage_timing = self
+        engine.scraper._stage_timing = self
+        for manager, stage, methodnames in (
+            (
+                engine.downloader.middleware,
+                "downloader_middleware",
+                ("process_request", "process_response", "process_exception"),
+            ),
+            (engine.scraper.spidermw, "spider_middleware", ("process_spider_input",)),
+            (engine.scraper.itemproc, "item_pipeline", ("process_item",)),
+        ):
+            if isinstance(manager, MiddlewareManager):
+                manager._set_stage_timing(self, stage, methodnames)
+        if self.interval:
+            self.task = create_looping_call(self.update_stats)
+            self.task.start(self.interval, now=False)
+
+    def spider_closed(self) -> None:
+        if self.task and self.task.running:
+            self.task.stop()
+        self.update_stats()
+
+    def request_scheduled(self, request: Request) -> None:
+        self.start("scheduler", request)
+
+    def start(self, stage: str, request: Request) -> None:
+        """Start measuring *stage* for *request*."""
+        starts = self._starts.get(stage)
+        if starts is None:
+            starts = self._starts[stage] = WeakKeyDictionary()
+        starts[request] = perf_counter()
+
+    def stop(self, stage: str, request: Request, slot: str | None = None) -> None:
+        """Stop measuring *stage* for *request*, if started, and record the
+        elapsed time."""
+        starts = self._starts.get(stage)
+        if starts is None:
+            return
+        start = starts.pop(request, None)
+        if start is not None:
+            self.record(stage, perf_counter() - start, slot)
+
+    def record(self, stage: str, duration: float, slot: str | None = None) -> None:
+        """Record that *stage* took *duration* seconds.
+
+        If :setting:`STAGE_TIMING_PER_SLOT` is enabled and a downloader
+        *slot* is given, the duration is also recorded for
+        ``<stage>/<slot>``.
+        """
+        self._add(stage, duration)
+        if slot is not None and self.per_slot:
+            self._add(f"{stage}/{slot}", duration)
+
+    def _add(self, stage: str, duration: float) -> None:
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            histogram = self.histograms[stage] = _Histogram()
+        histogram.add(duration)
+
+    def update_stats(self) -> None:
+        for stage, histogram in self.histograms.items():
+            prefix = f"stage_timing/{stage}"
+            self.stats.set_value(f"{prefix}/count", histogram.count)
+            for percent in PERCENTILES:
+                self.stats.set_value(
+                    f"{prefix}/p{percent}", round(histogram.percentile(percent), 6)
+                )
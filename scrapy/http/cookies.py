@@ -4,8 +4,10 @@ import re
 import time
 from http.cookiejar import Cookie, CookiePolicy, DefaultCookiePolicy
 from http.cookiejar import CookieJar as _CookieJar
+from http.cookiejar import request_path as _request_path  # type: ignore[attr-defined]
 from typing import TYPE_CHECKING, Any, cast
 
+from scrapy.utils.datatypes import LocalCache
 from scrapy.utils.httpobj import urlparse_cached
 from scrapy.utils.python import to_unicode
 
@@ -25,13 +27,15 @@ IPV4_RE = re.compile(r"\.\d+$", re.ASCII)
 
 
 class CookieJar:
+    _jar_class: type[_CookieJar] = _CookieJar
+
     def __init__(
         self,
         policy: CookiePolicy | None = None,
         check_expired_frequency: int = 10000,
     ):
         self.policy: CookiePolicy = policy or DefaultCookiePolicy()
-        self.jar: _CookieJar = _CookieJar(self.policy)
+        self.jar: _CookieJar = self._jar_class(self.policy)
         self.jar._cookies_lock = _DummyLock()  # type: ignore[attr-defined]
         self.check_expired_frequency: int = check_expired_frequency
         self.processed: int = 0
@@ -45,33 +49,33 @@ class CookieJar:
         wreq = WrappedRequest(request)
         self.policy._now = self.jar._now = int(time.time())  # type: ignore[attr-defined]
 
-        # the cookiejar implementation iterates through all domains
-        # instead we restrict to potential matches on the domain
         req_host = urlparse_cached(request).hostname
         if not req_host:
             return
 
-        if not IPV4_RE.search(req_host):
-            hosts = potential_domain_matches(req_host)
-            if "." not in req_host:
-                hosts += potential_domain_matches(req_host + ".local")
-        else:
-            hosts = [req_host, "." + req_host]
-
-        cookies = []
-        for host in hosts:
-            if host in self.jar._cookies:  # type: ignore[attr-defined]
-                cookies.extend(self.jar._cookies_for_domain(host, wreq))  # type: ignore[attr-defined]
-
-        attrs = self.jar._cookie_attrs(cookies)  # type: ignore[attr-defined]
-        if attrs and not wreq.has_header("Cookie"):
-            wreq.add_unredirected_header("Cookie", "; ".join(attrs))
+        header = self._get_cookie_header(wreq, req_host)
+        if header and not wreq.has_header("Cookie"):
+            wreq.add_unredirected_header("Cookie", header)
 
         self.processed += 1
         if self.processed % self.check_expired_frequency == 0:
             # This is still quite inefficient for large number of cookies
             self.jar.clear_expired_cookies()
 
+    def _get_cookie_header(self, wreq: WrappedRequest, req_host: str) -> str:
+        # the cookiejar implementation iterates through all domains
+        # instead we restrict to potential matches on the domain
+        cookies = self._get_cookies(wreq, _get_request_hosts(req_host))
+        attrs = self.jar._cookie_attrs(cookies)  # type: ignore[attr-defined]
+        return "; ".join(attrs)
+
+    def _get_cookies(self, wreq: WrappedRequest, hosts: list[str]) -> list[Cookie]:
+        cookies = []
+        for host in hosts:
+            if host in self.jar._cookies:  # type: ignore[attr-defined]
+                cookies.extend(self.jar._cookies_for_domain(host, wreq))  # type: ignore[attr-defined]
+        return cookies
+
     @property
     def _cookies(self) -> dict[str, dict[str, dict[str, Cookie]]]:
         return self.jar._cookies  # type: ignore[attr-defined,no-any-return]
@@ -108,6 +112,144 @@ class CookieJar:
         self.jar.set_cookie_if_ok(cookie, WrappedRequest(request))  # type: ignore[arg-type]
 
 
+class _VersionedCookieJar(_CookieJar):
+    """:class:`http.cookiejar.CookieJar` that counts changes, so that data
+    computed from its cookies can tell when it is stale.
+
+    :attr:`generation` changes when all cookies are cleared or the policy
+    changes, and :attr:`domain_generations` maps each cookie domain to a
+    number that changes when cookies of that domain are set or cleared.
+    """
+
+    def __init__(self, policy: CookiePolicy | None = None):
+        super().__init__(policy)
+        self.generation: int = 0
+        self.domain_generations: dict[str, int] = {}
+
+    def set_policy(self, policy: CookiePolicy) -> None:
+        super().set_policy(policy)
+        self.generation += 1
+
+    def set_cookie(self, cookie: Cookie) -> None:
+        super().set_cookie(cookie)
+        self._changed(cookie.domain)
+
+    def clear(
+        self,
+        domain: str | None = None,
+        path: str | None = None,
+        name: str | None = None,
+    ) -> None:
+        super().clear(domain, path, name)
+        if domain is None:
+            self.generation += 1
+        else:
+            self._changed(domain)
+
+    def _changed(self, domain: str) -> None:
+        self.domain_generations[domain] = self.domain_generations.get(domain, 0) + 1
+
+
+class CachingCookieJar(CookieJar):
+    """:class:`CookieJar` that caches the ``Cookie`` header of requests.
+
+    Cookies are stored, selected and sent the same way as with
+    :class:`CookieJar`, but the ``Cookie`` header built for a request is
+    reused for later requests to the same scheme and host name, and port,
+    whose path matches the same cookie paths, until cookies of the matching
+    domains change or one of the sent cookies expires. This saves checking
+    every cookie against every request, which is costly for sites that set
+    many cookies.
+
+    The cache is only used with the default cookie policy,
+    :class:`http.cookiejar.DefaultCookiePolicy`. Up to *cache_size* headers
+    are cached.
+
+    To use it, see :setting:`COOKIES_JAR_CLASS`.
+
+    .. versionadded:: VERSION
+    """
+
+    _jar_class = _VersionedCookieJar
+    jar: _VersionedCookieJar
+
+    def __init__(
+        self,
+        policy: CookiePolicy | None = None,
+        check_expired_frequency: int = 10000,
+        cache_size: int = 10000,
+    ):
+        super().__init__(policy, check_expired_frequency)
+        self._hosts: LocalCache[str, list[str]] = LocalCache(cache_size)
+        # Cookie header and expiration time of its first expiring cookie.
+        self._headers: LocalCache[tuple[Any, ...], tuple[str, int | None]] = LocalCache(
+            cache_size
+        )
+
+    def _get_cookie_header(self, wreq: WrappedRequest, req_host: str) -> str:
+        if type(self.jar._policy) is not DefaultCookiePolicy:  # type: ignore[attr-defined]
+            return super()._get_cookie_header(wreq, req_host)
+        hosts = self._hosts.get(req_host)
+        if hosts is None:
+            hosts = _get_request_hosts(req_host)
+            self._hosts[req_host] = hosts
+        # The cache key includes everything that the default policy checks
+        # other than expiration: the request URL, its cookie domains and paths,
+        # and the generation of those domains.
+        req_path = _request_path(wreq)
+        cookies = self.jar._cookies  # type: ignore[attr-defined]
+        generations = self.jar.domain_generations
+        matches = tuple(
+            (
+                host,
+                generations.get(host, 0),
+                tuple(path for path in cookies[host] if _path_matches(path, req_path)),
+            )
+            for host in hosts
+            if host in cookies
+        )
+        parsed_url = urlparse_cached(wreq.request)
+        key = (
+            parsed_url.scheme,
+            parsed_url.netloc,
+            wreq.unverifiable,
+            self.jar.generation,
+            matches,
+        )
+        cached = self._headers.get(key)
+        now: int = self.jar._now  # type: ignore[attr-defined]
+        if cached is not None and (cached[1] is None or now < cached[1]):
+            return cached[0]
+        sent_cookies = self._get_cookies(wreq, hosts)
+        header = "; ".join(self.jar._cookie_attrs(sent_cookies))  # type: ignore[attr-defined]
+        expires = min(
+            (cookie.expires for cookie in sent_cookies if cookie.expires is not None),
+            default=None,
+        )
+        self._headers[key] = (header, expires)
+        return header
+
+
+def _get_request_hosts(req_host: str) -> list[str]:
+    """Return the cookie domains that may match the *req_host* host name."""
+    if not IPV4_RE.search(req_host):
+        hosts = potential_domain_matches(req_host)
+        if "." not in req_host:
+            hosts += potential_domain_matches(req_host + ".local")
+        return hosts
+    return [req_host, "." + req_host]
+
+
+def _path_matches(path: str, req_path: str) -> bool:
+    """Return whether the *path* cookie path matches the *req_path* request
+    path, like :meth:`http.cookiejar.DefaultCookiePolicy.path_return_ok`."""
+    if req_path == path:
+        return True
+    return req_path.startswith(path) and (
+        path.endswith("/") or req_path[len(path) : len(path) + 1] == "/"
+    )
+
+
 def potential_domain_matches(domain: str) -> list[str]:
     """Potential domain matches for a cookie
 
@@ -124,20 +124,47 @@ class TextResponse(Response):
 
     def _body_inferred_encoding(self) -> str:
         if self._cached_benc is None:
-            content_type = to_unicode(
-                cast("bytes", self.headers.get(b"Content-Type", b"")),
-                encoding="latin-1",
-            )
-            benc, ubody = html_to_unicode(
-                content_type,
-                self.body,
-                auto_detect_fun=self._auto_detect_fun,
-                default_encoding=self._DEFAULT_ENCODING,
-            )
+            benc = self._infer_ascii_or_utf8()
+            if benc is None:
+                content_type = to_unicode(
+                    cast("bytes", self.headers.get(b"Content-Type", b"")),
+                    encoding="latin-1",
+                )
+                benc, ubody = html_to_unicode(
+                    content_type,
+                    self.body,
+                    auto_detect_fun=self._auto_detect_fun,
+                    default_encoding=self._DEFAULT_ENCODING,
+                )
+                self._cached_ubody = ubody
             self._cached_benc = benc
-            self._cached_ubody = ubody
         return self._cached_benc
 
+    def _infer_ascii_or_utf8(self) -> str | None:
+        """Return the encoding of a body that declares none and is ASCII or
+        valid UTF-8, caching the decoded body, or ``None`` otherwise.
+
+        The result is the same as that of :func:`~w3lib.encoding.html_to_unicode`
+        with :meth:`_auto_detect_fun`, which tries ASCII and UTF-8 first, but
+        the body is decoded once instead of up to 3 times.
+        """
+        if (
+            self._DEFAULT_ENCODING != "ascii"
+            or type(self)._auto_detect_fun is not TextResponse._auto_detect_fun
+            or self._bom_encoding()
+            or self._headers_encoding()
+            or self._body_declared_encoding()
+        ):
+            return None
+        if self.body.isascii():
+            self._cached_ubody = self.body.decode("ascii")
+            return resolve_encoding("ascii")
+        try:
+            self._cached_ubody = self.body.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+        return resolve_encoding("utf-8")
+
     def _auto_detect_fun(self, text: bytes) -> str | None:
         for enc in (self._DEFAULT_ENCODING, "utf-8", "cp1252"):
             try:
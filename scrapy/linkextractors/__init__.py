@@ -8,10 +8,12 @@ For more info see docs/topics/link-extractors.rst
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
+    from collections.abc import Set as AbstractSet
     from re import Pattern
 
 # common file extensions that are not followed if they occur in links
@@ -120,6 +122,59 @@ def _matches(url: str, regexs: Iterable[Pattern[str]]) -> bool:
     return any(r.search(url) for r in regexs)
 
 
+# Backreferences, conditional groups and global inline flags, which would
+# change meaning in a combined regular expression.
+_NOT_COMBINABLE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)")
+
+
+def _combine_regexes(regexes: Sequence[Pattern[str]]) -> Pattern[str] | None:
+    """Return a regular expression that matches wherever any of *regexes*
+    matches, or ``None`` if there is no point in combining *regexes* or they
+    cannot be combined safely."""
+    if len(regexes) < 2:
+        return None
+    flags = regexes[0].flags
+    if any(
+        regex.flags != flags or _NOT_COMBINABLE.search(regex.pattern)
+        for regex in regexes
+    ):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{regex.pattern})" for regex in regexes), flags)
+    except re.error:  # e.g. the same group name in different regexes
+        return None
+
+
+class _RegexSet:
+    """Tells whether any of several regular expressions matches a string,
+    searching the string only once when they can be combined."""
+
+    __slots__ = ("_combined", "_regexes")
+
+    def __init__(self, regexes: Sequence[Pattern[str]]):
+        self._regexes: Sequence[Pattern[str]] = regexes
+        self._combined: Pattern[str] | None = _combine_regexes(regexes)
+
+    def __bool__(self) -> bool:
+        return bool(self._regexes)
+
+    def search(self, string: str) -> bool:
+        if self._combined is not None:
+            return self._combined.search(string) is not None
+        return _matches(string, self._regexes)
+
+
+def _has_extension(path: str, extensions: AbstractSet[str]) -> bool:
+    """Return whether *path* ends with any of *extensions*, all of which must
+    start with a dot."""
+    index = path.rfind(".")
+    while index != -1:
+        if path[index:] in extensions:
+            return True
+        index = path.rfind(".", 0, index)
+    return False
+
+
 def _is_valid_url(url: str) -> bool:
     return url.split("://", 1)[0] in {"http", "https", "file", "ftp"}
 
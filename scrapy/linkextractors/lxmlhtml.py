@@ -10,19 +10,29 @@ import re
 from collections.abc import Callable, Iterable
 from functools import partial
 from typing import TYPE_CHECKING, Any, TypeAlias, cast
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 
 from lxml import etree
 from parsel.csstranslator import HTMLTranslator
 from w3lib.html import strip_html5_whitespace
-from w3lib.url import canonicalize_url, safe_url_string
 
+from scrapy.http import HtmlResponse
 from scrapy.link import Link
-from scrapy.linkextractors import IGNORED_EXTENSIONS, _is_valid_url, _matches
+from scrapy.linkextractors import (
+    IGNORED_EXTENSIONS,
+    _has_extension,
+    _is_valid_url,
+    _RegexSet,
+)
 from scrapy.utils.misc import arg_to_iter, rel_has_nofollow
 from scrapy.utils.python import unique as unique_list
 from scrapy.utils.response import get_base_url
-from scrapy.utils.url import url_has_any_extension, url_is_from_any_domain
+from scrapy.utils.url import (
+    _is_from_domains,
+    canonicalize_url_cached,
+    safe_url_string_cached,
+    urljoin_cached,
+)
 
 if TYPE_CHECKING:
     from lxml.html import HtmlElement
@@ -54,7 +64,7 @@ def _identity(x: Any) -> Any:
 
 
 def _canonicalize_link_url(link: Link) -> str:
-    return canonicalize_url(link.url, keep_fragments=True)
+    return canonicalize_url_cached(link.url, keep_fragments=True)
 
 
 def _name_matches(allowed: set[str], denied: set[str], name: str) -> bool:
@@ -69,6 +79,51 @@ def _name_matches(allowed: set[str], denied: set[str], name: str) -> bool:
     return "*" in allowed or name in allowed
 
 
+class _LinkTarget:
+    """lxml parser target that collects links while an HTML document is
+    parsed, without building a tree.
+
+    :attr:`links` holds, in document order, the value of each link
+    attribute, the text parts of its element, which are complete once
+    parsing ends, and the value of its ``rel`` attribute.
+    """
+
+    def __init__(
+        self, scan_tag: Callable[[str], bool], scan_attr: Callable[[str], bool]
+    ):
+        self.scan_tag: Callable[[str], bool] = scan_tag
+        self.scan_attr: Callable[[str], bool] = scan_attr
+        self.links: list[tuple[str, list[str], str | None]] = []
+        self._depth: int = 0
+        # Depth and text parts of the open elements that have links.
+        self._open: list[tuple[int, list[str]]] = []
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        self._depth += 1
+        if not self.scan_tag(_nons(tag)):
+            return
+        text: list[str] | None = None
+        for name, value in attrib.items():
+            if not self.scan_attr(name):
+                continue
+            if text is None:
+                text = []
+                self._open.append((self._depth, text))
+            self.links.append((value, text, attrib.get("rel")))
+
+    def end(self, tag: str) -> None:
+        if self._open and self._open[-1][0] == self._depth:
+            self._open.pop()
+        self._depth -= 1
+
+    def data(self, data: str) -> None:
+        for _, text in self._open:
+            text.append(data)
+
+    def close(self) -> list[tuple[str, list[str], str | None]]:
+        return self.links
+
+
 class LxmlParserLinkExtractor:
     def __init__(
         self,
@@ -123,25 +178,9 @@ class LxmlParserLinkExtractor:
         links: list[Link] = []
         # hacky way to get the underlying lxml parsed document
         for el, _, attr_val in self._iter_links(selector.root):
-            # pseudo lxml.html.HtmlElement.make_links_absolute(base_url)
-            try:
-                if self.strip:
-                    attr_val = strip_html5_whitespace(attr_val)  # noqa: PLW2901 this is intended
-                attr_val = urljoin(base_url, attr_val)  # noqa: PLW2901
-            except ValueError:
-                continue  # skipping bogus links
-            else:
-                url = self.process_attr(attr_val)
-                if url is None:
-                    continue
-            try:
-                url = safe_url_string(url, encoding=response_encoding)
-            except ValueError:
-                logger.debug(f"Skipping extraction of link with bad URL {url!r}")
+            url = self._get_url(attr_val, response_url, response_encoding, base_url)
+            if url is None:
                 continue
-
-            # to fix relative links after process_value
-            url = urljoin(response_url, url)
             link = Link(
                 url,
                 _collect_string_content(el) or "",
@@ -150,6 +189,60 @@ class LxmlParserLinkExtractor:
             links.append(link)
         return self._deduplicate_if_needed(links)
 
+    def _stream_links(
+        self,
+        text: str,
+        response_url: str,
+        response_encoding: str,
+        base_url: str,
+    ) -> list[Link]:
+        """Return the links of the HTML document *text*, parsing it without
+        building a tree.
+
+        The document is parsed the same way as :class:`~scrapy.Selector`
+        does, so the outcome matches :meth:`_extract_links`.
+        """
+        body = text.strip().replace("\x00", "").encode("utf-8") or b"<html/>"
+        target = _LinkTarget(self.scan_tag, self.scan_attr)
+        parser = etree.HTMLParser(
+            target=target, recover=True, encoding="utf-8", huge_tree=True
+        )
+        etree.fromstring(body, parser=parser)
+        links: list[Link] = []
+        for attr_val, parts, rel in target.links:
+            url = self._get_url(attr_val, response_url, response_encoding, base_url)
+            if url is None:
+                continue
+            links.append(Link(url, "".join(parts), nofollow=rel_has_nofollow(rel)))
+        return self._deduplicate_if_needed(links)
+
+    def _get_url(
+        self,
+        attr_val: str,
+        response_url: str,
+        response_encoding: str,
+        base_url: str,
+    ) -> str | None:
+        """Return the absolute URL of a link from its attribute value, or
+        ``None`` if the link must be skipped."""
+        # pseudo lxml.html.HtmlElement.make_links_absolute(base_url)
+        try:
+            if self.strip:
+                attr_val = strip_html5_whitespace(attr_val)
+            attr_val = urljoin_cached(base_url, attr_val)
+        except ValueError:
+            return None  # skipping bogus links
+        url = self.process_attr(attr_val)
+        if url is None:
+            return None
+        try:
+            url = safe_url_string_cached(url, encoding=response_encoding)
+        except ValueError:
+            logger.debug(f"Skipping extraction of link with bad URL {url!r}")
+            return None
+        # to fix relative links after process_value
+        return urljoin_cached(response_url, url)
+
     def extract_links(self, response: TextResponse) -> list[Link]:
         base_url = get_base_url(response)
         return self._extract_links(
@@ -298,6 +391,23 @@ class LxmlLinkExtractor:
         Set ``strip=False`` to turn it off (e.g. if you're extracting urls
         from elements or attributes which allow leading/trailing whitespaces).
     :type strip: bool
+
+    :param streaming: whether to extract links while parsing the HTML
+        document, without building its tree, which takes less memory. It
+        only applies to :class:`~scrapy.http.HtmlResponse` objects and when
+        neither ``restrict_xpaths`` nor ``restrict_css`` is given.
+        Otherwise, or if the :attr:`~scrapy.http.TextResponse.selector` of
+        the response has already been used, the tree is used as usual.
+        Extracted links are the same either way.
+
+        Enable it when a response is only parsed to extract links, e.g. for
+        :class:`~scrapy.spiders.CrawlSpider` rules of pages without a
+        callback. If the callback of the response also uses its
+        :attr:`~scrapy.http.TextResponse.selector`, the response is parsed
+        twice. Defaults to ``False``.
+
+        .. versionadded:: VERSION
+    :type streaming: bool
     """
 
     _csstranslator = HTMLTranslator()
@@ -320,6 +430,7 @@ class LxmlLinkExtractor:
         restrict_text: _RegexOrSeveral | None = None,
         deny_tags: str | Iterable[str] = (),
         deny_attrs: str | Iterable[str] = (),
+        streaming: bool = False,
     ):
         tags, attrs = set(arg_to_iter(tags)), set(arg_to_iter(attrs))
         deny_tags, deny_attrs = (
@@ -350,6 +461,20 @@ class LxmlLinkExtractor:
         self.canonicalize: bool = canonicalize
         self.deny_extensions: set[str] = {"." + e for e in arg_to_iter(deny_extensions)}
         self.restrict_text: list[re.Pattern[str]] = self._compile_regexes(restrict_text)
+        self.streaming: bool = streaming
+
+        # Filters built from the attributes above, so that each link is checked
+        # in a single pass.
+        self._allow: _RegexSet = _RegexSet(self.allow_res)
+        self._deny: _RegexSet = _RegexSet(self.deny_res)
+        self._restrict_text: _RegexSet = _RegexSet(self.restrict_text)
+        self._allow_domains: frozenset[str] = frozenset(
+            domain.lower() for domain in self.allow_domains
+        )
+        self._deny_domains: frozenset[str] = frozenset(
+            domain.lower() for domain in self.deny_domains
+        )
+        self._deny_extensions: frozenset[str] = frozenset(self.deny_extensions)
 
     @staticmethod
     def _compile_regexes(value: _RegexOrSeveral | None) -> list[re.Pattern[str]]:
@@ -359,49 +484,60 @@ class LxmlLinkExtractor:
         ]
 
     def _link_allowed(self, link: Link) -> bool:
-        if not _is_valid_url(link.url):
-            return False
-        if self.allow_res and not _matches(link.url, self.allow_res):
+        url = link.url
+        if not _is_valid_url(url):
             return False
-        if self.deny_res and _matches(link.url, self.deny_res):
+        if self._allow and not self._allow.search(url):
             return False
-        parsed_url = urlparse(link.url)
-        if self.allow_domains and not url_is_from_any_domain(
-            parsed_url, self.allow_domains
-        ):
+        if self._deny and self._deny.search(url):
             return False
-        if self.deny_domains and url_is_from_any_domain(parsed_url, self.deny_domains):
+        if not self._url_allowed(url, check_extension=True):
             return False
-        if self.deny_extensions and url_has_any_extension(
-            parsed_url, self.deny_extensions
-        ):
-            return False
-        return not self.restrict_text or _matches(link.text, self.restrict_text)
+        return not self._restrict_text or self._restrict_text.search(link.text)
+
+    def _url_allowed(self, url: str, check_extension: bool) -> bool:
+        """Check *url* against the allowed and denied domains and, if
+        *check_extension* is ``True``, against the denied extensions."""
+        check_extension = check_extension and bool(self._deny_extensions)
+        if not (self._allow_domains or self._deny_domains or check_extension):
+            return True
+        parsed_url = urlparse(url)
+        if self._allow_domains or self._deny_domains:
+            host = parsed_url.netloc.lower()
+            if self._allow_domains and not _is_from_domains(host, self._allow_domains):
+                return False
+            if self._deny_domains and _is_from_domains(host, self._deny_domains):
+                return False
+        return not (
+            check_extension
+            and _has_extension(parsed_url.path.lower(), self._deny_extensions)
+        )
 
     def matches(self, url: str) -> bool:
-        if self.allow_domains and not url_is_from_any_domain(url, self.allow_domains):
+        if not self._url_allowed(url, check_extension=False):
             return False
-        if self.deny_domains and url_is_from_any_domain(url, self.deny_domains):
+        if self._allow and not self._allow.search(url):
             return False
-
-        allowed = (
-            (regex.search(url) for regex in self.allow_res)
-            if self.allow_res
-            else [True]
-        )
-        denied = (regex.search(url) for regex in self.deny_res) if self.deny_res else ()
-        return any(allowed) and not any(denied)
+        return not (self._deny and self._deny.search(url))
 
     def _process_links(self, links: list[Link]) -> list[Link]:
         links = [x for x in links if self._link_allowed(x)]
         if self.canonicalize:
             for link in links:
-                link.url = canonicalize_url(link.url)
+                link.url = canonicalize_url_cached(link.url)
         return self.link_extractor._process_links(links)
 
     def _extract_links(self, *args: Any, **kwargs: Any) -> list[Link]:
         return self.link_extractor._extract_links(*args, **kwargs)
 
+    def _can_stream(self, response: TextResponse) -> bool:
+        return (
+            self.streaming
+            and not self.restrict_xpaths
+            and isinstance(response, HtmlResponse)
+            and response._cached_selector is None
+        )
+
     def extract_links(self, response: TextResponse) -> list[Link]:
         """Returns a list of :class:`~scrapy.link.Link` objects from the
         specified :class:`response <scrapy.http.Response>`.
@@ -413,6 +549,11 @@ class LxmlLinkExtractor:
         otherwise they are returned.
         """
         base_url = get_base_url(response)
+        if self._can_stream(response):
+            links = self.link_extractor._stream_links(
+                response.text, response.url, response.encoding, base_url
+            )
+            return self._process_links(links)
         if self.restrict_xpaths:
             docs = [
                 subdoc for x in self.restrict_xpaths for subdoc in response.xpath(x)
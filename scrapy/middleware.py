@@ -5,8 +5,14 @@ import pprint
 import warnings
 from abc import ABC, abstractmethod
 from collections import defaultdict, deque
+from dataclasses import dataclass
+from functools import wraps
+from inspect import isawaitable, iscoroutinefunction
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, Concatenate, ParamSpec, TypeVar, cast
 
+from twisted.internet.defer import Deferred
+
 from scrapy.exceptions import NotConfigured, ScrapyDeprecationWarning
 from scrapy.utils.defer import ensure_awaitable
 from scrapy.utils.deprecate import argument_is_required
@@ -14,15 +20,14 @@ from scrapy.utils.misc import build_from_crawler, load_object
 from scrapy.utils.python import global_object_name
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
-
-    from twisted.internet.defer import Deferred
+    from collections.abc import Callable
 
     # typing.Self requires Python 3.11
     from typing_extensions import Self
 
     from scrapy import Spider
     from scrapy.crawler import Crawler
+    from scrapy.extensions.stagetiming import StageTiming
     from scrapy.settings import Settings
 
 
@@ -32,11 +37,67 @@ _T = TypeVar("_T")
 _P = ParamSpec("_P")
 
 
+@dataclass(slots=True, eq=False)
+class _CompiledMethod:
+    """A middleware method of a chain compiled by
+    :meth:`MiddlewareManager._get_chain`."""
+
+    method: Callable[..., Any]
+    #: Name of the method for warnings and error messages.
+    name: str
+    #: Whether the method is a coroutine function, so that its result always
+    #: needs to be awaited.
+    is_async: bool
+    #: Whether the method requires the deprecated spider argument.
+    requires_spider: bool
+
+
+def _needs_await(result: Any) -> bool:
+    """Return whether *result*, returned by a middleware method that is not a
+    coroutine function, needs to be awaited."""
+    return isinstance(result, Deferred) or isawaitable(result)
+
+
+def _timed(
+    method: Callable[..., Any], stage: str, stage_timing: StageTiming
+) -> Callable[..., Any]:
+    """Return a wrapper of *method* that records its duration as *stage* in
+    *stage_timing*.
+
+    Coroutine functions are measured until they return, other methods only
+    until their synchronous part returns.
+    """
+    if iscoroutinefunction(method):
+
+        @wraps(method)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter()
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                stage_timing.record(stage, perf_counter() - start)
+
+        return async_wrapper
+
+    @wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            stage_timing.record(stage, perf_counter() - start)
+
+    return wrapper
+
+
 class MiddlewareManager(ABC):
     """Base class for implementing middleware managers"""
 
     component_name: str
     _compat_spider: Spider | None = None
+    _stage_timing: StageTiming | None = None
+    _stage: str = ""
+    _timed_methods: tuple[str, ...] = ()
 
     def __init__(self, *middlewares: Any, crawler: Crawler | None = None) -> None:
         self.crawler: Crawler | None = crawler
@@ -52,6 +113,7 @@ class MiddlewareManager(ABC):
         # Only process_spider_output and process_spider_exception can be None.
         self.methods: dict[str, deque[Callable[..., Any] | None]] = defaultdict(deque)
         self._mw_methods_requiring_spider: set[Callable[..., Any]] = set()
+        self._chains: dict[str, tuple[_CompiledMethod, ...]] = {}
         for mw in middlewares:
             self._add_middleware(mw)
 
@@ -128,6 +190,49 @@ class MiddlewareManager(ABC):
             )
             self._mw_methods_requiring_spider.add(method)
 
+    def _set_stage_timing(
+        self, stage_timing: StageTiming, stage: str, methodnames: tuple[str, ...]
+    ) -> None:
+        """Make the chains of *methodnames* record the duration of each method
+        in *stage_timing*, as ``<stage>/<method name>``."""
+        self._stage_timing = stage_timing
+        self._stage = stage
+        self._timed_methods = methodnames
+        self._chains.clear()
+
+    def _get_method_name(self, method: Callable[..., Any]) -> str:
+        return global_object_name(method)
+
+    def _compile(self, method: Callable[..., Any], timed: bool) -> _CompiledMethod:
+        name = self._get_method_name(method)
+        requires_spider = method in self._mw_methods_requiring_spider
+        if timed:
+            assert self._stage_timing is not None
+            method = _timed(method, f"{self._stage}/{name}", self._stage_timing)
+        return _CompiledMethod(
+            method=method,
+            name=name,
+            is_async=iscoroutinefunction(method),
+            requires_spider=requires_spider,
+        )
+
+    def _get_chain(self, methodname: str) -> tuple[_CompiledMethod, ...]:
+        """Return the methods of :attr:`methods` for *methodname*, compiled.
+
+        Chains are compiled the first time that they are needed, so changes to
+        :attr:`methods` after that are ignored. Missing methods, i.e. ``None``
+        entries, are dropped.
+        """
+        chain = self._chains.get(methodname)
+        if chain is None:
+            timed = methodname in self._timed_methods
+            chain = self._chains[methodname] = tuple(
+                self._compile(method, timed)
+                for method in self.methods[methodname]
+                if method is not None
+            )
+        return chain
+
     async def _process_chain(
         self,
         methodname: str,
@@ -137,19 +242,19 @@ class MiddlewareManager(ABC):
         always_add_spider: bool = False,
         warn_deferred: bool = False,
     ) -> _T:
-        methods = cast(
-            "Iterable[Callable[Concatenate[_T, _P], _T]]", self.methods[methodname]
-        )
-        for method in methods:
-            warn = global_object_name(method) if warn_deferred else None
-            if always_add_spider or (
-                add_spider and method in self._mw_methods_requiring_spider
-            ):
-                obj = await ensure_awaitable(
-                    method(obj, *(*args, self._spider)), _warn=warn
-                )
+        for compiled in self._get_chain(methodname):
+            method = cast("Callable[Concatenate[_T, _P], _T]", compiled.method)
+            if always_add_spider or (add_spider and compiled.requires_spider):
+                result = method(obj, *(*args, self._spider))
             else:
-                obj = await ensure_awaitable(method(obj, *args), _warn=warn)
+                result = method(obj, *args)
+            # Results of synchronous methods are used as is, without wrapping
+            # them into a coroutine
+            if compiled.is_async or _needs_await(result):
+                result = await ensure_awaitable(
+                    result, _warn=compiled.name if warn_deferred else None
+                )
+            obj = result
         return obj
 
     def open_spider(self, spider: Spider) -> Deferred[list[None]]:  # pragma: no cover
@@ -7,16 +7,25 @@ See documentation in docs/topics/item-pipeline.rst
 from __future__ import annotations
 
 import asyncio
+import sys
 import warnings
 from typing import TYPE_CHECKING, Any, Protocol, cast
 
+from itemadapter import ItemAdapter, is_item
 from twisted.internet.defer import Deferred, DeferredList, FirstError
 
 from scrapy.exceptions import ScrapyDeprecationWarning
 from scrapy.middleware import MiddlewareManager
-from scrapy.utils.asyncio import is_asyncio_available
+from scrapy.utils.asyncio import call_later, is_asyncio_available
 from scrapy.utils.conf import build_component_list
-from scrapy.utils.defer import _maybeDeferred_coro, deferred_from_coro, ensure_awaitable
+from scrapy.utils.defer import (
+    _create_waiter,
+    _fire_waiter,
+    _maybeDeferred_coro,
+    _schedule_coro,
+    deferred_from_coro,
+    ensure_awaitable,
+)
 from scrapy.utils.python import global_object_name
 
 if TYPE_CHECKING:
@@ -25,7 +34,9 @@ if TYPE_CHECKING:
     from twisted.python.failure import Failure
 
     from scrapy import Spider
+    from scrapy.crawler import Crawler
     from scrapy.settings import Settings
+    from scrapy.utils.asyncio import CallLaterResult
 
 
 class ItemProcessorProtocol(Protocol):
@@ -45,9 +56,108 @@ class ItemProcessorProtocol(Protocol):
         """Release any resource that the item processor is using."""
 
 
+def _get_item_size(item: Any) -> int:
+    """Return an estimate of the memory that *item* and its field values
+    take."""
+    size = sys.getsizeof(item)
+    if is_item(item):
+        for key, value in ItemAdapter(item).items():
+            size += sys.getsizeof(key) + sys.getsizeof(value)
+    return size
+
+
+class _ItemBatch:
+    """Items waiting to be sent to the ``process_items()`` method of an item
+    pipeline."""
+
+    def __init__(
+        self,
+        manager: ItemPipelineManager,
+        process_items: Callable[[list[Any]], Any],
+        max_items: int,
+        max_bytes: int,
+        max_delay: float,
+    ):
+        self.manager: ItemPipelineManager = manager
+        self.process_items: Callable[[list[Any]], Any] = process_items
+        self.name: str = global_object_name(process_items)
+        self.max_items: int = max_items
+        self.max_bytes: int = max_bytes
+        self.max_delay: float = max_delay
+        self.items: list[Any] = []
+        self.waiters: list[asyncio.Future[Any] | Deferred[Any]] = []
+        self.size: int = 0
+        self._call: CallLaterResult | None = None
+
+    async def process_item(self, item: Any) -> Any:
+        """Add *item* to the batch and return its output once the batch has
+        been processed."""
+        waiter: asyncio.Future[Any] | Deferred[Any] = _create_waiter()
+        self.items.append(item)
+        self.waiters.append(waiter)
+        if self.max_bytes:
+            self.size += _get_item_size(item)
+        if (
+            len(self.items) >= self.max_items
+            or (self.max_bytes and self.size >= self.max_bytes)
+            or self.manager._only_batched_items_left()
+        ):
+            self._flush_nowait()
+        elif self._call is None:
+            self._call = call_later(self.max_delay, self._flush_nowait)
+        return await waiter
+
+    def _take(self) -> tuple[list[Any], list[asyncio.Future[Any] | Deferred[Any]]]:
+        if self._call is not None:
+            self._call.cancel()
+            self._call = None
+        items, waiters = self.items, self.waiters
+        self.items, self.waiters, self.size = [], [], 0
+        return items, waiters
+
+    def _flush_nowait(self) -> None:
+        _schedule_coro(self._process(*self._take()))
+
+    async def flush(self) -> None:
+        """Send the items of the batch to ``process_items()`` and wait for
+        the outcome."""
+        await self._process(*self._take())
+
+    async def _process(
+        self, items: list[Any], waiters: list[asyncio.Future[Any] | Deferred[Any]]
+    ) -> None:
+        """Send *items* to ``process_items()`` and fire *waiters* with the
+        corresponding outputs."""
+        if not items:
+            return
+        try:
+            outputs = await ensure_awaitable(self.process_items(items), _warn=self.name)
+            outputs = list(outputs)
+            if len(outputs) != len(items):
+                raise ValueError(
+                    f"{self.name}() returned {len(outputs)} outputs for"
+                    f" {len(items)} items."
+                )
+        except Exception as exception:
+            for waiter in waiters:
+                _fire_waiter(waiter, exception=exception)
+            return
+        for waiter, output in zip(waiters, outputs, strict=True):
+            if isinstance(output, Exception):
+                _fire_waiter(waiter, exception=output)
+            else:
+                _fire_waiter(waiter, output)
+
+
 class ItemPipelineManager(MiddlewareManager):
     component_name = "item pipeline"
 
+    def __init__(self, *middlewares: Any, crawler: Crawler | None = None) -> None:
+        self._batches: list[_ItemBatch] = []
+        # Items being processed, i.e. in process_item_async().
+        self._items: int = 0
+        super().__init__(*middlewares, crawler=crawler)
+
     @classmethod
     def _get_mwlist_from_settings(cls, settings: Settings) -> list[Any]:
         return build_component_list(
@@ -61,10 +171,54 @@ class ItemPipelineManager(MiddlewareManager):
         if hasattr(mw, "close_spider"):
             self.methods["close_spider"].appendleft(mw.close_spider)
             self._check_mw_method_spider_arg(mw.close_spider)
-        if hasattr(mw, "process_item"):
+        if hasattr(mw, "process_items"):
+            batch = self._get_batch(mw.process_items)
+            self._batches.append(batch)
+            self.methods["process_item"].append(batch.process_item)
+        elif hasattr(mw, "process_item"):
             self.methods["process_item"].append(mw.process_item)
             self._check_mw_method_spider_arg(mw.process_item)
 
+    def _get_method_name(self, method: Callable[..., Any]) -> str:
+        batch = getattr(method, "__self__", None)
+        if isinstance(batch, _ItemBatch):
+            return batch.name
+        return super()._get_method_name(method)
+
+    def _get_batch(self, process_items: Callable[[list[Any]], Any]) -> _ItemBatch:
+        if self.crawler is None:
+            raise ValueError(
+                f"{global_object_name(process_items)}() requires a crawler to"
+                f" be passed to {type(self).__name__}."
+            )
+        settings = self.crawler.settings
+        return _ItemBatch(
+            self,
+            process_items,
+            max_items=settings.getint("ITEM_PIPELINE_BATCH_MAX_ITEMS"),
+            max_bytes=settings.getint("ITEM_PIPELINE_BATCH_MAX_BYTES"),
+            max_delay=settings.getfloat("ITEM_PIPELINE_BATCH_MAX_DELAY"),
+        )
+
+    def _only_batched_items_left(self) -> bool:
+        """Return whether all items being processed are waiting in batches
+        and the downloader has no request in progress, i.e. whether waiting
+        for more items to fill batches is pointless."""
+        if sum(len(batch.items) for batch in self._batches) < self._items:
+            return False
+        assert self.crawler is not None
+        engine = self.crawler._engine
+        return engine is None or not engine.downloader.active
+
+    async def flush_async(self) -> None:
+        """Send the items waiting in batches to the ``process_items()``
+        methods of their item pipelines.
+
+        .. versionadded:: VERSION
+        """
+        for batch in self._batches:
+            await batch.flush()
+
     def process_item(self, item: Any, spider: Spider) -> Deferred[Any]:
         warnings.warn(
             f"{global_object_name(type(self))}.process_item() is deprecated, use process_item_async() instead.",
@@ -75,9 +229,17 @@ class ItemPipelineManager(MiddlewareManager):
         return deferred_from_coro(self.process_item_async(item))
 
     async def process_item_async(self, item: Any) -> Any:
-        return await self._process_chain(
-            "process_item", item, add_spider=True, warn_deferred=True
-        )
+        if not self._batches:
+            return await self._process_chain(
+                "process_item", item, add_spider=True, warn_deferred=True
+            )
+        self._items += 1
+        try:
+            return await self._process_chain(
+                "process_item", item, add_spider=True, warn_deferred=True
+            )
+        finally:
+            self._items -= 1
 
     def _get_dfd(
         self,
@@ -156,4 +318,5 @@ class ItemPipelineManager(MiddlewareManager):
         return deferred_from_coro(self._process_parallel("close_spider"))
 
     async def close_spider_async(self) -> None:
+        await self.flush_async()
         await self._process_parallel("close_spider")
@@ -406,6 +406,33 @@ class DownloaderAwarePriorityQueue:
             return None
 
         slot = self._next_slot(stats, update_state=True)
+        return self._pop_from_slot(slot)
+
+    def pop_many(self, count: int) -> list[Request]:
+        """Return up to *count* requests, in the order in which :meth:`pop`
+        would return them if each request started downloading before the
+        next call.
+
+        .. versionadded:: VERSION
+        """
+        active = {
+            slot: downloads
+            for downloads, slot in self._downloader_interface.stats(self.pqueues)
+        }
+        requests: list[Request] = []
+        while len(requests) < count and active:
+            stats = [(downloads, slot) for slot, downloads in active.items()]
+            slot = self._next_slot(stats, update_state=True)
+            request = self._pop_from_slot(slot)
+            if request is not None:
+                requests.append(request)
+            if slot in self.pqueues:
+                active[slot] += 1
+            else:
+                del active[slot]
+        return requests
+
+    def _pop_from_slot(self, slot: str) -> Request | None:
         queue = self.pqueues[slot]
         request = queue.pop()
         if len(queue) == 0:
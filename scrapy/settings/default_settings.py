@@ -35,6 +35,9 @@ __all__ = [
     "AWS_USE_SSL",
     "AWS_VERIFY",
     "BOT_NAME",
+    "CALLBACK_EXECUTOR",
+    "CALLBACK_PROCESS_POOL_SIZE",
+    "CALLBACK_THREAD_POOL_SIZE",
     "CLOSESPIDER_ERRORCOUNT",
     "CLOSESPIDER_ITEMCOUNT",
     "CLOSESPIDER_PAGECOUNT",
@@ -44,10 +47,23 @@ __all__ = [
     "COMMANDS_MODULE",
     "COMPRESSION_ENABLED",
     "CONCURRENT_ITEMS",
+    "CONCURRENT_ITEMS_ADAPTIVE",
+    "CONCURRENT_ITEMS_MAX",
     "CONCURRENT_REQUESTS",
     "CONCURRENT_REQUESTS_PER_DOMAIN",
+    "CONDITIONAL_REQUESTS_DBM_MODULE",
+    "CONDITIONAL_REQUESTS_DIR",
+    "CONDITIONAL_REQUESTS_ENABLED",
+    "CONDITIONAL_REQUESTS_SKIP_UNCHANGED",
+    "CONDITIONAL_REQUESTS_STORAGE",
     "COOKIES_DEBUG",
     "COOKIES_ENABLED",
+    "COOKIES_JARS_DIR",
+    "COOKIES_JARS_MAX",
+    "COOKIES_JARS_TTL",
+    "COOKIES_JAR_CLASS",
+    "COOKIES_MAX",
+    "COOKIES_PER_JAR_MAX",
     "CRAWLSPIDER_FOLLOW_LINKS",
     "DEFAULT_DROPITEM_LOG_LEVEL",
     "DEFAULT_ITEM_CLASS",
@@ -108,7 +124,9 @@ __all__ = [
     "FTP_PASSWORD",
     "FTP_USER",
     "GCS_PROJECT_ID",
+    "HTTP2_MAX_CONNECTIONS",
     "HTTP2_MAX_FRAME_SIZE",
+    "HTTP2_STREAM_CONCURRENCY_ENABLED",
     "HTTPAUTH_DOMAIN",
     "HTTPAUTH_PASS",
     "HTTPAUTH_USER",
@@ -134,6 +152,9 @@ __all__ = [
     "IMAGES_STORE_S3_ACL",
     "ITEM_PIPELINES",
     "ITEM_PIPELINES_BASE",
+    "ITEM_PIPELINE_BATCH_MAX_BYTES",
+    "ITEM_PIPELINE_BATCH_MAX_DELAY",
+    "ITEM_PIPELINE_BATCH_MAX_ITEMS",
     "ITEM_PROCESSOR",
     "JOBDIR",
     "LOGSTATS_INTERVAL",
@@ -168,6 +189,14 @@ __all__ = [
     "PERIODIC_LOG_DELTA",
     "PERIODIC_LOG_STATS",
     "PERIODIC_LOG_TIMING_ENABLED",
+    "PROXY_POOL_BAN_HTTP_CODES",
+    "PROXY_POOL_CONCURRENCY",
+    "PROXY_POOL_COOLDOWN",
+    "PROXY_POOL_ENABLED",
+    "PROXY_POOL_MAX_COOLDOWN",
+    "PROXY_POOL_MAX_FAILURES",
+    "PROXY_POOL_PROXIES",
+    "PROXY_POOL_SLOT_PER_HOST",
     "RANDOMIZE_DOWNLOAD_DELAY",
     "REACTOR_THREADPOOL_MAXSIZE",
     "REDIRECT_ENABLED",
@@ -189,6 +218,8 @@ __all__ = [
     "RETRY_HTTP_CODES",
     "RETRY_PRIORITY_ADJUST",
     "RETRY_TIMES",
+    "ROBOTSTXT_CACHE_DIR",
+    "ROBOTSTXT_CACHE_EXPIRATION",
     "ROBOTSTXT_OBEY",
     "ROBOTSTXT_PARSER",
     "ROBOTSTXT_USER_AGENT",
@@ -199,6 +230,7 @@ __all__ = [
     "SCHEDULER_PRIORITY_QUEUE",
     "SCHEDULER_START_DISK_QUEUE",
     "SCHEDULER_START_MEMORY_QUEUE",
+    "SCRAPER_SLOT_ESTIMATE_MEMORY",
     "SCRAPER_SLOT_MAX_ACTIVE_SIZE",
     "SPIDER_CONTRACTS",
     "SPIDER_CONTRACTS_BASE",
@@ -207,6 +239,8 @@ __all__ = [
     "SPIDER_MIDDLEWARES",
     "SPIDER_MIDDLEWARES_BASE",
     "SPIDER_MODULES",
+    "STAGE_TIMING_ENABLED",
+    "STAGE_TIMING_PER_SLOT",
     "STATSMAILER_RCPTS",
     "STATS_CLASS",
     "STATS_DUMP",
@@ -220,6 +254,7 @@ __all__ = [
     "TWISTED_REACTOR",
     "TWISTED_REACTOR_ENABLED",
     "URLLENGTH_LIMIT",
+    "URL_CACHE_SIZE",
     "USER_AGENT",
     "WARN_ON_GENERATOR_RETURN_VALUE",
 ]
@@ -245,6 +280,10 @@ AWS_VERIFY = None
 
 BOT_NAME = "scrapybot"
 
+CALLBACK_EXECUTOR = None
+CALLBACK_PROCESS_POOL_SIZE = 0
+CALLBACK_THREAD_POOL_SIZE = 0
+
 CLOSESPIDER_ERRORCOUNT = 0
 CLOSESPIDER_ITEMCOUNT = 0
 CLOSESPIDER_PAGECOUNT = 0
@@ -257,12 +296,28 @@ COMMANDS_MODULE = ""
 COMPRESSION_ENABLED = True
 
 CONCURRENT_ITEMS = 100
+CONCURRENT_ITEMS_ADAPTIVE = False
+CONCURRENT_ITEMS_MAX = 1000
 
 CONCURRENT_REQUESTS = 16
 CONCURRENT_REQUESTS_PER_DOMAIN = 8
 
+CONDITIONAL_REQUESTS_ENABLED = False
+CONDITIONAL_REQUESTS_DBM_MODULE = "dbm"
+CONDITIONAL_REQUESTS_DIR = "conditional"
+CONDITIONAL_REQUESTS_SKIP_UNCHANGED = True
+CONDITIONAL_REQUESTS_STORAGE = (
+    "scrapy.downloadermiddlewares.conditional.DbmValidatorStorage"
+)
+
 COOKIES_ENABLED = True
 COOKIES_DEBUG = False
+COOKIES_JAR_CLASS = "scrapy.http.cookies.CookieJar"
+COOKIES_JARS_DIR = None
+COOKIES_JARS_MAX = 0
+COOKIES_JARS_TTL = 0
+COOKIES_MAX = 0
+COOKIES_PER_JAR_MAX = 0
 
 CRAWLSPIDER_FOLLOW_LINKS = True
 
@@ -329,10 +384,12 @@ DOWNLOADER_MIDDLEWARES_BASE = {
     "scrapy.downloadermiddlewares.defaultheaders.DefaultHeadersMiddleware": 400,
     "scrapy.downloadermiddlewares.useragent.UserAgentMiddleware": 500,
     "scrapy.downloadermiddlewares.retry.RetryMiddleware": 550,
+    "scrapy.downloadermiddlewares.conditional.ConditionalRequestMiddleware": 560,
     "scrapy.downloadermiddlewares.redirect.MetaRefreshMiddleware": 580,
     "scrapy.downloadermiddlewares.httpcompression.HttpCompressionMiddleware": 590,
     "scrapy.downloadermiddlewares.redirect.RedirectMiddleware": 600,
     "scrapy.downloadermiddlewares.cookies.CookiesMiddleware": 700,
+    "scrapy.downloadermiddlewares.proxypool.ProxyPoolMiddleware": 740,
     "scrapy.downloadermiddlewares.httpproxy.HttpProxyMiddleware": 750,
     "scrapy.downloadermiddlewares.stats.DownloaderStats": 850,
     "scrapy.downloadermiddlewares.httpcache.HttpCacheMiddleware": 900,
@@ -359,6 +416,7 @@ EXTENSIONS_BASE = {
     "scrapy.extensions.feedexport.FeedExporter": 0,
     "scrapy.extensions.logstats.LogStats": 0,
     "scrapy.extensions.spiderstate.SpiderState": 0,
+    "scrapy.extensions.stagetiming.StageTiming": 0,
     "scrapy.extensions.throttle.AutoThrottle": 0,
     "scrapy.extensions.remote_control.RemoteControl": 0,
 }
@@ -410,7 +468,9 @@ FTP_PASSWORD = "guest"  # noqa: S105
 
 GCS_PROJECT_ID = None
 
+HTTP2_MAX_CONNECTIONS = 1
 HTTP2_MAX_FRAME_SIZE = 16384
+HTTP2_STREAM_CONCURRENCY_ENABLED = False
 
 HTTPAUTH_USER = ""
 HTTPAUTH_PASS = ""
@@ -444,6 +504,10 @@ IMAGES_STORE_S3_ACL = "private"
 ITEM_PIPELINES = {}
 ITEM_PIPELINES_BASE = {}
 
+ITEM_PIPELINE_BATCH_MAX_BYTES = 0
+ITEM_PIPELINE_BATCH_MAX_DELAY = 1.0
+ITEM_PIPELINE_BATCH_MAX_ITEMS = 100
+
 ITEM_PROCESSOR = "scrapy.pipelines.ItemPipelineManager"
 
 JOBDIR = None
@@ -499,6 +563,15 @@ PERIODIC_LOG_DELTA = None
 PERIODIC_LOG_STATS = None
 PERIODIC_LOG_TIMING_ENABLED = False
 
+PROXY_POOL_ENABLED = False
+PROXY_POOL_BAN_HTTP_CODES = [403, 407, 429]
+PROXY_POOL_CONCURRENCY = 0
+PROXY_POOL_COOLDOWN = 30
+PROXY_POOL_MAX_COOLDOWN = 600
+PROXY_POOL_MAX_FAILURES = 0
+PROXY_POOL_PROXIES = []
+PROXY_POOL_SLOT_PER_HOST = True
+
 RANDOMIZE_DOWNLOAD_DELAY = True
 
 REACTOR_THREADPOOL_MAXSIZE = 10
@@ -540,6 +613,8 @@ RETRY_HTTP_CODES = [500, 502, 503, 504, 522, 524, 408, 429]
 RETRY_PRIORITY_ADJUST = -1
 RETRY_TIMES = 2  # initial response + 2 retries = 3 requests
 
+ROBOTSTXT_CACHE_DIR = None
+ROBOTSTXT_CACHE_EXPIRATION = 24 * 60 * 60
 ROBOTSTXT_OBEY = False
 ROBOTSTXT_PARSER = "scrapy.robotstxt.ProtegoRobotParser"
 ROBOTSTXT_USER_AGENT = None
@@ -552,6 +627,7 @@ SCHEDULER_PRIORITY_QUEUE = "scrapy.pqueues.DownloaderAwarePriorityQueue"
 SCHEDULER_START_DISK_QUEUE = "scrapy.squeues.PickleFifoDiskQueue"
 SCHEDULER_START_MEMORY_QUEUE = "scrapy.squeues.FifoMemoryQueue"
 
+SCRAPER_SLOT_ESTIMATE_MEMORY = False
 SCRAPER_SLOT_MAX_ACTIVE_SIZE = 5000000
 
 SPIDER_CONTRACTS = {}
@@ -580,6 +656,9 @@ SPIDER_MIDDLEWARES_BASE = {
 
 SPIDER_MODULES = []
 
+STAGE_TIMING_ENABLED = False
+STAGE_TIMING_PER_SLOT = False
+
 STATS_CLASS = "scrapy.statscollectors.MemoryStatsCollector"
 STATS_DUMP = True
 
@@ -600,6 +679,8 @@ TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
 
 URLLENGTH_LIMIT = 2083
 
+URL_CACHE_SIZE = 10000
+
 USER_AGENT = f"Scrapy/{import_module('scrapy').__version__} (+https://scrapy.org)"
 
 WARN_ON_GENERATOR_RETURN_VALUE = True
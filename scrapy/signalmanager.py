@@ -8,12 +8,19 @@ from twisted.internet.defer import Deferred
 
 from scrapy.exceptions import ScrapyDeprecationWarning
 from scrapy.utils import signal as _signal
+from scrapy.utils.asyncio import is_asyncio_available
 from scrapy.utils.defer import maybe_deferred_to_future
 
 
 class SignalManager:
     def __init__(self, sender: Any = dispatcher.Anonymous):
         self.sender: Any = sender
+        # Compiled receivers of each signal sent from self.sender, with the
+        # routing table entries that they were compiled from, see
+        # _get_receivers().
+        self._dispatch_table: dict[
+            Any, tuple[tuple[Any, ...], tuple[_signal._CompiledReceiver, ...]]
+        ] = {}
 
     def connect(self, receiver: Any, signal: Any, **kwargs: Any) -> None:
         """
@@ -31,6 +38,7 @@ class SignalManager:
         """
         kwargs.setdefault("sender", self.sender)
         dispatcher.connect(receiver, signal, **kwargs)
+        self._invalidate(signal)
 
     def disconnect(self, receiver: Any, signal: Any, **kwargs: Any) -> None:
         """
@@ -40,6 +48,7 @@ class SignalManager:
         """
         kwargs.setdefault("sender", self.sender)
         dispatcher.disconnect(receiver, signal, **kwargs)
+        self._invalidate(signal)
 
     def send_catch_log(self, signal: Any, **kwargs: Any) -> list[tuple[Any, Any]]:
         """
@@ -48,8 +57,12 @@ class SignalManager:
         The keyword arguments are passed to the signal handlers (connected
         through the :meth:`connect` method).
         """
-        kwargs.setdefault("sender", self.sender)
-        return _signal.send_catch_log(signal, **kwargs)
+        if "sender" in kwargs:
+            return _signal.send_catch_log(signal, **kwargs)
+        receivers = self._get_receivers(signal)
+        if not receivers:
+            return []
+        return _signal._send_compiled(receivers, signal, self.sender, **kwargs)
 
     def send_catch_log_deferred(
         self, signal: Any, **kwargs: Any
@@ -88,8 +101,16 @@ class SignalManager:
         .. versionadded:: 2.14
         """
         # note that this returns exceptions instead of Failures in the second tuple member
-        kwargs.setdefault("sender", self.sender)
-        return await _signal.send_catch_log_async(signal, **kwargs)
+        if "sender" in kwargs:
+            return await _signal.send_catch_log_async(signal, **kwargs)
+        receivers = self._get_receivers(signal)
+        if not receivers:
+            return []
+        if is_asyncio_available():
+            return await _signal._send_compiled_asyncio(
+                receivers, signal, self.sender, **kwargs
+            )
+        return await _signal.send_catch_log_async(signal, self.sender, **kwargs)
 
     def disconnect_all(self, signal: Any, **kwargs: Any) -> None:
         """
@@ -100,6 +121,34 @@ class SignalManager:
         """
         kwargs.setdefault("sender", self.sender)
         _signal.disconnect_all(signal, **kwargs)
+        self._invalidate(signal)
+
+    def _invalidate(self, signal: Any) -> None:
+        if signal is dispatcher.Any:
+            self._dispatch_table.clear()
+        else:
+            self._dispatch_table.pop(signal, None)
+
+    def _get_receivers(self, signal: Any) -> tuple[_signal._CompiledReceiver, ...]:
+        """Return the compiled receivers of *signal*, sent from
+        :attr:`sender`.
+
+        Compiled receivers are cached until a receiver of the signal is
+        connected or disconnected. Receivers connected, disconnected or
+        garbage-collected without going through this signal manager, e.g.
+        through pydispatcher or through another signal manager, are detected
+        by comparing the routing table entries that the cached receivers were
+        compiled from with the current ones.
+        """
+        routes = _signal._get_routes(self.sender, signal)
+        if not routes:
+            return ()
+        cached = self._dispatch_table.get(signal)
+        if cached is not None and cached[0] == routes:
+            return cached[1]
+        receivers = _signal._compile_receivers(self.sender, signal)
+        self._dispatch_table[signal] = (routes, receivers)
+        return receivers
 
     async def wait_for(self, signal: Any) -> None:
         """Await the next *signal*.
@@ -23,9 +23,14 @@ class MetaCopyDetectionMiddleware(BaseSpiderMiddleware):
     _INTERNAL_KEYS: frozenset[str] = frozenset(
         {
             "_auth_proxy",
+            "_conditional_headers",
+            "_conditional_validators",
             "_dont_cache",
+            "_proxy_pool",
             "_scheme_proxy",
             "download_latency",
+            "download_timing",
+            "h2_max_concurrent_streams",
             "redirect_reasons",
             "redirect_times",
             "redirect_ttl",
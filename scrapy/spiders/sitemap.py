@@ -5,15 +5,20 @@ import re
 
 # Iterable is needed at the run time for the SitemapSpider._parse_sitemap() annotation
 from collections.abc import AsyncIterator, Iterable, Sequence  # noqa: TC003
+from io import BytesIO
 from typing import TYPE_CHECKING, Any, cast
 
+from lxml.etree import XMLSyntaxError
+
 from scrapy.http import Request, Response, XmlResponse
 from scrapy.spiders import Spider
 from scrapy.utils._compression import _DecompressionMaxSizeExceeded
-from scrapy.utils.gz import gunzip, gzip_magic_number
+from scrapy.utils.gz import _GunzipReader, gunzip, gzip_magic_number
 from scrapy.utils.sitemap import Sitemap, sitemap_urls_from_robots
 
 if TYPE_CHECKING:
+    from _typeshed import SupportsRead
+
     # typing.Self requires Python 3.11
     from typing_extensions import Self
 
@@ -68,37 +73,66 @@ class SitemapSpider(Spider):
 
     def _parse_sitemap(self, response: Response) -> Iterable[Request]:
         if response.url.endswith("/robots.txt"):
-            urls = list(sitemap_urls_from_robots(response.body, base_url=response.url))
-            return (Request(url, callback=self._parse_sitemap) for url in urls)
+            for url in sitemap_urls_from_robots(response.body, base_url=response.url):
+                yield Request(url, callback=self._parse_sitemap)
+            return
 
-        body = self._get_sitemap_body(response)
-        if not body:
+        source = self._get_sitemap_source(response)
+        if source is None:
+            self._log_invalid_sitemap(response)
+            return
+
+        try:
+            try:
+                s = Sitemap(source)
+            except (StopIteration, XMLSyntaxError):
+                self._log_invalid_sitemap(response)
+                return
+
+            if s.type == "sitemapindex":
+                for loc in self._get_urls_from_sitemapindex(self.sitemap_filter(s)):
+                    yield Request(loc, callback=self._parse_sitemap)
+            elif s.type == "urlset":
+                for loc, c in self._get_urls_and_callbacks_from_urlset(
+                    self.sitemap_filter(s)
+                ):
+                    yield Request(loc, callback=c)
+            else:
+                self._log_invalid_sitemap(response)
+        except _DecompressionMaxSizeExceeded as e:
             logger.warning(
-                "Ignoring invalid sitemap: %(response)s",
-                {"response": response},
+                "Ignoring the rest of sitemap %(response)s: %(error)s",
+                {"response": response, "error": e},
                 extra={"spider": self},
             )
-            return ()
-
-        s = Sitemap(body)
-
-        if s.type == "sitemapindex":
-            urls = list(self._get_urls_from_sitemapindex(self.sitemap_filter(s)))
-            return (Request(loc, callback=self._parse_sitemap) for loc in urls)
-
-        if s.type == "urlset":
-            url_callback_pairs = list(
-                self._get_urls_and_callbacks_from_urlset(self.sitemap_filter(s))
-            )
-            return (Request(loc, callback=c) for loc, c in url_callback_pairs)
+        if isinstance(source, _GunzipReader):
+            self._check_decompressed_size(response, source.size)
 
+    def _log_invalid_sitemap(self, response: Response) -> None:
         logger.warning(
             "Ignoring invalid sitemap: %(response)s",
             {"response": response},
             extra={"spider": self},
         )
 
-        return ()
+    def _get_sitemap_source(self, response: Response) -> SupportsRead[bytes] | None:
+        """Return a binary file-like object to read the sitemap contained in
+        the given response from, or None if the response is not a sitemap.
+
+        Gzipped sitemaps are decompressed as they are parsed, so that requests
+        are sent before the whole sitemap has been decompressed.
+        """
+        if (
+            type(self)._get_sitemap_body is SitemapSpider._get_sitemap_body
+            and not isinstance(response, XmlResponse)
+            and gzip_magic_number(response)
+        ):
+            max_size = response.meta.get("download_maxsize", self._max_size)
+            return _GunzipReader(response.body, max_size=max_size)
+        body = self._get_sitemap_body(response)
+        if not body:
+            return None
+        return BytesIO(body)
 
     def _get_urls_from_sitemapindex(
         self, it: Iterable[dict[str, Any]]
@@ -123,18 +157,12 @@ class SitemapSpider(Spider):
         if isinstance(response, XmlResponse):
             return response.body
         if gzip_magic_number(response):
-            uncompressed_size = len(response.body)
             max_size = response.meta.get("download_maxsize", self._max_size)
-            warn_size = response.meta.get("download_warnsize", self._warn_size)
             try:
                 body = gunzip(response.body, max_size=max_size)
             except _DecompressionMaxSizeExceeded:
                 return None
-            if uncompressed_size < warn_size <= len(body):
-                logger.warning(
-                    f"{response} body size after decompression ({len(body)} B) "
-                    f"is larger than the download warning size ({warn_size} B)."
-                )
+            self._check_decompressed_size(response, len(body))
             return body
         # actual gzipped sitemap files are decompressed above ;
         # if we are here (response body is not gzipped)
@@ -149,6 +177,14 @@ class SitemapSpider(Spider):
             return response.body
         return None
 
+    def _check_decompressed_size(self, response: Response, size: int) -> None:
+        warn_size = response.meta.get("download_warnsize", self._warn_size)
+        if len(response.body) < warn_size <= size:
+            logger.warning(
+                f"{response} body size after decompression ({size} B) "
+                f"is larger than the download warning size ({warn_size} B)."
+            )
+
 
 def regex(x: re.Pattern[str] | str) -> re.Pattern[str]:
     if isinstance(x, str):
@@ -4,15 +4,23 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 from http.cookiejar import CookieJar
+from time import monotonic
 from typing import TYPE_CHECKING, Any
 
 from twisted.internet.defer import CancelledError
 from twisted.internet.error import ConnectionRefusedError as TxConnectionRefusedError
 from twisted.internet.error import DNSLookupError
 from twisted.internet.error import TimeoutError as TxTimeoutError
+from twisted.internet.interfaces import (
+    IHostnameResolver,
+    IReactorPluggableNameResolver,
+    IResolutionReceiver,
+    IStreamClientEndpoint,
+)
 from twisted.python.failure import Failure
 from twisted.web.client import ResponseFailed
 from twisted.web.error import SchemeNotSupported
+from zope.interface import implementer
 
 from scrapy import responsetypes
 from scrapy.exceptions import (
@@ -27,12 +35,21 @@ from scrapy.exceptions import (
 from scrapy.utils.log import logger
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Sequence
     from http.client import HTTPResponse
     from http.cookiejar import Cookie
     from ipaddress import IPv4Address, IPv6Address
     from urllib.request import Request as ULRequest
 
+    from twisted.internet.base import ReactorBase
+    from twisted.internet.defer import Deferred
+    from twisted.internet.interfaces import (
+        IAddress,
+        IHostResolution,
+        IProtocol,
+        IProtocolFactory,
+    )
+
     from scrapy import Request
     from scrapy.crawler import Crawler
     from scrapy.http import Headers, Response
@@ -151,3 +168,163 @@ def normalize_bind_address(
     if isinstance(value, str):
         return (value, 0)
     return value
+
+
+class DownloadTiming:
+    """Timestamps of the network phases of a download, reported in the
+    :reqmeta:`download_timing` meta key.
+
+    Download handlers set the timestamps of the phases that they can observe,
+    those of other phases, and of the connection setup phases when an existing
+    connection is reused, stay ``None``.
+    """
+
+    __slots__ = (
+        "connect_end",
+        "connect_start",
+        "connection_reused",
+        "dns_end",
+        "dns_start",
+        "headers_received",
+        "request_sent",
+        "start",
+        "tls_end",
+    )
+
+    def __init__(self) -> None:
+        self.start: float = monotonic()
+        self.connection_reused: bool = True
+        self.dns_start: float | None = None
+        self.dns_end: float | None = None
+        self.connect_start: float | None = None
+        #: TCP connection established.
+        self.connect_end: float | None = None
+        #: TLS handshake completed.
+        self.tls_end: float | None = None
+        #: Connection ready, request being sent.
+        self.request_sent: float | None = None
+        self.headers_received: float | None = None
+
+    def connection_started(self) -> None:
+        self.connection_reused = False
+        self.connect_start = monotonic()
+
+    def to_dict(self, end: float | None = None) -> dict[str, Any]:
+        """Return the duration of each phase, in seconds, finishing the body
+        transfer at *end* (now by default)."""
+        if end is None:
+            end = monotonic()
+        dns = connect = tls = ttfb = transfer = None
+        if self.dns_start is not None and self.dns_end is not None:
+            dns = self.dns_end - self.dns_start
+        connect_start = self.dns_end or self.connect_start
+        if connect_start is not None and self.connect_end is not None:
+            connect = self.connect_end - connect_start
+        if self.connect_end is not None and self.tls_end is not None:
+            tls = self.tls_end - self.connect_end
+        if self.request_sent is not None and self.headers_received is not None:
+            # Requests sent before the end of the TLS handshake are buffered
+            # until then
+            sent = max(self.request_sent, self.tls_end or 0.0)
+            ttfb = self.headers_received - sent
+        if self.headers_received is not None:
+            transfer = end - self.headers_received
+        return {
+            "dns": dns,
+            "connect": connect,
+            "tls": tls,
+            "ttfb": ttfb,
+            "transfer": transfer,
+            "total": end - self.start,
+            "connection_reused": self.connection_reused,
+        }
+
+
+@implementer(IResolutionReceiver)
+class _TimingResolutionReceiver:
+    def __init__(self, receiver: IResolutionReceiver, timing: DownloadTiming):
+        self._receiver: IResolutionReceiver = receiver
+        self._timing: DownloadTiming = timing
+
+    def resolutionBegan(self, resolution: IHostResolution) -> None:
+        self._receiver.resolutionBegan(resolution)
+
+    def addressResolved(self, address: IAddress) -> None:
+        self._receiver.addressResolved(address)
+
+    def resolutionComplete(self) -> None:
+        self._timing.dns_end = monotonic()
+        self._receiver.resolutionComplete()
+
+
+@implementer(IHostnameResolver)
+class _TimingHostnameResolver:
+    def __init__(self, resolver: IHostnameResolver, timing: DownloadTiming):
+        self._resolver: IHostnameResolver = resolver
+        self._timing: DownloadTiming = timing
+
+    def resolveHostName(
+        self,
+        resolutionReceiver: IResolutionReceiver,
+        hostName: str,
+        portNumber: int = 0,
+        addressTypes: Sequence[type[IAddress]] | None = None,
+        transportSemantics: str = "TCP",
+    ) -> IHostResolution:
+        self._timing.dns_start = monotonic()
+        return self._resolver.resolveHostName(
+            _TimingResolutionReceiver(resolutionReceiver, self._timing),
+            hostName,
+            portNumber,
+            addressTypes,
+            transportSemantics,
+        )
+
+
+@implementer(IReactorPluggableNameResolver)
+class TimingReactor:
+    """Reactor wrapper that records in a :class:`DownloadTiming` object the
+    name resolutions of the endpoints that it is passed to, e.g.
+    :class:`~twisted.internet.endpoints.HostnameEndpoint`."""
+
+    def __init__(self, reactor: ReactorBase, timing: DownloadTiming):
+        self._reactor: ReactorBase = reactor
+        self._timing: DownloadTiming = timing
+
+    @property
+    def nameResolver(self) -> IHostnameResolver:
+        return _TimingHostnameResolver(self._reactor.nameResolver, self._timing)
+
+    def installNameResolver(self, resolver: IHostnameResolver) -> IHostnameResolver:
+        return self._reactor.installNameResolver(resolver)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._reactor, name)
+
+
+@implementer(IStreamClientEndpoint)
+class TimingEndpoint:
+    """Endpoint wrapper that records the connection setup in a
+    :class:`DownloadTiming` object.
+
+    Connection pools only call :meth:`connect` when they open a new
+    connection. If the connected protocol has a ``download_timing`` attribute,
+    it is set to the :class:`DownloadTiming` object so that the protocol can
+    record the end of the TLS handshake.
+    """
+
+    def __init__(self, endpoint: IStreamClientEndpoint, timing: DownloadTiming):
+        self._endpoint: IStreamClientEndpoint = endpoint
+        self._timing: DownloadTiming = timing
+
+    def connect(self, protocolFactory: IProtocolFactory) -> Deferred[IProtocol]:
+        self._timing.connection_started()
+        d: Deferred[IProtocol] = self._endpoint.connect(protocolFactory)
+        d.addCallback(self._cb_connected)
+        return d
+
+    def _cb_connected(self, protocol: IProtocol) -> IProtocol:
+        self._timing.connect_end = monotonic()
+        if hasattr(protocol, "download_timing"):
+            protocol.download_timing = self._timing
+        return protocol
@@ -542,6 +542,41 @@ def _schedule_coro(coro: Coroutine[Any, Any, Any]) -> None:
     loop.create_task(coro)  # noqa: RUF006
 
 
+def _create_waiter() -> Future[Any] | Deferred[Any]:
+    """Return an object that can be awaited until it is fired with
+    :func:`_fire_waiter`.
+
+    It is an :class:`asyncio.Future` if asyncio is available and a
+    :class:`~twisted.internet.defer.Deferred` otherwise, so that it can be
+    awaited without wrapping it into a different object.
+    """
+    if is_asyncio_available():
+        return asyncio.get_event_loop().create_future()
+    return Deferred()
+
+
+def _fire_waiter(
+    waiter: Future[_T] | Deferred[_T],
+    result: _T | None = None,
+    exception: Exception | None = None,
+) -> None:
+    """Fire a waiter returned by :func:`_create_waiter` with *result*, or
+    with *exception* if it is not ``None``.
+
+    Waiters that were cancelled are left untouched.
+    """
+    if isinstance(waiter, Deferred):
+        if exception is not None:
+            waiter.errback(failure.Failure(exception))
+        else:
+            waiter.callback(cast("_T", result))
+    elif not waiter.done():
+        if exception is not None:
+            waiter.set_exception(exception)
+        else:
+            waiter.set_result(cast("_T", result))
+
+
 @overload
 def ensure_awaitable(o: Awaitable[_T], _warn: str | None = None) -> Awaitable[_T]: ...
 
@@ -11,27 +11,43 @@ if TYPE_CHECKING:
     from scrapy.http import Response
 
 
-def gunzip(data: bytes, *, max_size: int = 0) -> bytes:
-    """Gunzip the given data and return as much data as possible.
+class _GunzipReader:
+    """Binary file-like object that gunzips the given data as it is read.
 
-    This is resilient to CRC checksum errors.
+    Like :func:`gunzip`, it is resilient to CRC checksum errors, and it raises
+    :exc:`~scrapy.utils._compression._DecompressionMaxSizeExceeded` once more
+    than *max_size* bytes have been decompressed.
     """
-    f = GzipFile(fileobj=BytesIO(data))
-    output_stream = BytesIO()
-    chunk = b"."
-    decompressed_size = 0
-    while chunk:
+
+    def __init__(self, data: bytes, *, max_size: int = 0):
+        self._file = GzipFile(fileobj=BytesIO(data))
+        self.max_size: int = max_size
+        #: Number of bytes decompressed so far.
+        self.size: int = 0
+
+    def read(self, size: int = -1) -> bytes:
         try:
-            chunk = f.read1(_CHUNK_SIZE)
+            chunk = self._file.read1(size if size > 0 else _CHUNK_SIZE)
         except (OSError, EOFError, struct.error):
             # complete only if there is some data, otherwise re-raise
             # see issue 87 about catching struct.error
-            # some pages are quite small so output_stream is empty
-            if output_stream.getbuffer().nbytes > 0:
-                break
+            # some pages are quite small so nothing is decompressed
+            if self.size > 0:
+                return b""
             raise
-        decompressed_size += len(chunk)
-        _check_max_size(decompressed_size, max_size)
+        self.size += len(chunk)
+        _check_max_size(self.size, self.max_size)
+        return chunk
+
+
+def gunzip(data: bytes, *, max_size: int = 0) -> bytes:
+    """Gunzip the given data and return as much data as possible.
+
+    This is resilient to CRC checksum errors.
+    """
+    f = _GunzipReader(data, max_size=max_size)
+    output_stream = BytesIO()
+    while chunk := f.read(_CHUNK_SIZE):
         output_stream.write(chunk)
     return output_stream.getvalue()
 
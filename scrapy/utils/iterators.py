@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import codecs
 import csv
 import logging
 from io import StringIO
@@ -15,15 +16,26 @@ from scrapy.selector import Selector
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterator
 
+    from _typeshed import SupportsRead
+
 logger = logging.getLogger(__name__)
 
 
 def xmliter_lxml(
-    obj: Response | str | bytes,
+    obj: Response | str | bytes | SupportsRead[bytes],
     nodename: str,
     namespace: str | None = None,
     prefix: str = "x",
 ) -> Iterator[Selector]:
+    """Return an iterator of :class:`~scrapy.Selector` objects for the
+    *nodename* nodes of the given XML object.
+
+    *obj* can be a :class:`~scrapy.http.Response` object, a string, UTF-8
+    bytes or a binary file-like object with UTF-8 content, like an open file
+    or a :class:`~mmap.mmap` object. It is read in chunks, and parsed nodes
+    are discarded once yielded, so that memory usage depends on the size of
+    the nodes, not on the size of the whole document.
+    """
     reader = _StreamReader(obj)
     tag = f"{{{namespace}}}{nodename}" if namespace else nodename
     iterable = etree.iterparse(
@@ -54,34 +66,66 @@ def xmliter_lxml(
         if node.tag != tag:
             continue
         nodetext = etree.tostring(node, encoding="unicode")
-        node.clear()
+        _discard(node, tag)
         xs = Selector(text=nodetext, type="xml")
         if namespace:
             xs.register_namespace(prefix, namespace)
         yield xs.xpath(selxpath)[0]
 
 
+def _discard(node: etree._Element, tag: str) -> None:
+    """Free the memory used by *node* and by its already parsed preceding
+    siblings, unless it is inside another *tag* node that is still to be
+    yielded."""
+    node.clear()
+    if next(node.iterancestors(tag), None) is not None:
+        return
+    parent = node.getparent()
+    if parent is None:
+        return
+    while node.getprevious() is not None:
+        del parent[0]
+
+
 class _StreamReader:
-    def __init__(self, obj: Response | str | bytes):
+    def __init__(
+        self, obj: Response | str | bytes | SupportsRead[bytes], lstrip: bool = True
+    ):
         self._ptr: int = 0
-        self._text: str | bytes
+        self._text: str | bytes = b""
+        self._file: SupportsRead[bytes] | None = None
         if isinstance(obj, TextResponse):
             self._text, self.encoding = obj.body, obj.encoding
         elif isinstance(obj, Response):
             self._text, self.encoding = obj.body, "utf-8"
-        else:
+        elif isinstance(obj, (str, bytes)):
             self._text, self.encoding = obj, "utf-8"
+        elif hasattr(obj, "read"):
+            self._file, self.encoding = obj, "utf-8"
+        else:
+            raise TypeError(
+                f"Object {obj!r} must be Response, str, bytes or a binary "
+                f"file-like object, not {type(obj).__name__}"
+            )
         self._is_unicode: bool = isinstance(self._text, str)
-        self._is_first_read: bool = True
+        self._is_first_read: bool = lstrip
 
     def read(self, n: int = 65535) -> bytes:
-        method: Callable[[int], bytes] = (
-            self._read_unicode if self._is_unicode else self._read_string
-        )
+        method: Callable[[int], bytes]
+        if self._file is not None:
+            method = self._file.read
+        elif self._is_unicode:
+            method = self._read_unicode
+        else:
+            method = self._read_string
         result = method(n)
         if self._is_first_read:
             self._is_first_read = False
             result = result.lstrip()
+            # A first chunk made only of whitespace would be taken as the end
+            # of the stream.
+            while not result and (chunk := method(n)):
+                result = chunk.lstrip()
         return result
 
     def _read_string(self, n: int = 65535) -> bytes:
@@ -95,8 +139,38 @@ class _StreamReader:
         return cast("str", self._text)[s:e].encode("utf-8")
 
 
+def _iter_lines(obj: Response | str | bytes | SupportsRead[bytes]) -> Iterator[str]:
+    """Iterate over the lines of *obj*, decoding it in chunks."""
+    if isinstance(obj, str):
+        yield from StringIO(obj)
+        return
+    reader = _StreamReader(obj, lstrip=False)
+    # Decode like TextResponse.text for text responses, and strictly otherwise.
+    is_text = isinstance(obj, TextResponse)
+    decoder = codecs.getincrementaldecoder(reader.encoding)(
+        "replace" if is_text else "strict"
+    )
+    pending = ""
+    strip_bom = is_text
+    while True:
+        data = reader.read()
+        text = decoder.decode(data, final=not data)
+        if strip_bom and text:
+            text = text.removeprefix("\ufeff")
+            strip_bom = False
+        *lines, last = text.split("\n")
+        for line in lines:
+            yield pending + line + "\n"
+            pending = ""
+        pending += last
+        if not data:
+            break
+    if pending:
+        yield pending
+
+
 def csviter(
-    obj: Response | str | bytes,
+    obj: Response | str | bytes | SupportsRead[bytes],
     delimiter: str | None = None,
     headers: list[str] | None = None,
     encoding: str | None = None,
@@ -108,6 +182,11 @@ def csviter(
     - a Response object
     - a unicode string
     - a string encoded as utf-8
+    - a binary file-like object with utf-8 content, like an open file or an
+      mmap object
+
+    obj is decoded and parsed in chunks, so that memory usage depends on the
+    size of the rows, not on the size of the whole object.
 
     delimiter is the character used to separate fields on the given obj.
 
@@ -125,7 +204,7 @@ def csviter(
             stacklevel=2,
         )
 
-    lines = StringIO(_body_or_str(obj, unicode=True))
+    lines = _iter_lines(obj)
 
     kwargs: dict[str, Any] = {}
     if delimiter:
@@ -12,12 +12,11 @@ from typing import TYPE_CHECKING, Any, Protocol
 from urllib.parse import urlunparse
 from weakref import WeakKeyDictionary
 
-from w3lib.url import canonicalize_url
-
 from scrapy import Request, Spider
 from scrapy.utils.httpobj import urlparse_cached
 from scrapy.utils.misc import load_object
 from scrapy.utils.python import to_bytes, to_unicode
+from scrapy.utils.url import canonicalize_url_cached
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -97,7 +96,7 @@ def fingerprint(
         if verbatim_url:
             url = request.url
         else:
-            url = canonicalize_url(request.url, keep_fragments=keep_fragments)
+            url = canonicalize_url_cached(request.url, keep_fragments=keep_fragments)
         fingerprint_data = {
             "method": to_unicode(request.method),
             "url": url,
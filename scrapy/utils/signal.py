@@ -3,20 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
 import warnings
-from collections.abc import Awaitable, Callable, Generator, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
+from functools import partial
 from typing import Any as TypingAny
 from typing import cast
 
 from pydispatch.dispatcher import (
+    WEAKREF_TYPES,
     Anonymous,
     Any,
+    connections,
     disconnect,
     getAllReceivers,
     liveReceivers,
 )
-from pydispatch.robustapply import robustApply
+from pydispatch.robustapply import function, robustApply
 from twisted.internet.defer import Deferred, DeferredList, inlineCallbacks
 from twisted.python.failure import Failure
 
@@ -42,35 +46,150 @@ def send_catch_log(
     """Like ``pydispatch.robust.sendRobust()`` but it also logs errors and returns
     Failures instead of exceptions.
     """
-    dont_log = named.pop("dont_log", ())
+    dont_log = _get_dont_log(named)
+    spider = named.get("spider")
+    return [
+        (
+            receiver,
+            _call_catch_log(
+                receiver,
+                robustApply,
+                (receiver, *arguments),
+                {"signal": signal, "sender": sender, **named},
+                dont_log,
+                spider,
+            ),
+        )
+        for receiver in liveReceivers(getAllReceivers(sender, signal))
+    ]
+
+
+def _get_dont_log(named: dict[str, TypingAny]) -> tuple[type[Exception], ...]:
+    if "dont_log" not in named:
+        return (StopDownload,)
+    dont_log = named.pop("dont_log")
     dont_log = tuple(dont_log) if isinstance(dont_log, Sequence) else (dont_log,)
-    dont_log += (StopDownload,)
+    return (*dont_log, StopDownload)
+
+
+def _call_catch_log(
+    receiver: TypingAny,
+    func: Callable[..., TypingAny],
+    args: tuple[TypingAny, ...],
+    kwargs: dict[str, TypingAny],
+    dont_log: tuple[type[Exception], ...],
+    spider: TypingAny,
+) -> TypingAny:
+    """Call a signal handler through *func* for :func:`send_catch_log`, and
+    return its result or a Failure."""
+    try:
+        response = func(*args, **kwargs)
+    except dont_log:
+        return Failure()
+    except Exception:
+        logger.error(
+            "Error caught on signal handler: %(receiver)s",
+            {"receiver": receiver},
+            exc_info=True,
+            extra={"spider": spider},
+        )
+        return Failure()
+    if response is not None and isinstance(response, Deferred):
+        logger.error(
+            "Cannot return deferreds from signal handler: %(receiver)s",
+            {"receiver": receiver},
+            extra={"spider": spider},
+        )
+    return response
+
+
+class _CompiledReceiver:
+    """A signal handler with the keyword arguments that it accepts resolved in
+    advance, so that sending a signal does not need the signature
+    introspection of ``robustApply()``.
+
+    Handlers connected as weak references are only referenced weakly here as
+    well.
+    """
+
+    __slots__ = ("_names", "_ref", "_robust", "_weak")
+
+    def __init__(self, ref: TypingAny, receiver: TypingAny):
+        self._ref: TypingAny = ref
+        self._weak: bool = isinstance(ref, WEAKREF_TYPES)
+        #: Names of the keyword arguments to pass, or ``None`` to pass all of
+        #: them because the handler takes ``**kwargs``.
+        self._names: frozenset[str] | None = None
+        self._robust: bool = False
+        try:
+            _, code, start_index = function(receiver)
+        except ValueError:
+            # Let robustApply() raise the error when the signal is sent
+            self._robust = True
+            return
+        if not code.co_flags & inspect.CO_VARKEYWORDS:
+            self._names = frozenset(code.co_varnames[start_index : code.co_argcount])
+
+    def resolve(self) -> TypingAny:
+        """Return the handler, or ``None`` if it has been garbage-collected."""
+        return self._ref() if self._weak else self._ref
+
+    def apply(self, receiver: TypingAny, **named: TypingAny) -> TypingAny:
+        if self._robust:
+            return robustApply(receiver, **named)
+        if (names := self._names) is None:
+            return receiver(**named)
+        return receiver(**{k: v for k, v in named.items() if k in names})
+
+
+def _get_routes(sender: TypingAny, signal: TypingAny) -> tuple[TypingAny, ...]:
+    """Return the entries of the pydispatcher routing table that
+    :func:`~pydispatch.dispatcher.getAllReceivers` would read for *sender* and
+    *signal*.
+
+    Receivers are connected, disconnected and garbage-collected by updating
+    those entries, so the result changes whenever the receivers of the signal
+    may have changed.
+    """
+    routes: list[TypingAny] = []
+    for senderkey in (id(sender), id(Any)):
+        if signals := connections.get(senderkey):
+            routes.extend(signals.get(signal, ()))
+            routes.extend(signals.get(Any, ()))
+    return tuple(routes)
+
+
+def _compile_receivers(
+    sender: TypingAny, signal: TypingAny
+) -> tuple[_CompiledReceiver, ...]:
+    compiled = []
+    for ref in getAllReceivers(sender, signal):
+        receiver = ref() if isinstance(ref, WEAKREF_TYPES) else ref
+        if receiver is not None:
+            compiled.append(_CompiledReceiver(ref, receiver))
+    return tuple(compiled)
+
+
+def _send_compiled(
+    receivers: Iterable[_CompiledReceiver],
+    signal: TypingAny,
+    sender: TypingAny,
+    **named: TypingAny,
+) -> list[tuple[TypingAny, TypingAny]]:
+    """Like :func:`send_catch_log`, for receivers from
+    :func:`_compile_receivers`."""
+    dont_log = _get_dont_log(named)
     spider = named.get("spider")
+    named["signal"] = signal
+    named["sender"] = sender
     responses: list[tuple[TypingAny, TypingAny]] = []
-    for receiver in liveReceivers(getAllReceivers(sender, signal)):
-        result: TypingAny
-        try:
-            response = robustApply(
-                receiver, *arguments, signal=signal, sender=sender, **named
-            )
-            if isinstance(response, Deferred):
-                logger.error(
-                    "Cannot return deferreds from signal handler: %(receiver)s",
-                    {"receiver": receiver},
-                    extra={"spider": spider},
-                )
-        except dont_log:
-            result = Failure()
-        except Exception:
-            result = Failure()
-            logger.error(
-                "Error caught on signal handler: %(receiver)s",
-                {"receiver": receiver},
-                exc_info=True,
-                extra={"spider": spider},
-            )
-        else:
-            result = response
+    for compiled in receivers:
+        receiver = compiled.resolve()
+        if receiver is None:
+            continue
+        result = _call_catch_log(
+            receiver, compiled.apply, (receiver,), named, dont_log, spider
+        )
         responses.append((receiver, result))
     return responses
 
@@ -180,40 +299,82 @@ async def _send_catch_log_asyncio(
     dont_log = named.pop("dont_log", ())
     dont_log = tuple(dont_log) if isinstance(dont_log, Sequence) else (dont_log,)
     spider = named.get("spider")
-    handlers: list[Awaitable[TypingAny]] = []
-    for receiver in liveReceivers(getAllReceivers(sender, signal)):
+    return await _gather_catch_log(
+        [
+            (
+                receiver,
+                partial(
+                    robustApply,
+                    receiver,
+                    *arguments,
+                    signal=signal,
+                    sender=sender,
+                    **named,
+                ),
+            )
+            for receiver in liveReceivers(getAllReceivers(sender, signal))
+        ],
+        dont_log,
+        spider,
+    )
 
-        async def handler(
-            receiver: Callable[..., Any],
-        ) -> tuple[Callable[..., Any], TypingAny]:
-            result: TypingAny
-            try:
-                result = await ensure_awaitable(
-                    robustApply(
-                        receiver, *arguments, signal=signal, sender=sender, **named
-                    ),
-                    _warn=global_object_name(receiver),
-                )
-            except dont_log as ex:  # pylint: disable=catching-non-exception
-                result = ex
-            except Exception as ex:
-                logger.error(
-                    "Error caught on signal handler: %(receiver)s",
-                    {"receiver": receiver},
-                    exc_info=True,
-                    extra={"spider": spider},
-                )
-                result = ex
-            return (receiver, result)
-
-        handlers.append(handler(receiver))
+
+async def _gather_catch_log(
+    calls: Iterable[tuple[TypingAny, Callable[[], TypingAny]]],
+    dont_log: tuple[type[Exception], ...],
+    spider: TypingAny,
+) -> list[tuple[TypingAny, TypingAny]]:
+    """Run the signal handler calls of :func:`_send_catch_log_asyncio`
+    concurrently, and return their results or exceptions."""
+
+    async def handler(
+        receiver: Callable[..., Any], call: Callable[[], TypingAny]
+    ) -> tuple[Callable[..., Any], TypingAny]:
+        result: TypingAny
+        try:
+            result = await ensure_awaitable(call(), _warn=global_object_name(receiver))
+        except dont_log as ex:  # pylint: disable=catching-non-exception
+            result = ex
+        except Exception as ex:
+            logger.error(
+                "Error caught on signal handler: %(receiver)s",
+                {"receiver": receiver},
+                exc_info=True,
+                extra={"spider": spider},
+            )
+            result = ex
+        return (receiver, result)
 
     return cast(
         "list[tuple[TypingAny, TypingAny]]",
-        await asyncio.gather(*handlers, return_exceptions=True),
+        await asyncio.gather(
+            *(handler(receiver, call) for receiver, call in calls),
+            return_exceptions=True,
+        ),
     )
 
 
+async def _send_compiled_asyncio(
+    receivers: Iterable[_CompiledReceiver],
+    signal: TypingAny,
+    sender: TypingAny,
+    **named: TypingAny,
+) -> list[tuple[TypingAny, TypingAny]]:
+    """Like :func:`_send_catch_log_asyncio`, for receivers from
+    :func:`_compile_receivers`."""
+    dont_log = named.pop("dont_log", ())
+    dont_log = tuple(dont_log) if isinstance(dont_log, Sequence) else (dont_log,)
+    spider = named.get("spider")
+    named["signal"] = signal
+    named["sender"] = sender
+    calls = [
+        (receiver, partial(compiled.apply, receiver, **named))
+        for compiled in receivers
+        if (receiver := compiled.resolve()) is not None
+    ]
+    return await _gather_catch_log(calls, dont_log, spider)
+
+
 def disconnect_all(signal: TypingAny = Any, sender: TypingAny = Any) -> None:
     """Disconnect all signal handlers. Useful for cleaning up after running
     tests.
@@ -19,14 +19,20 @@ from scrapy.exceptions import ScrapyDeprecationWarning
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
 
+    from _typeshed import SupportsRead
+
 
 class Sitemap:
     """Class to parse Sitemap (type=urlset) and Sitemap Index
-    (type=sitemapindex) files"""
+    (type=sitemapindex) files
+
+    *xmltext* may also be a binary file-like object, which is read as entries
+    are iterated, so that huge sitemaps do not need to be loaded into memory.
+    """
 
     __slots__ = ("type", "xmliter")
 
-    def __init__(self, xmltext: str | bytes):
+    def __init__(self, xmltext: str | bytes | SupportsRead[bytes]):
         if isinstance(xmltext, str):
             warnings.warn(
                 "Passing `str` type as `xmltext` is deprecated, use `bytes`",
@@ -35,8 +41,9 @@ class Sitemap:
             )
             xmltext = xmltext.encode()
 
+        source = BytesIO(xmltext) if isinstance(xmltext, bytes) else xmltext
         self.xmliter = lxml.etree.iterparse(
-            BytesIO(xmltext),
+            source,
             recover=True,
             remove_comments=True,
             resolve_entities=False,
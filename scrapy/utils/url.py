@@ -6,25 +6,59 @@ library.
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, TypeAlias
-from urllib.parse import ParseResult, urlparse, urlunparse
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Any, TypeAlias
+from urllib.parse import ParseResult, urljoin, urlparse, urlunparse
 
-from w3lib.url import any_to_uri, parse_url
+from w3lib.url import any_to_uri, canonicalize_url, parse_url, safe_url_string
+
+from scrapy.utils.datatypes import LocalCache
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
+    from collections.abc import Set as AbstractSet
 
     from scrapy import Spider
 
 UrlT: TypeAlias = str | bytes | ParseResult
 
 
+def _is_from_domains(host: str, domains: AbstractSet[str]) -> bool:
+    """Return whether *host* is one of *domains* or a subdomain of one of them.
+
+    Only the suffixes of *host* that start after a dot are looked up in
+    *domains*, so the cost does not depend on the number of domains. Both
+    *host* and *domains* must be lowercase.
+    """
+    if not host:
+        return False
+    if host in domains:
+        return True
+    index = host.find(".")
+    while index != -1:
+        if host[index + 1 :] in domains:
+            return True
+        index = host.find(".", index + 1)
+    return False
+
+
+# Lowercase domain sets of recent url_is_from_any_domain() calls, so that
+# calls with the same, possibly long, list of domains do not rebuild them.
+_domain_sets: LocalCache[tuple[str, ...], frozenset[str]] = LocalCache(100)
+
+
 def url_is_from_any_domain(url: UrlT, domains: Iterable[str]) -> bool:
     """Return True if the url belongs to any of the given domains"""
     host = parse_url(url).netloc.lower()
     if not host:
         return False
-    return any((host == d) or (host.endswith(f".{d}")) for d in map(str.lower, domains))
+    domains = tuple(domains)
+    domain_set = _domain_sets.get(domains)
+    if domain_set is None:
+        domain_set = frozenset(map(str.lower, domains))
+        _domain_sets[domains] = domain_set
+    return _is_from_domains(host, domain_set)
 
 
 def _spider_domains(spider: type[Spider]) -> Iterable[str]:
@@ -152,3 +186,114 @@ def strip_url(
             "" if strip_fragment else parsed_url.fragment,
         )
     )
+
+
+class _URLCache:
+    """Bounded least-recently-used cache of the results of *func*.
+
+    Calling the cache with some positional arguments returns the result of
+    calling *func* with them, which is computed once for as long as they stay
+    among the *maxsize* most recently used ones. A *maxsize* of ``0``
+    disables caching.
+
+    :attr:`hits` and :attr:`misses` count lookups, for stats.
+
+    The cache can be used from multiple threads, e.g. by callbacks run in a
+    thread pool (see :setting:`CALLBACK_EXECUTOR`).
+    """
+
+    def __init__(self, func: Callable[..., str], maxsize: int = 10000):
+        self.func: Callable[..., str] = func
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._results: OrderedDict[tuple[Any, ...], str] = OrderedDict()
+        self._lock: Lock = Lock()
+
+    def __call__(self, *args: Any) -> str:
+        with self._lock:
+            try:
+                result = self._results[args]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._results.move_to_end(args)
+                self.hits += 1
+                return result
+        result = self.func(*args)
+        with self._lock:
+            if self.maxsize > 0:
+                self._results[args] = result
+                if len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
+        return result
+
+    def resize(self, maxsize: int) -> None:
+        """Set :attr:`maxsize`, dropping the least recently used results that
+        no longer fit."""
+        with self._lock:
+            self.maxsize = max(maxsize, 0)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+
+def _canonicalize_url(url: str, keep_fragments: bool) -> str:
+    return canonicalize_url(url, keep_fragments=keep_fragments)
+
+
+_canonicalize_url_cache = _URLCache(_canonicalize_url)
+_safe_url_string_cache = _URLCache(safe_url_string)
+_urljoin_cache = _URLCache(urljoin)
+_url_caches = (_canonicalize_url_cache, _safe_url_string_cache, _urljoin_cache)
+#: Largest URL_CACHE_SIZE of the crawlers created so far.
+_url_cache_size: int | None = None
+
+
+def canonicalize_url_cached(url: str, keep_fragments: bool = False) -> str:
+    """Return :func:`w3lib.url.canonicalize_url(url,
+    keep_fragments=keep_fragments) <w3lib.url.canonicalize_url>`, caching
+    results.
+
+    This, :func:`safe_url_string_cached` and :func:`urljoin_cached` keep the
+    most recently used results each, shared by all crawlers of the process,
+    up to the largest :setting:`URL_CACHE_SIZE` of those crawlers.
+    """
+    return _canonicalize_url_cache(url, keep_fragments)
+
+
+def safe_url_string_cached(url: str, encoding: str = "utf8") -> str:
+    """Return :func:`w3lib.url.safe_url_string(url, encoding)
+    <w3lib.url.safe_url_string>`, caching results."""
+    return _safe_url_string_cache(url, encoding)
+
+
+def urljoin_cached(base: str, url: str) -> str:
+    """Return :func:`urllib.parse.urljoin(base, url) <urllib.parse.urljoin>`,
+    caching results."""
+    return _urljoin_cache(base, url)
+
+
+def _set_url_cache_size(maxsize: int) -> None:
+    """Resize the URL caches for a new crawler.
+
+    The caches are shared by all crawlers of the process, so crawlers can only
+    make them bigger than previous crawlers did.
+    """
+    global _url_cache_size  # noqa: PLW0603
+    if _url_cache_size is not None and maxsize <= _url_cache_size:
+        return
+    _url_cache_size = maxsize
+    for cache in _url_caches:
+        cache.resize(maxsize)
+
+
+def _get_url_cache_lookups() -> tuple[int, int]:
+    """Return the number of hits and misses of all URL caches."""
+    return (
+        sum(cache.hits for cache in _url_caches),
+        sum(cache.misses for cache in _url_caches),
+    )
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from scrapy import Request, Spider
+from scrapy.core.downloader.middleware import DownloaderMiddlewareManager
+from scrapy.http import Response
+from scrapy.utils.test import get_crawler
+
+if TYPE_CHECKING:
+    from pytest_codspeed import BenchmarkFixture  # type: ignore[import-not-found]
+
+pytest.importorskip("pytest_codspeed", reason="Benchmarks require pytest-codspeed")
+
+REQUESTS = 100
+
+
+def test_default_downloader_middlewares(benchmark: BenchmarkFixture) -> None:
+    """Requests and responses going through the default downloader
+    middlewares."""
+    crawler = get_crawler(Spider)
+    crawler.spider = crawler._create_spider("benchmark")
+    crawler.stats.open_spider()
+    manager = DownloaderMiddlewareManager.from_crawler(crawler)
+    loop = asyncio.new_event_loop()
+
+    async def download(request: Request) -> Response:
+        return Response(request.url, request=request)
+
+    async def download_all() -> None:
+        for index in range(REQUESTS):
+            request = Request(f"https://www.example.com/{index}")
+            assert isinstance(await manager.download_async(download, request), Response)
+
+    try:
+        benchmark(lambda: loop.run_until_complete(download_all()))
+    finally:
+        loop.close()
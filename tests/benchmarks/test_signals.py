@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from scrapy import Request, signals
+from scrapy.http import Response
+from scrapy.signalmanager import SignalManager
+
+if TYPE_CHECKING:
+    from pytest_codspeed import BenchmarkFixture  # type: ignore[import-not-found]
+
+pytest.importorskip("pytest_codspeed", reason="Benchmarks require pytest-codspeed")
+
+REQUEST = Request("https://www.example.com/")
+RESPONSE = Response(REQUEST.url, request=REQUEST)
+
+# Body chunks of a response, each of them sent with the bytes_received signal.
+CHUNKS = 10
+
+
+class _Extension:
+    def request_reached_downloader(self, request: Request, spider: Any) -> None:
+        pass
+
+    def response_downloaded(
+        self, response: Response, request: Request, spider: Any
+    ) -> None:
+        pass
+
+    def request_left_downloader(self, request: Request, spider: Any) -> None:
+        pass
+
+
+@pytest.mark.parametrize("receivers", [0, 1, 4])
+def test_per_request_signals(benchmark: BenchmarkFixture, receivers: int) -> None:
+    """The signals sent by the downloader for every request.
+
+    There are no receivers of :signal:`bytes_received`, as in most crawls, so
+    the scenario also covers the sends of signals without receivers.
+    """
+    manager = SignalManager(object())
+    extensions = [_Extension() for _ in range(receivers)]
+    for extension in extensions:
+        manager.connect(
+            extension.request_reached_downloader, signals.request_reached_downloader
+        )
+        manager.connect(extension.response_downloaded, signals.response_downloaded)
+        manager.connect(
+            extension.request_left_downloader, signals.request_left_downloader
+        )
+    spider = object()
+
+    def run() -> None:
+        manager.send_catch_log(
+            signals.request_reached_downloader, request=REQUEST, spider=spider
+        )
+        for _ in range(CHUNKS):
+            manager.send_catch_log(
+                signals.bytes_received, data=b"", request=REQUEST, spider=spider
+            )
+        manager.send_catch_log(
+            signals.response_downloaded,
+            response=RESPONSE,
+            request=REQUEST,
+            spider=spider,
+        )
+        manager.send_catch_log(
+            signals.request_left_downloader, request=REQUEST, spider=spider
+        )
+
+    benchmark(run)
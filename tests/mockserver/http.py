@@ -28,6 +28,7 @@ from .http_resources import (
     ForeverTakingResource,
     H2DataAndReset,
     H2GoAway,
+    H2GoAwayDrain,
     H2NoSupport,
     H2Push,
     H2Raw,
@@ -104,6 +105,7 @@ class Root(BaseResource):
         put_child(self, b"h2-reset-stream", H2ResetStream())
         put_child(self, b"h2-data-and-reset", H2DataAndReset())
         put_child(self, b"h2-goaway", H2GoAway())
+        put_child(self, b"h2-goaway-drain", H2GoAwayDrain())
         put_child(self, b"h2-raw", H2Raw())
         put_child(self, b"h2-no-support", H2NoSupport())
         put_child(self, b"h2-push", H2Push())
@@ -493,15 +493,33 @@ class H2ResetStream(LeafResource):
 
 class H2GoAway(LeafResource):
     """End the HTTP/2 connection of the request with a GOAWAY frame instead of
-    answering it"""
+    answering it, telling the client that the request was not processed"""
 
     def render_GET(self, request: Request) -> int:
         connection = _h2_connection(request).conn
-        connection.close_connection()
+        connection.close_connection(last_stream_id=0)
         _h2_write(request, connection.data_to_send())
         return NOT_DONE_YET
 
 
+class H2GoAwayDrain(LeafResource):
+    """Send a graceful GOAWAY frame that includes the stream of the request
+    and then answer the request"""
+
+    def render_GET(self, request: Request) -> int:
+        stream_id = cast("H2Stream", request.channel).streamID
+        # GOAWAY with the NO_ERROR code, written directly so that the server
+        # side of the connection can still answer the request
+        _h2_write(request, _h2_frame(0x7, stream_id.to_bytes(4, "big") + bytes(4)))
+        self.deferRequest(request, 0.1, self._delayed_render, request)
+        return NOT_DONE_YET
+
+    @staticmethod
+    def _delayed_render(request: Request) -> None:
+        request.write(b"Works")
+        request.finish()
+
+
 class H2DataAndReset(LeafResource):
     """Answer the request with response headers and then, within a single write,
     a data frame and a reset of its HTTP/2 stream"""
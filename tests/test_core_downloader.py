@@ -69,6 +69,54 @@ class TestSlot:
         slot = Slot(concurrency=8, delay=0.1, randomize_delay=True)
         assert repr(slot) == "Slot(concurrency=8, delay=0.1, randomize_delay=True)"
 
+    def test_record_timing(self):
+        slot = Slot(concurrency=8, delay=0, randomize_delay=False)
+        assert slot.average_timing() == {}
+        slot.record_timing(
+            {
+                "dns": 0.1,
+                "connect": 0.2,
+                "tls": None,
+                "ttfb": 0.5,
+                "transfer": 0.1,
+                "total": 0.9,
+                "connection_reused": False,
+            }
+        )
+        slot.record_timing(
+            {
+                "dns": None,
+                "connect": None,
+                "tls": None,
+                "ttfb": 0.3,
+                "transfer": 0.3,
+                "total": 0.6,
+                "connection_reused": True,
+            }
+        )
+        assert slot.timed_responses == 2
+        assert slot.reused_connections == 1
+        assert slot.average_timing() == pytest.approx(
+            {"dns": 0.1, "connect": 0.2, "ttfb": 0.4, "transfer": 0.2, "total": 0.75}
+        )
+
+
+def test_download_timing_stats() -> None:
+    crawler = get_crawler(DefaultSpider)
+    downloader = Downloader(crawler)
+    downloader._record_timing_stats(
+        {"connect": 0.2, "tls": None, "total": 0.9, "connection_reused": False}
+    )
+    downloader._record_timing_stats(
+        {"connect": None, "tls": None, "total": 0.6, "connection_reused": True}
+    )
+    assert crawler.stats.get_stats() == {
+        "downloader/timing/response_count": 2,
+        "downloader/timing/reused_connection_count": 1,
+        "downloader/timing/connect": 0.2,
+        "downloader/timing/total": 0.75,
+    }
+
 
 @pytest.mark.requires_reactor  # this test is related to the Twisted HTTP code
 class TestContextFactoryBase:
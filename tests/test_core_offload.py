@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import os
+from threading import Lock, current_thread
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from scrapy import Request, Spider, signals
+from scrapy.core.offload import (
+    _SHARED_MEMORY_MIN_SIZE,
+    callback_executor,
+    get_callback_executor,
+)
+from scrapy.utils.test import get_crawler
+from tests.utils.decorators import coroutine_test
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from scrapy.http import Response
+
+
+class ProcessSpider(Spider):
+    name = "process"
+    custom_settings = {"CALLBACK_PROCESS_POOL_SIZE": 1}
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.lock = Lock()  # cannot be pickled
+        self.foo = "bar"
+
+    async def start(self):
+        for url in self.start_urls:
+            yield Request(url, cb_kwargs={"index": 1})
+
+    @callback_executor("process")
+    def parse(self, response: Response, index: int):
+        yield {
+            "pid": os.getpid(),
+            "foo": self.foo,
+            "lock": hasattr(self, "lock"),
+            "size": len(response.body),
+            "index": index,
+        }
+        yield response.follow(
+            response.url, self.parse_local, dont_filter=True, cb_kwargs={"index": 2}
+        )
+        raise ValueError("foo")
+
+    def parse_local(self, response: Response, index: int):
+        yield {"pid": os.getpid(), "index": index}
+
+
+class ThreadSpider(Spider):
+    name = "thread"
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.lock = Lock()
+
+    @callback_executor("thread")
+    def parse(self, response: Response):
+        yield {
+            "thread": current_thread().name,
+            "lock": self.lock,
+            "size": len(response.body),
+            "index": 1,
+        }
+        yield response.follow(response.url, self.parse_local, dont_filter=True)
+        raise ValueError("foo")
+
+    def parse_local(self, response: Response):
+        yield {"thread": current_thread().name, "index": 2}
+
+
+async def crawl(
+    spider_cls: type[Spider], url: str, executor: str = "process"
+) -> list[dict[str, Any]]:
+    items: list[dict[str, Any]] = []
+    crawler = get_crawler(spider_cls)
+
+    def on_item_scraped(item: dict[str, Any]) -> None:
+        items.append(item)
+
+    crawler.signals.connect(on_item_scraped, signal=signals.item_scraped)
+    await crawler.crawl_async(start_urls=[url])
+    assert crawler.stats
+    assert crawler.stats.get_value(f"callback_executor/{executor}/count") == 1
+    return sorted(items, key=lambda item: item["index"])
+
+
+@pytest.mark.parametrize("size", [10, _SHARED_MEMORY_MIN_SIZE])
+@coroutine_test
+async def test_process(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture, size: int
+) -> None:
+    path = tmp_path / "page.html"
+    path.write_bytes(b"a" * size)
+    items = await crawl(ProcessSpider, path.as_uri())
+    assert items == [
+        {
+            "pid": items[0]["pid"],
+            "foo": "bar",
+            "lock": False,
+            "size": size,
+            "index": 1,
+        },
+        {"pid": os.getpid(), "index": 2},
+    ]
+    assert items[0]["pid"] != os.getpid()
+    assert "ValueError: foo" in caplog.text
+    assert 'raise ValueError("foo")' in caplog.text
+
+
+@coroutine_test
+async def test_thread(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    path = tmp_path / "page.html"
+    path.write_bytes(b"a" * 10)
+    items = await crawl(ThreadSpider, path.as_uri(), "thread")
+    assert items[0]["thread"].startswith("scrapy-callback")
+    assert isinstance(items[0]["lock"], type(Lock()))
+    assert items[0]["size"] == 10
+    assert items[1] == {"thread": current_thread().name, "index": 2}
+    assert "ValueError: foo" in caplog.text
+
+
+def test_callback_executor_invalid():
+    with pytest.raises(ValueError, match="Unknown callback executor"):
+        callback_executor("foo")
+
+
+class ExecutorSpider(Spider):
+    name = "executor"
+
+    def parse(self, response):
+        pass
+
+    @callback_executor(None)
+    def parse_none(self, response):
+        pass
+
+    @callback_executor("process")
+    def parse_process(self, response):
+        pass
+
+    @callback_executor("thread")
+    def parse_thread(self, response):
+        pass
+
+    async def parse_async(self, response):
+        pass
+
+
+@pytest.mark.parametrize(
+    ("meta", "callback", "default", "expected"),
+    [
+        ({}, "parse", None, None),
+        ({}, "parse", "process", "process"),
+        ({}, "parse_none", "process", None),
+        ({}, "parse_process", None, "process"),
+        ({}, "parse_thread", "process", "thread"),
+        ({"callback_executor": "thread"}, "parse_process", None, "thread"),
+        ({"callback_executor": None}, "parse_process", None, None),
+        ({"callback_executor": "process"}, "parse_none", None, "process"),
+        ({}, "parse_async", "process", None),
+        ({"callback_executor": None}, "parse_async", "process", None),
+    ],
+)
+def test_get_callback_executor(meta, callback, default, expected):
+    spider = ExecutorSpider()
+    request = Request("https://example.com", meta=meta)
+    assert (
+        get_callback_executor(request, getattr(spider, callback), default) == expected
+    )
+
+
+@pytest.mark.parametrize(
+    ("meta", "callback", "match"),
+    [
+        ({"callback_executor": "foo"}, "parse", "Unknown callback executor"),
+        ({"callback_executor": "process"}, "parse_async", "only synchronous"),
+    ],
+)
+def test_get_callback_executor_invalid(meta, callback, match):
+    spider = ExecutorSpider()
+    request = Request("https://example.com", meta=meta)
+    with pytest.raises(ValueError, match=match):
+        get_callback_executor(request, getattr(spider, callback), None)
+
+
+@coroutine_test
+async def test_setting_invalid() -> None:
+    crawler = get_crawler(ExecutorSpider, {"CALLBACK_EXECUTOR": "foo"})
+    with pytest.raises(ValueError, match="Invalid CALLBACK_EXECUTOR"):
+        await crawler.crawl_async()
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
 
+import pytest
+from twisted.internet.defer import Deferred, succeed
+from twisted.python.failure import Failure
+
+from scrapy.core.scraper import Scraper, Slot, _AdaptiveConcurrentItems, _OutputTimer
+from scrapy.http import HtmlResponse, Request, Response, TextResponse
 from scrapy.utils.test import get_crawler
-from tests.spiders import SimpleSpider
+from tests.spiders import ItemSpider, SimpleSpider
 from tests.utils.decorators import coroutine_test
 
 if TYPE_CHECKING:
-    import pytest
-
     from tests.mockserver.http import MockServer
 
 
@@ -25,3 +31,210 @@ async def test_scraper_exception(
     )
     await crawler.crawl_async(url=mockserver.url("/"))
     assert "Scraper bug processing" in caplog.text
+
+
+BODY = b"<html><body>" + b"<p>foo</p>" * 1000 + b"</body></html>"
+
+
+@pytest.mark.parametrize(
+    ("result", "expected"),
+    [
+        (Response("https://example.com", body=BODY), len(BODY)),
+        (Response("https://example.com", body=b"foo"), Slot.MIN_RESPONSE_SIZE),
+        (Failure(ValueError()), Slot.MIN_RESPONSE_SIZE),
+    ],
+)
+@pytest.mark.parametrize("estimate_memory", [False, True])
+def test_slot_response_size(result, expected, estimate_memory):
+    slot = Slot(estimate_memory=estimate_memory)
+    assert slot.response_size(result) == expected
+
+
+def test_slot_response_size_estimate_memory():
+    slot = Slot()
+    html = HtmlResponse("https://example.com", body=BODY)
+    assert slot.response_size(html) == len(BODY)
+
+    slot = Slot(estimate_memory=True)
+    text = TextResponse("https://example.com", body=BODY)
+    assert slot.response_size(text) == 2 * len(BODY)
+    text = TextResponse("https://example.com", body="é".encode() + BODY)
+    assert slot.response_size(text) == 3 * len(text.body)
+    assert slot.response_size(html) == (
+        3 * len(BODY) + Slot.TREE_NODE_SIZE * BODY.count(b"<")
+    )
+
+
+def test_slot_item_size():
+    item = {"name": "foo" * 100}
+    assert Slot().item_size(item) == 0
+    assert Slot(estimate_memory=True).item_size(item) > 300
+
+
+def test_slot_active_size():
+    slot = Slot(max_active_size=4 * len(BODY), estimate_memory=True)
+    request = Request("https://example.com")
+    response = HtmlResponse(request.url, body=BODY, request=request)
+    slot.add_response_request(response, request)
+    assert slot.needs_backout()
+    slot.next_response_request_deferred()
+    response.selector
+    slot.finish_response(response, request)
+    assert slot.active_size == 0
+    assert not slot.needs_backout()
+
+
+def test_slot_response_size_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    slot = Slot(estimate_memory=True)
+    sizes = []
+    response_size = slot.response_size
+
+    def counting_response_size(result: Response | Failure) -> int:
+        size = response_size(result)
+        sizes.append(size)
+        return size
+
+    monkeypatch.setattr(slot, "response_size", counting_response_size)
+    request = Request("https://example.com")
+    response = HtmlResponse(request.url, body=BODY, request=request)
+    slot.add_response_request(response, request)
+    slot.next_response_request_deferred()
+    slot.finish_response(response, request)
+    assert len(sizes) == 1
+    assert slot.active_size == 0
+
+
+@pytest.mark.parametrize(
+    ("start", "outputs", "busy", "running", "expected"),
+    [
+        # I/O-bound, all slots busy
+        (4, 100, 4.0, 0.1, 8),
+        (1, 100, 1.0, 0.1, 2),
+        (600, 1000, 600.0, 0.1, 1000),
+        # all slots busy, but no more outputs than slots
+        (4, 4, 4.0, 0.1, 4),
+        # CPU-bound
+        (100, 1000, 1.0, 1.0, 50),
+        (1, 1000, 1.0, 1.0, 1),
+        # in between
+        (4, 100, 2.5, 0.1, 4),
+        # too little information
+        (4, 1, 4.0, 0.1, 4),
+    ],
+)
+def test_adaptive_concurrent_items(start, outputs, busy, running, expected):
+    crawler = get_crawler()
+    crawler.stats.open_spider()
+    adaptive = _AdaptiveConcurrentItems(crawler, start, 1000)
+    timer = _OutputTimer(start)
+    timer.outputs, timer.busy, timer.elapsed, timer.running = (
+        outputs,
+        busy,
+        1.0,
+        running,
+    )
+    assert adaptive.update(timer) == expected
+    if expected != start:
+        assert crawler.stats.get_value("scraper/concurrent_items") == expected
+
+
+def test_adaptive_concurrent_items_outdated():
+    crawler = get_crawler()
+    adaptive = _AdaptiveConcurrentItems(crawler, 4, 1000)
+    timer = _OutputTimer(8)
+    timer.outputs, timer.busy, timer.elapsed, timer.running = 100, 8.0, 1.0, 0.1
+    assert adaptive.update(timer) == 4
+
+
+@coroutine_test
+async def test_output_timer_running() -> None:
+    timer = _OutputTimer(2)
+
+    async def wait(output: Any, response: Response | Failure) -> None:
+        await asyncio.sleep(0.05)
+
+    def sleep() -> None:
+        time.sleep(0.05)
+
+    async def block(output: Any, response: Response | Failure) -> None:
+        sleep()
+        await asyncio.sleep(0)
+        sleep()
+
+    response = Response("https://example.com")
+    await asyncio.gather(
+        timer.wrap(wait)(None, response), timer.wrap(wait)(1, response)
+    )
+    assert timer.outputs == 2
+    assert timer.busy >= 0.1
+    assert timer.running < 0.01
+
+    timer = _OutputTimer(2)
+    await timer.wrap(block)(None, response)
+    assert timer.running >= 0.1
+    assert timer.running >= 0.9 * timer.busy
+
+    async def fail(output: Any, response: Response | Failure) -> None:
+        await asyncio.sleep(0)
+        raise ValueError
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        await timer.wrap(fail)(None, response)
+    assert timer.outputs == 2
+
+
+def test_output_timer_running_deferred() -> None:
+    timer = _OutputTimer(2)
+    waiting: Deferred[None] = Deferred()
+
+    def process(output: Any, response: Response | Failure) -> Deferred[None]:
+        if output:
+            return waiting
+        time.sleep(0.05)
+        return succeed(None)
+
+    response = Response("https://example.com")
+    timer.wrap_deferred(process)(None, response)
+    timer.wrap_deferred(process)(1, response)
+    assert timer.outputs == 1
+    assert timer.running >= 0.05
+    time.sleep(0.05)
+    waiting.callback(None)
+    assert timer.outputs == 2
+    assert timer.running < 0.9 * timer.busy
+
+
+@coroutine_test
+async def test_adaptive_concurrent_items_crawl(mockserver: MockServer) -> None:
+    crawler = get_crawler(
+        ItemSpider, {"CONCURRENT_ITEMS_ADAPTIVE": True, "CONCURRENT_ITEMS": 10}
+    )
+    await crawler.crawl_async(mockserver=mockserver)
+    assert crawler.stats
+    assert crawler.stats.get_value("scraper/concurrent_items") is not None
+    assert crawler.stats.get_value("item_scraped_count")
+
+
+@coroutine_test
+async def test_adaptive_concurrent_items_process_spidermw_output(
+    mockserver: MockServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Without asyncio, outputs go through Scraper._process_spidermw_output(),
+    which subclasses may override."""
+    calls = []
+    process_spidermw_output = Scraper._process_spidermw_output
+
+    def _process_spidermw_output(
+        self: Scraper, output: Any, response: Response | Failure
+    ) -> Deferred[None]:
+        calls.append(output)
+        return process_spidermw_output(self, output, response)
+
+    monkeypatch.setattr("scrapy.core.scraper.is_asyncio_available", lambda: False)
+    monkeypatch.setattr(Scraper, "_process_spidermw_output", _process_spidermw_output)
+    crawler = get_crawler(ItemSpider, {"CONCURRENT_ITEMS_ADAPTIVE": True})
+    await crawler.crawl_async(mockserver=mockserver)
+    assert crawler.stats
+    items = [output for output in calls if not isinstance(output, Request)]
+    assert items
+    assert len(items) == crawler.stats.get_value("item_scraped_count")
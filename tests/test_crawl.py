@@ -74,6 +74,17 @@ class TestCrawl:
         assert isinstance(crawler.spider, FollowAllSpider)
         assert len(crawler.spider.urls_visited) == 11  # 10 + start_url
 
+    @coroutine_test
+    async def test_download_timing_stats(self, mockserver: MockServer) -> None:
+        crawler = get_crawler(FollowAllSpider)
+        await crawler.crawl_async(mockserver=mockserver)
+        stats = crawler.stats.get_stats()
+        assert stats["downloader/timing/response_count"] == 11
+        assert stats["downloader/timing/reused_connection_count"] < 11
+        for phase in ("connect", "ttfb", "transfer", "total"):
+            assert stats[f"downloader/timing/{phase}"] >= 0
+        assert stats["downloader/timing/total"] >= stats["downloader/timing/ttfb"]
+
     @coroutine_test
     async def test_fixed_delay(self, mockserver: MockServer) -> None:
         await self._test_delay(mockserver, total=10, delay=0.2)
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from scrapy import Spider
+from scrapy import Request, Spider
 from scrapy.core.downloader.handlers.http11 import HTTP11DownloadHandler
 from scrapy.crawler import Crawler
 from scrapy.exceptions import NotConfigured
@@ -26,9 +26,11 @@ from tests.utils.bases.download_handlers_http import (
     TestRealWebsiteBase,
     TestSimpleHttpsBase,
 )
+from tests.utils.decorators import coroutine_test
 
 if TYPE_CHECKING:
     from scrapy.core.downloader.handlers import DownloadHandlerProtocol
+    from tests.mockserver.http import MockServer
 
 
 pytestmark = pytest.mark.requires_reactor  # HTTP11DownloadHandler requires a reactor
@@ -56,7 +58,14 @@ def test_not_configured_without_reactor() -> None:
 
 
 class TestHttp(HTTP11DownloadHandlerMixin, TestHttpBase):
-    pass
+    @coroutine_test
+    async def test_download_timing_dns(self, mockserver: MockServer) -> None:
+        request = Request(mockserver.url("/text"))
+        async with self.get_dh() as download_handler:
+            await download_handler.download_request(request)
+        timing = request.meta["download_timing"]
+        assert timing["dns"] >= 0
+        assert timing["connect"] >= 0
 
 
 class TestHttps(HTTP11DownloadHandlerMixin, TestHttpsBase):
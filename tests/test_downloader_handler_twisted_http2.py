@@ -7,6 +7,7 @@ import sys
 from typing import TYPE_CHECKING, Any
 
 import pytest
+from twisted.internet.defer import DeferredList
 from twisted.web.http import H2_ENABLED
 
 from scrapy import Spider
@@ -17,6 +18,7 @@ from scrapy.exceptions import (
     UnsupportedURLSchemeError,
 )
 from scrapy.http import Request
+from scrapy.utils.defer import deferred_from_coro, maybe_deferred_to_future
 from scrapy.utils.misc import build_from_crawler
 from tests.utils.bases.download_handlers_http import (
     TestHttpProxyBase,
@@ -85,6 +87,14 @@ class TestHttp2(H2DownloadHandlerMixin, TestHttpsBase):
             response = await download_handler.download_request(request)
         assert response.protocol == "h2"
 
+    @coroutine_test
+    async def test_max_concurrent_streams_meta(self, mockserver: MockServer) -> None:
+        request = Request(mockserver.url("/text", is_secure=self.is_secure))
+        async with self.get_dh() as download_handler:
+            await download_handler.download_request(request)
+        # Twisted advertises no limit, so the local limit of h2 applies
+        assert request.meta["h2_max_concurrent_streams"] == 100
+
     def test_download_conn_failed(self) -> None:  # type: ignore[override]
         # Unlike HTTP11DownloadHandler which raises it from download_request()
         # (without any special handling), here ConnectionRefusedError (raised in
@@ -171,6 +181,58 @@ class TestHttp2(H2DownloadHandlerMixin, TestHttpsBase):
             with pytest.raises(DownloadFailedError, match="405 Method Not Allowed"):
                 await download_handler.download_request(request)
 
+    @coroutine_test
+    async def test_download_goaway_migration(self, mockserver: MockServer) -> None:
+        """Requests that the server did not process before sending a GOAWAY
+        frame are sent again over new connections."""
+        request = Request(mockserver.url("/h2-goaway", is_secure=self.is_secure))
+        async with self.get_dh() as download_handler:
+            with pytest.raises(DownloadFailedError):
+                await download_handler.download_request(request)
+            stats = download_handler._crawler.stats  # type: ignore[attr-defined]
+        assert stats.get_value("downloader/h2/streams_migrated") == 3
+        assert stats.get_value("downloader/h2/connections_opened") == 4
+
+    @coroutine_test
+    async def test_download_goaway_drain(self, mockserver: MockServer) -> None:
+        """Streams that the server agreed to process before sending a GOAWAY
+        frame still get their response."""
+        request = Request(mockserver.url("/h2-goaway-drain", is_secure=self.is_secure))
+        async with self.get_dh() as download_handler:
+            response = await download_handler.download_request(request)
+            stats = download_handler._crawler.stats  # type: ignore[attr-defined]
+            assert response.body == b"Works"
+
+            # The drained connection is not reused
+            response = await download_handler.download_request(
+                Request(mockserver.url("/text", is_secure=self.is_secure))
+            )
+            assert response.body == b"Works"
+        assert stats.get_value("downloader/h2/connections_opened") == 2
+
+    @coroutine_test
+    async def test_max_connections(self, mockserver: MockServer) -> None:
+        """Additional connections are opened when the streams of the existing
+        ones are in use."""
+        requests = [
+            Request(mockserver.url("/delay?n=0.2", is_secure=self.is_secure))
+            for _ in range(150)
+        ]
+        async with self.get_dh({"HTTP2_MAX_CONNECTIONS": 2}) as download_handler:
+            results = await maybe_deferred_to_future(
+                DeferredList(
+                    [
+                        deferred_from_coro(download_handler.download_request(r))
+                        for r in requests
+                    ],
+                    fireOnOneErrback=True,
+                )
+            )
+            stats = download_handler._crawler.stats  # type: ignore[attr-defined]
+        assert all(response.status == 200 for _, response in results)
+        assert stats.get_value("downloader/h2/connections_opened") == 2
+        assert requests[0].meta["h2_max_concurrent_streams"] == 200
+
     @coroutine_test
     async def test_download_plain_http(self, mockserver: MockServer) -> None:
         request = Request(mockserver.url("/text"))
@@ -13,6 +13,7 @@ from twisted.internet.defer import CancelledError
 from twisted.internet.error import ConnectionRefusedError as TxConnectionRefusedError
 from twisted.internet.error import DNSLookupError
 from twisted.internet.error import TimeoutError as TxTimeoutError
+from twisted.internet.interfaces import IResolutionReceiver
 from twisted.web.client import ResponseFailed
 from twisted.web.error import SchemeNotSupported
 from w3lib.url import path_to_file_uri
@@ -33,7 +34,11 @@ from scrapy.exceptions import (
 )
 from scrapy.http import Request, TextResponse
 from scrapy.responsetypes import responsetypes
-from scrapy.utils._download_handlers import wrap_twisted_exceptions
+from scrapy.utils._download_handlers import (
+    DownloadTiming,
+    _TimingResolutionReceiver,
+    wrap_twisted_exceptions,
+)
 from scrapy.utils.boto import is_botocore_available
 from scrapy.utils.misc import build_from_crawler
 from scrapy.utils.test import get_crawler
@@ -458,3 +463,13 @@ class TestWrapTwistedExceptions:
     def test_other_exceptions_pass_through(self) -> None:
         with pytest.raises(ZeroDivisionError), wrap_twisted_exceptions():
             1 / 0
+
+
+def test_timing_resolution_receiver() -> None:
+    receiver = mock.Mock()
+    timing = DownloadTiming()
+    timing_receiver = _TimingResolutionReceiver(receiver, timing)
+    assert IResolutionReceiver.providedBy(timing_receiver)
+    timing_receiver.resolutionComplete()
+    assert timing.dns_end is not None
+    receiver.resolutionComplete.assert_called_once_with()
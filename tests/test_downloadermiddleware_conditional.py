@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from scrapy.downloadermiddlewares.conditional import ConditionalRequestMiddleware
+from scrapy.downloadermiddlewares.redirect import RedirectMiddleware
+from scrapy.exceptions import IgnoreRequest, NotConfigured
+from scrapy.http import Request, Response
+from scrapy.spiders import Spider
+from scrapy.utils.misc import build_from_crawler
+from scrapy.utils.test import get_crawler
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+URL = "https://example.com/"
+HEADERS = {"ETag": '"abc"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+
+
+@contextmanager
+def get_mw(
+    tmp_path: Path, **new_settings: Any
+) -> Generator[ConditionalRequestMiddleware]:
+    settings = {
+        "CONDITIONAL_REQUESTS_ENABLED": True,
+        "CONDITIONAL_REQUESTS_DIR": str(tmp_path),
+        **new_settings,
+    }
+    crawler = get_crawler(Spider, settings)
+    crawler.spider = crawler._create_spider("example.com")
+    crawler.stats.open_spider()
+    mw = build_from_crawler(ConditionalRequestMiddleware, crawler)
+    mw.spider_opened(crawler.spider)
+    try:
+        yield mw
+    finally:
+        mw.spider_closed(crawler.spider)
+        crawler.stats.close_spider()
+
+
+def download(
+    mw: ConditionalRequestMiddleware, request: Request, response: Response
+) -> Response:
+    mw.process_request(request)
+    result = mw.process_response(request, response)
+    assert isinstance(result, Response)
+    return result
+
+
+def test_not_configured():
+    crawler = get_crawler(Spider)
+    with pytest.raises(NotConfigured):
+        build_from_crawler(ConditionalRequestMiddleware, crawler)
+
+
+def test_revalidate(tmp_path):
+    with get_mw(tmp_path) as mw:
+        request = Request(URL)
+        download(mw, request, Response(URL, headers=HEADERS, body=b"foo"))
+        assert b"If-None-Match" not in request.headers
+        assert mw.crawler.stats.get_value("conditional/store") == 1
+
+        request = Request(URL)
+        mw.process_request(request)
+        assert request.headers[b"If-None-Match"] == b'"abc"'
+        assert request.headers[b"If-Modified-Since"] == b"Wed, 21 Oct 2015 07:28:00 GMT"
+        assert mw.crawler.stats.get_value("conditional/revalidate") == 1
+
+        with pytest.raises(IgnoreRequest):
+            mw.process_response(request, Response(URL, status=304))
+        assert mw.crawler.stats.get_value("conditional/unchanged") == 1
+        assert "_conditional_validators" not in request.meta
+
+
+def test_keep_request_headers(tmp_path):
+    with get_mw(tmp_path) as mw:
+        download(mw, Request(URL), Response(URL, headers=HEADERS))
+        request = Request(URL, headers={"If-None-Match": '"xyz"'})
+        mw.process_request(request)
+        assert request.headers[b"If-None-Match"] == b'"xyz"'
+        assert b"If-Modified-Since" in request.headers
+
+
+def test_redirect(tmp_path):
+    other_url = "https://example.com/other"
+    no_validators_url = "https://example.com/none"
+    with get_mw(tmp_path) as mw:
+        redirect_mw = build_from_crawler(RedirectMiddleware, mw.crawler)
+        download(mw, Request(URL), Response(URL, headers=HEADERS))
+        download(mw, Request(other_url), Response(other_url, headers={"ETag": '"def"'}))
+
+        request = Request(URL, headers={"Accept": "text/html"})
+        mw.process_request(request)
+        redirected = redirect_mw.process_response(
+            request, Response(URL, status=301, headers={"Location": other_url})
+        )
+        assert isinstance(redirected, Request)
+        mw.process_request(redirected)
+        assert redirected.headers[b"If-None-Match"] == b'"def"'
+        assert b"If-Modified-Since" not in redirected.headers
+        assert redirected.headers[b"Accept"] == b"text/html"
+
+        redirected2 = redirect_mw.process_response(
+            redirected,
+            Response(other_url, status=301, headers={"Location": no_validators_url}),
+        )
+        assert isinstance(redirected2, Request)
+        mw.process_request(redirected2)
+        assert b"If-None-Match" not in redirected2.headers
+        assert "_conditional_validators" not in redirected2.meta
+        response = mw.process_response(
+            redirected2, Response(no_validators_url, status=304)
+        )
+        assert response.flags == []
+        assert mw.crawler.stats.get_value("conditional/revalidate") == 2
+
+
+def test_unchanged_hash(tmp_path):
+    with get_mw(tmp_path) as mw:
+        download(mw, Request(URL), Response(URL, body=b"foo"))
+
+        request = Request(URL)
+        mw.process_request(request)
+        assert b"If-None-Match" not in request.headers
+        assert mw.crawler.stats.get_value("conditional/revalidate") is None
+        with pytest.raises(IgnoreRequest):
+            mw.process_response(request, Response(URL, body=b"foo"))
+
+        response = download(mw, Request(URL), Response(URL, body=b"bar"))
+        assert "unchanged" not in response.flags
+        assert mw.crawler.stats.get_value("conditional/store") == 3
+        assert mw.crawler.stats.get_value("conditional/unchanged") == 1
+
+
+def test_flag_unchanged(tmp_path):
+    with get_mw(tmp_path, CONDITIONAL_REQUESTS_SKIP_UNCHANGED=False) as mw:
+        download(mw, Request(URL), Response(URL, headers=HEADERS, body=b"foo"))
+        response = download(mw, Request(URL), Response(URL, status=304))
+        assert response.flags == ["unchanged"]
+        response = download(mw, Request(URL), Response(URL, body=b"foo"))
+        assert response.flags == ["unchanged"]
+
+
+def test_304_without_validators(tmp_path):
+    with get_mw(tmp_path) as mw:
+        response = download(mw, Request(URL), Response(URL, status=304))
+        assert response.flags == []
+        assert mw.crawler.stats.get_value("conditional/unchanged") is None
+
+
+@pytest.mark.parametrize(
+    "request_kwargs",
+    [
+        {"meta": {"dont_revalidate": True}},
+        {"method": "POST"},
+    ],
+)
+def test_skip_request(tmp_path, request_kwargs):
+    with get_mw(tmp_path) as mw:
+        download(mw, Request(URL), Response(URL, headers=HEADERS, body=b"foo"))
+        request = Request(URL, **request_kwargs)
+        mw.process_request(request)
+        assert b"If-None-Match" not in request.headers
+        response = mw.process_response(request, Response(URL, body=b"foo"))
+        assert response.flags == []
+        assert mw.crawler.stats.get_value("conditional/store") == 1
+
+
+def test_skip_cached_and_errors(tmp_path):
+    with get_mw(tmp_path) as mw:
+        download(mw, Request(URL), Response(URL, body=b"foo", flags=["cached"]))
+        download(mw, Request(URL), Response(URL, status=500, body=b"foo"))
+        assert mw.crawler.stats.get_value("conditional/store") is None
+
+
+def test_persistence(tmp_path):
+    with get_mw(tmp_path) as mw:
+        download(mw, Request(URL), Response(URL, headers=HEADERS, body=b"foo"))
+    with get_mw(tmp_path) as mw:
+        request = Request(URL)
+        mw.process_request(request)
+        assert request.headers[b"If-None-Match"] == b'"abc"'
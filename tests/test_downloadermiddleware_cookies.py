@@ -9,6 +9,7 @@ from scrapy.downloadermiddlewares.defaultheaders import DefaultHeadersMiddleware
 from scrapy.downloadermiddlewares.redirect import RedirectMiddleware
 from scrapy.exceptions import NotConfigured
 from scrapy.http import Request, Response
+from scrapy.http.cookies import CachingCookieJar
 from scrapy.http.request import CookiesT, VerboseCookie
 from scrapy.utils.misc import build_from_crawler
 from scrapy.utils.python import to_bytes
@@ -874,3 +875,115 @@ class TestCookiesMiddleware:
             cookies2=False,
             cookies3=True,
         )
+
+
+class TestCookiesMiddlewareCachingCookieJar(TestCookiesMiddleware):
+    def setup_method(self):
+        crawler = get_crawler(
+            DefaultSpider, settings_dict={"COOKIES_JAR_CLASS": CachingCookieJar}
+        )
+        crawler.spider = crawler._create_spider()
+        self.mw = build_from_crawler(CookiesMiddleware, crawler)
+        self.redirect_middleware = build_from_crawler(RedirectMiddleware, crawler)
+
+    def test_jar_class(self):
+        req = Request("http://scrapytest.org/", meta={"cookiejar": 1})
+        self.mw.process_request(req)
+        assert isinstance(self.mw.jars[1], CachingCookieJar)
+
+
+class TestCookiesMiddlewareLimits:
+    def _get_mw(self, **settings: Any) -> CookiesMiddleware:
+        crawler = get_crawler(DefaultSpider, settings_dict=settings)
+        crawler.spider = crawler._create_spider()
+        assert crawler.stats
+        crawler.stats.open_spider()
+        return build_from_crawler(CookiesMiddleware, crawler)
+
+    def _set_cookies(self, mw: CookiesMiddleware, jar: Any, *set_cookie: str) -> None:
+        request = Request("https://example.com", meta={"cookiejar": jar})
+        mw.process_request(request)
+        response = Response(request.url, headers={"Set-Cookie": list(set_cookie)})
+        mw.process_response(request, response)
+
+    def _get_cookie(self, mw: CookiesMiddleware, jar: Any) -> bytes | None:
+        request = Request("https://example.com", meta={"cookiejar": jar})
+        mw.process_request(request)
+        return request.headers.get("Cookie")
+
+    def test_no_limits(self):
+        mw = self._get_mw()
+        for jar in range(10):
+            self._set_cookies(mw, jar, f"a={jar}")
+        assert len(mw.jars) == 10
+        assert all(self._get_cookie(mw, jar) == b"a=%d" % jar for jar in range(10))
+        assert mw.stats
+        assert mw.stats.get_value("cookies/jars") == 10
+        assert mw.stats.get_value("cookies/jars_evicted") is None
+
+    def test_max_jars(self):
+        mw = self._get_mw(COOKIES_JARS_MAX=2)
+        self._set_cookies(mw, 1, "a=1")
+        self._set_cookies(mw, 2, "a=2")
+        assert self._get_cookie(mw, 1) == b"a=1"
+        self._set_cookies(mw, 3, "a=3")  # evicts 2
+        assert list(mw.jars) == [1, 3]
+        assert self._get_cookie(mw, 1) == b"a=1"
+        assert self._get_cookie(mw, 2) is None
+        assert mw.stats
+        assert mw.stats.get_value("cookies/jars") == 2
+        assert mw.stats.get_value("cookies/jars_evicted") == 2
+
+    def test_jars_dir(self, tmp_path):
+        mw = self._get_mw(COOKIES_JARS_MAX=1, COOKIES_JARS_DIR=str(tmp_path))
+        self._set_cookies(mw, 1, "a=1")
+        self._set_cookies(mw, 2, "a=2")
+        assert list(mw.jars) == [2]
+        assert len(list(tmp_path.glob("*/*.pickle"))) == 1
+        assert self._get_cookie(mw, 1) == b"a=1"
+        assert self._get_cookie(mw, 2) == b"a=2"
+        assert mw.stats
+        assert mw.stats.get_value("cookies/jars_evicted") == 3
+        assert mw.stats.get_value("cookies/jars_restored") == 2
+        mw.spider_closed()
+        assert not list(tmp_path.iterdir())
+
+    def test_jars_ttl(self, monkeypatch):
+        now = 1000.0
+        monkeypatch.setattr(
+            "scrapy.downloadermiddlewares.cookies.monotonic", lambda: now
+        )
+        mw = self._get_mw(COOKIES_JARS_TTL=10)
+        self._set_cookies(mw, 1, "a=1")
+        now += 5
+        self._set_cookies(mw, 2, "a=2")
+        now += 6
+        assert self._get_cookie(mw, 2) == b"a=2"
+        assert list(mw.jars) == [2]
+
+    def test_max_cookies_per_jar(self):
+        mw = self._get_mw(COOKIES_PER_JAR_MAX=2)
+        self._set_cookies(
+            mw,
+            None,
+            "a=1",
+            "b=2; Max-Age=100",
+            "c=3; Max-Age=50",
+            "d=4; Max-Age=-1",
+        )
+        assert self._get_cookie(mw, None) == b"a=1; b=2"
+        assert mw.stats
+        assert mw.stats.get_value("cookies/dropped") == 1
+
+    def test_max_cookies(self):
+        mw = self._get_mw(COOKIES_MAX=3)
+        self._set_cookies(mw, 1, "a=1", "b=1")
+        self._set_cookies(mw, 2, "a=2")
+        assert list(mw.jars) == [1, 2]
+        self._set_cookies(mw, 3, "a=3")  # evicts 1
+        assert list(mw.jars) == [2, 3]
+        self._set_cookies(mw, 3, "b=3", "c=3", "d=3")  # evicts 2, drops 1 cookie
+        assert list(mw.jars) == [3]
+        assert len(mw.jars[3]) == 3
+        assert mw.stats
+        assert mw.stats.get_value("cookies/dropped") == 1
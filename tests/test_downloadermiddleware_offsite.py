@@ -310,3 +310,30 @@ def test_dynamic_allowed_domains_caching():
     spider.allowed_domains.append("b.example")
     assert mw.process_request(Request("https://b.example")) is None
     assert calls == 2
+
+
+def test_many_allowed_domains():
+    crawler = get_crawler(Spider)
+    allowed_domains = tuple(f"{i}.example" for i in range(100_000))
+    crawler.spider = crawler._create_spider(name="a", allowed_domains=allowed_domains)
+    mw = build_from_crawler(OffsiteMiddleware, crawler)
+    mw.spider_opened(crawler.spider)
+    assert mw.process_request(Request("https://99999.example")) is None
+    assert mw.process_request(Request("https://www.12345.example")) is None
+    for url in ("https://100000.example", "https://example", "https://a12345.example"):
+        with pytest.raises(IgnoreRequest):
+            mw.process_request(Request(url))
+
+
+def test_host_regex():
+    crawler = get_crawler(Spider)
+    crawler.spider = crawler._create_spider(name="a", allowed_domains=["a.example"])
+    mw = build_from_crawler(OffsiteMiddleware, crawler)
+    mw.spider_opened(crawler.spider)
+    assert mw.host_regex.search("b.a.example")
+    assert not mw.host_regex.search("b.example")
+
+    mw.host_regex = re.compile(r"^b\.example$")
+    assert mw.process_request(Request("https://b.example")) is None
+    with pytest.raises(IgnoreRequest):
+        mw.process_request(Request("https://a.example"))
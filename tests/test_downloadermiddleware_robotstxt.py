@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from typing import TYPE_CHECKING, Any
 from unittest import mock
 
 import pytest
@@ -19,6 +21,9 @@ from scrapy.utils.misc import build_from_crawler
 from tests.utils.decorators import coroutine_test
 from tests.utils.robotstxt import rerp_available
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 class TestRobotsTxtMiddleware:
     def setup_method(self) -> None:
@@ -113,6 +118,159 @@ Disallow: /some/randome/page.html
         c2 = middleware.process_request(Request("http://site.local/allowed2"))
         await asyncio.gather(c1, c2)
 
+    @coroutine_test
+    async def test_robotstxt_multiple_reqs_forbidden(self) -> None:
+        middleware = build_from_crawler(
+            RobotsTxtMiddleware, self._get_successful_crawler()
+        )
+        dfds = [
+            deferred_from_coro(
+                self.assertIgnored(Request(f"http://site.local/admin/{i}"), middleware)
+            )
+            for i in range(3)
+        ]
+        await maybe_deferred_to_future(DeferredList(dfds, fireOnOneErrback=True))
+
+    def _get_cache_crawler(
+        self, settings: dict[str, Any], headers: dict[str, str] | None = None
+    ) -> mock.MagicMock:
+        self.setup_method()
+        crawler = self._get_successful_crawler()
+        crawler.settings.update(settings)
+        response = TextResponse(
+            "http://site.local/robots.txt",
+            body=b"User-Agent: *\nDisallow: /admin/\n",
+            headers=headers,
+        )
+
+        async def return_response(request: Request) -> Response:
+            deferred: Deferred[Response] = Deferred()
+            call_later(0, deferred.callback, response)
+            return await maybe_deferred_to_future(deferred)
+
+        crawler.engine.download_async.side_effect = return_response
+        return crawler
+
+    @coroutine_test
+    async def test_robotstxt_cache(self, tmp_path: Path) -> None:
+        crawler = self._get_cache_crawler({"ROBOTSTXT_CACHE_DIR": str(tmp_path)})
+        middleware = build_from_crawler(RobotsTxtMiddleware, crawler)
+        await self.assertIgnored(Request("http://site.local/admin/"), middleware)
+        assert crawler.engine.download_async.call_count == 1
+        crawler.stats.inc_value.assert_any_call("robotstxt/cache/store")
+        assert len(list(tmp_path.iterdir())) == 1
+
+        crawler = self._get_cache_crawler({"ROBOTSTXT_CACHE_DIR": str(tmp_path)})
+        middleware = build_from_crawler(RobotsTxtMiddleware, crawler)
+        await self.assertIgnored(Request("http://site.local/admin/"), middleware)
+        await self.assertNotIgnored(Request("http://site.local/allowed"), middleware)
+        assert not crawler.engine.download_async.called
+        crawler.stats.inc_value.assert_any_call("robotstxt/cache/hit")
+        calls = [
+            kwargs
+            for _, kwargs in crawler.signals.send_catch_log_async.call_args_list
+            if kwargs.get("signal") is signals.robots_parsed
+        ]
+        assert len(calls) == 1
+
+        # Other network locations are still downloaded.
+        await self.assertIgnored(Request("http://other.local/admin/"), middleware)
+        assert crawler.engine.download_async.call_count == 1
+
+    @coroutine_test
+    async def test_robotstxt_cache_jobdir(self, tmp_path: Path) -> None:
+        crawler = self._get_cache_crawler({"JOBDIR": str(tmp_path)})
+        middleware = build_from_crawler(RobotsTxtMiddleware, crawler)
+        await self.assertIgnored(Request("http://site.local/admin/"), middleware)
+        assert len(list((tmp_path / "robotstxt").iterdir())) == 1
+
+    @pytest.mark.parametrize("use_dir", [False, True])
+    @coroutine_test
+    async def test_robotstxt_cache_disabled(
+        self, tmp_path: Path, use_dir: bool
+    ) -> None:
+        settings: dict[str, Any] = {}
+        if use_dir:
+            settings["ROBOTSTXT_CACHE_DIR"] = str(tmp_path)
+            settings["ROBOTSTXT_CACHE_EXPIRATION"] = 0
+        crawler = self._get_cache_crawler(settings)
+        middleware = build_from_crawler(RobotsTxtMiddleware, crawler)
+        assert middleware._cache is None
+        await self.assertIgnored(Request("http://site.local/admin/"), middleware)
+        assert not list(tmp_path.iterdir())
+
+    @pytest.mark.parametrize(
+        ("cache_control", "stored"),
+        [
+            ("public", True),
+            ("max-age=3600", True),
+            ("max-age=0", False),
+            ("no-store", False),
+            ("no-cache", False),
+        ],
+    )
+    @coroutine_test
+    async def test_robotstxt_cache_control(
+        self, tmp_path: Path, cache_control: str, stored: bool
+    ) -> None:
+        crawler = self._get_cache_crawler(
+            {"ROBOTSTXT_CACHE_DIR": str(tmp_path)},
+            headers={"Cache-Control": cache_control},
+        )
+        middleware = build_from_crawler(RobotsTxtMiddleware, crawler)
+        await self.assertIgnored(Request("http://site.local/admin/"), middleware)
+        assert bool(list(tmp_path.iterdir())) == stored
+
+    @coroutine_test
+    async def test_robotstxt_cache_expiration(self, tmp_path: Path) -> None:
+        crawler = self._get_cache_crawler(
+            {"ROBOTSTXT_CACHE_DIR": str(tmp_path)},
+            headers={"Cache-Control": "max-age=60"},
+        )
+        middleware = build_from_crawler(RobotsTxtMiddleware, crawler)
+        await self.assertIgnored(Request("http://site.local/admin/"), middleware)
+
+        crawler = self._get_cache_crawler({"ROBOTSTXT_CACHE_DIR": str(tmp_path)})
+        middleware = build_from_crawler(RobotsTxtMiddleware, crawler)
+        with mock.patch(
+            "scrapy.downloadermiddlewares.robotstxt.time",
+            return_value=time.time() + 61,
+        ):
+            await self.assertIgnored(Request("http://site.local/admin/"), middleware)
+        assert crawler.engine.download_async.call_count == 1
+
+    @coroutine_test
+    async def test_robotstxt_cache_error(self, tmp_path: Path) -> None:
+        self.crawler.settings.set("ROBOTSTXT_OBEY", True)
+        self.crawler.settings.set("ROBOTSTXT_CACHE_DIR", str(tmp_path))
+
+        async def return_failure(request: Request) -> Response:
+            raise CannotResolveHostError("Robotstxt address not found")
+
+        self.crawler.engine.download_async.side_effect = return_failure
+        middleware = build_from_crawler(RobotsTxtMiddleware, self.crawler)
+        await self.assertNotIgnored(Request("http://site.local/admin/"), middleware)
+        assert not list(tmp_path.iterdir())
+        assert not middleware._cache._downloading  # type: ignore[union-attr]
+
+    @coroutine_test
+    async def test_robotstxt_cache_shared_download(self, tmp_path: Path) -> None:
+        settings = {"ROBOTSTXT_CACHE_DIR": str(tmp_path)}
+        crawler1 = self._get_cache_crawler(settings)
+        middleware1 = build_from_crawler(RobotsTxtMiddleware, crawler1)
+        crawler2 = self._get_cache_crawler(settings)
+        middleware2 = build_from_crawler(RobotsTxtMiddleware, crawler2)
+        assert middleware1._cache is middleware2._cache
+        d1 = deferred_from_coro(
+            self.assertIgnored(Request("http://site.local/admin/"), middleware1)
+        )
+        d2 = deferred_from_coro(
+            self.assertIgnored(Request("http://site.local/admin/"), middleware2)
+        )
+        await maybe_deferred_to_future(DeferredList([d1, d2], fireOnOneErrback=True))
+        assert crawler1.engine.download_async.call_count == 1
+        assert not crawler2.engine.download_async.called
+
     @coroutine_test
     async def test_robotstxt_ready_parser(self):
         middleware = build_from_crawler(
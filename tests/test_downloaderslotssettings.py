@@ -6,6 +6,7 @@ import pytest
 from scrapy import Request
 from scrapy.core.downloader import Downloader, Slot
 from scrapy.exceptions import ScrapyDeprecationWarning
+from scrapy.http import Response
 from scrapy.utils.spider import DefaultSpider
 from scrapy.utils.test import get_crawler
 from tests.mockserver.http import MockServer
@@ -126,6 +127,66 @@ async def test_get_slot_deprecated_spider_arg():
     assert slot1 == slot2
 
 
+@pytest.mark.parametrize(
+    ("settings", "meta", "expected"),
+    [
+        ({}, {}, 8),
+        ({}, {"h2_max_concurrent_streams": 100}, 8),
+        ({"HTTP2_STREAM_CONCURRENCY_ENABLED": True}, {}, 8),
+        (
+            {"HTTP2_STREAM_CONCURRENCY_ENABLED": True},
+            {"h2_max_concurrent_streams": 100},
+            16,
+        ),
+        (
+            {"HTTP2_STREAM_CONCURRENCY_ENABLED": True, "CONCURRENT_REQUESTS": 0},
+            {"h2_max_concurrent_streams": 100},
+            100,
+        ),
+        (
+            {"HTTP2_STREAM_CONCURRENCY_ENABLED": True},
+            {"h2_max_concurrent_streams": 2},
+            2,
+        ),
+        (
+            {
+                "HTTP2_STREAM_CONCURRENCY_ENABLED": True,
+                "DOWNLOAD_SLOTS": {"example.com": {"concurrency": 3}},
+            },
+            {"h2_max_concurrent_streams": 100},
+            3,
+        ),
+    ],
+)
+@coroutine_test
+async def test_h2_stream_concurrency(
+    settings: dict[str, Any], meta: dict[str, Any], expected: int
+) -> None:
+    crawler = get_crawler(
+        DefaultSpider,
+        settings_dict={
+            "CONCURRENT_REQUESTS": 16,
+            "CONCURRENT_REQUESTS_PER_DOMAIN": 8,
+            **settings,
+        },
+    )
+    crawler.spider = crawler._create_spider()
+    downloader = Downloader(crawler)
+    request = Request("https://example.com")
+    key, slot = downloader._get_slot(request)
+    request.meta[Downloader.DOWNLOAD_SLOT] = key
+    request.meta.update(meta)
+
+    async def download_request_async(request: Request) -> Response:
+        return Response(request.url, request=request)
+
+    downloader.handlers.download_request_async = download_request_async  # type: ignore[method-assign]
+    await downloader._download(slot, request)
+    downloader.close()
+
+    assert slot.concurrency == expected
+
+
 @pytest.mark.parametrize(
     "priority_queue_class",
     [
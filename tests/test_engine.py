@@ -12,6 +12,7 @@ import pytest
 from scrapy import signals
 from scrapy.core.engine import ExecutionEngine, _Slot
 from scrapy.core.scheduler import BaseScheduler
+from scrapy.core.scraper import Slot as ScraperSlot
 from scrapy.exceptions import CloseSpider, IgnoreRequest
 from scrapy.http import Request
 from scrapy.spiders import Spider
@@ -235,6 +236,70 @@ async def test_request_scheduled_signal():
     crawler.signals.disconnect(signal_handler, signals.request_scheduled)
 
 
+@coroutine_test
+async def test_start_download():
+    """The request is counted as in progress before its download starts, so
+    that needs_backout() accounts for it right away."""
+    crawler = get_crawler(MySpider)
+    crawler.spider = crawler._create_spider()
+    engine = ExecutionEngine(crawler, lambda _: None)
+    engine.spider = crawler.spider
+    engine._slot = _Slot(False, Mock(), Mock())
+    request = Request("data:,a")
+    try:
+        download = engine._start_download(request)
+        assert request in engine._slot.inprogress
+        assert request in engine.downloader.active
+        response = await download
+    finally:
+        engine.downloader.close()
+    assert response.body == b"a"
+    assert request not in engine.downloader.active
+
+
+@coroutine_test
+async def test_start_scheduled_requests_backout():
+    """Requests of a batch are not started once the engine needs to back
+    out, e.g. because of responses that reached the scraper synchronously,
+    and they are started before any other scheduled request afterwards."""
+
+    class TestScheduler(BaseScheduler):
+        def __init__(self) -> None:
+            self.requests = [Request(f"https://{i}.example") for i in range(4)]
+
+        def has_pending_requests(self) -> bool:
+            return bool(self.requests)
+
+        def enqueue_request(self, request: Request) -> bool:
+            self.requests.append(request)
+            return True
+
+        def next_request(self) -> Request | None:
+            return self.requests.pop(0) if self.requests else None
+
+    crawler = get_crawler(MySpider)
+    engine = ExecutionEngine(crawler, lambda _: None)
+    scheduler = build_from_crawler(TestScheduler, crawler)
+    requests = list(scheduler.requests)
+    engine._slot = _Slot(False, Mock(), scheduler)
+    engine.scraper.slot = ScraperSlot()
+    started: list[Request] = []
+    engine._start_scheduled_request = started.append  # type: ignore[method-assign,assignment]
+    engine.needs_backout = lambda: len(started) >= 2  # type: ignore[method-assign]
+    engine._free_download_capacity = lambda: 3  # type: ignore[method-assign]
+
+    engine._start_scheduled_requests()
+    assert started == requests[:2]
+    assert engine._slot.unstarted == requests[2:3]
+    assert scheduler.requests == requests[3:]
+    assert not engine.spider_is_idle()
+
+    started.clear()
+    engine._start_scheduled_requests()
+    assert started == requests[2:]
+    assert not engine._slot.unstarted
+
+
 class ClosingPipeline:
     def open_spider(self):
         raise CloseSpider("pipeline_reason")
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from scrapy import Request, Spider
+from scrapy.exceptions import NotConfigured
+from scrapy.extensions.stagetiming import StageTiming, _Histogram
+from scrapy.utils.misc import build_from_crawler
+from scrapy.utils.test import get_crawler
+from tests.utils.decorators import coroutine_test
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from scrapy.http import Response
+
+
+class TimedDownloaderMiddleware:
+    def process_request(self, request: Request) -> None:
+        pass
+
+    async def process_response(self, request: Request, response: Response) -> Response:
+        return response
+
+
+class TimedPipeline:
+    def process_item(self, item: Any) -> Any:
+        return item
+
+
+class TimedSpider(Spider):
+    name = "timed"
+    custom_settings = {
+        "STAGE_TIMING_ENABLED": True,
+        "DOWNLOADER_MIDDLEWARES": {TimedDownloaderMiddleware: 500},
+        "ITEM_PIPELINES": {TimedPipeline: 300},
+    }
+
+    async def start(self):
+        for url in self.start_urls:
+            yield Request(url, meta={"download_slot": "files"})
+
+    def parse(self, response: Response):
+        yield {"url": response.url}
+        yield {"url": response.url}
+
+
+def test_histogram():
+    histogram = _Histogram()
+    assert histogram.percentile(50) == 0.0
+    for value in range(1, 101):
+        histogram.add(value / 1000)
+    histogram.add(0)
+    assert histogram.count == 101
+    for percent, expected in ((50, 0.05), (95, 0.095), (99, 0.099), (100, 0.1)):
+        assert expected <= histogram.percentile(percent) < expected * 1.05
+    assert histogram.percentile(0) == _Histogram.MIN
+
+
+def test_not_configured():
+    crawler = get_crawler()
+    with pytest.raises(NotConfigured):
+        build_from_crawler(StageTiming, crawler)
+
+
+@pytest.mark.parametrize("per_slot", [False, True])
+@coroutine_test
+async def test_crawl(tmp_path: Path, per_slot: bool) -> None:
+    urls = []
+    for i in range(3):
+        path = tmp_path / f"{i}.html"
+        path.write_text("<html></html>")
+        urls.append(path.as_uri())
+    crawler = get_crawler(TimedSpider, {"STAGE_TIMING_PER_SLOT": per_slot})
+    await crawler.crawl_async(start_urls=urls)
+    assert crawler.stats
+    stats = crawler.stats.get_stats()
+    dmw = f"{__name__}.TimedDownloaderMiddleware"
+    pipeline = f"{__name__}.TimedPipeline.process_item"
+    expected_counts = {
+        "scheduler": 3,
+        "downloader_slot": 3,
+        "download": 3,
+        f"downloader_middleware/{dmw}.process_request": 3,
+        f"downloader_middleware/{dmw}.process_response": 3,
+        "scraper_queue": 3,
+        "spider_middleware/scrapy.spidermiddlewares.httperror.HttpErrorMiddleware.process_spider_input": 3,
+        "callback": 3,
+        f"item_pipeline/{pipeline}": 6,
+    }
+    if per_slot:
+        expected_counts["downloader_slot/files"] = 3
+        expected_counts["download/files"] = 3
+    counts = {
+        key[len("stage_timing/") : -len("/count")]: value
+        for key, value in stats.items()
+        if key.startswith("stage_timing/") and key.endswith("/count")
+    }
+    for stage, count in expected_counts.items():
+        assert counts.pop(stage) == count, stage
+        for percent in (50, 95, 99):
+            assert stats[f"stage_timing/{stage}/p{percent}"] >= 0
+    # Other middlewares enabled by default.
+    assert all(
+        stage.startswith(("downloader_middleware/", "spider_middleware/"))
+        for stage in counts
+    )
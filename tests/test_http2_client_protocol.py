@@ -613,6 +613,56 @@ class TestHttps2ClientProtocol:
 
         await self._check_repeat(get_coro, 500)
 
+    @deferred_f_from_coro_f
+    async def test_remote_max_concurrent_streams_raised(
+        self, server_port: int, client: H2ClientProtocol
+    ) -> None:
+        """Pending streams are started as soon as the remote raises its
+        SETTINGS_MAX_CONCURRENT_STREAMS value."""
+        from h2.events import RemoteSettingsChanged  # noqa: PLC0415
+        from h2.settings import ChangedSetting, SettingCodes  # noqa: PLC0415
+
+        url = self.get_url(server_port, "/get-data-html-small")
+        # Make sure that the HTTP/2 connection is established
+        await make_request(client, Request(url))
+
+        with mock.patch.object(
+            type(client),
+            "allowed_max_concurrent_streams",
+            new_callable=mock.PropertyMock,
+            return_value=1,
+        ) as allowed:
+            d_list = [make_request_dfd(client, Request(url)) for _ in range(3)]
+            assert len(client._pending_request_stream_pool) == 2
+
+            allowed.return_value = 3
+            event = RemoteSettingsChanged()
+            event.changed_settings = {
+                SettingCodes.MAX_CONCURRENT_STREAMS: ChangedSetting(
+                    SettingCodes.MAX_CONCURRENT_STREAMS, 1, 3
+                )
+            }
+            client.remote_settings_changed(event)
+            assert not client._pending_request_stream_pool
+
+            responses = await maybe_deferred_to_future(
+                DeferredList(d_list, fireOnOneErrback=True)
+            )
+        assert all(response.status == 200 for _, response in responses)
+
+    @deferred_f_from_coro_f
+    async def test_stats(self, server_port: int, client: H2ClientProtocol) -> None:
+        await make_request(
+            client, Request(self.get_url(server_port, "/get-data-html-small"))
+        )
+        stats = client.stats
+        assert stats["active_streams"] == 0
+        assert stats["pending_streams"] == 0
+        assert stats["max_concurrent_streams"] == 100
+        assert stats["streams_opened"] == 1
+        assert stats["inbound_flow_control_window"] > 0
+        assert stats["outbound_flow_control_window"] > 0
+
     @inlineCallbacks
     def test_inactive_stream(
         self, server_port: int, client: H2ClientProtocol
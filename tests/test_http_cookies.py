@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import time
 from http.cookiejar import DefaultCookiePolicy
 
 from scrapy.http import Request, Response
-from scrapy.http.cookies import CookieJar, WrappedRequest, WrappedResponse
+from scrapy.http.cookies import (
+    CachingCookieJar,
+    CookieJar,
+    WrappedRequest,
+    WrappedResponse,
+)
 from scrapy.utils.httpobj import urlparse_cached
 
 
@@ -56,6 +62,85 @@ class TestCookieJar:
         assert jar.processed == 1
 
 
+class TestCachingCookieJar(TestCookieJar):
+    def setup_method(self):
+        self.jar = CachingCookieJar()
+        self.request = Request("http://example.com/")
+        self.response = Response(
+            "http://example.com/",
+            headers={"Set-Cookie": "name=value; Domain=example.com; Path=/"},
+        )
+
+    def _set_cookies(self, url: str, *set_cookie: str) -> None:
+        response = Response(url, headers={"Set-Cookie": list(set_cookie)})
+        self.jar.extract_cookies(response, Request(url))
+
+    def _get_header(self, url: str, **kwargs) -> bytes | None:
+        request = Request(url, **kwargs)
+        self.jar.add_cookie_header(request)
+        return request.headers.get("Cookie")
+
+    def test_cache(self, monkeypatch):
+        self._set_cookies(
+            "https://example.com/",
+            "a=1; Path=/",
+            "b=2; Path=/b",
+            "c=3; Path=/; Secure",
+            "d=4; Domain=example.com",
+        )
+        calls = 0
+        get_cookies = self.jar._get_cookies
+
+        def counting_get_cookies(*args):
+            nonlocal calls
+            calls += 1
+            return get_cookies(*args)
+
+        monkeypatch.setattr(self.jar, "_get_cookies", counting_get_cookies)
+        for _ in range(2):
+            assert self._get_header("https://example.com/") == b"a=1; c=3; d=4"
+            assert self._get_header("https://example.com/x") == b"a=1; c=3; d=4"
+            assert self._get_header("https://example.com/b/c") == b"b=2; a=1; c=3; d=4"
+            assert self._get_header("https://example.com/bc") == b"a=1; c=3; d=4"
+            assert self._get_header("http://example.com/") == b"a=1; d=4"
+            assert self._get_header("https://www.example.com/") == b"a=1; c=3; d=4"
+            assert self._get_header("https://example.org/") is None
+        assert calls == 5
+
+        self._set_cookies("https://example.com/", "a=5; Path=/")
+        assert self._get_header("https://example.com/") == b"a=5; c=3; d=4"
+        assert self._get_header("https://www.example.com/") == b"a=5; c=3; d=4"
+        assert calls == 7
+
+        self.jar.clear()
+        assert self._get_header("https://example.com/") is None
+
+    def test_existing_header(self):
+        self._set_cookies("https://example.com/", "a=1")
+        for _ in range(2):
+            assert self._get_header(
+                "https://example.com/", headers={"Cookie": "b=2"}
+            ) == (b"b=2")
+
+    def test_expiration(self, monkeypatch):
+        now = int(time.time())
+        self._set_cookies("https://example.com/", "a=1; Max-Age=10", "b=2; Max-Age=20")
+        assert self._get_header("https://example.com/") == b"a=1; b=2"
+        monkeypatch.setattr(time, "time", lambda: now + 15)
+        assert self._get_header("https://example.com/") == b"b=2"
+        monkeypatch.setattr(time, "time", lambda: now + 25)
+        assert self._get_header("https://example.com/") is None
+
+    def test_custom_policy(self):
+        class Policy(DefaultCookiePolicy):
+            def return_ok(self, cookie, request):
+                return cookie.name != "b" and super().return_ok(cookie, request)
+
+        self.jar.set_policy(Policy())
+        self._set_cookies("https://example.com/", "a=1", "b=2")
+        assert self._get_header("https://example.com/") == b"a=1"
+
+
 class TestWrappedRequest:
     def setup_method(self):
         self.request = Request(
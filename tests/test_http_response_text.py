@@ -168,6 +168,37 @@ class TestTextResponse(TestResponseBase):
         assert r._declared_encoding() is None
         self._assert_response_values(r, "utf-8", "\xa3")
 
+    @pytest.mark.parametrize(
+        "body",
+        [
+            b"",
+            b"<p>plain ascii</p>",
+            "<p>\xa3 \u2015 \U0001f600</p>".encode(),
+            "<p>\xa3 \u20ac</p>".encode("cp1252"),
+            b"<p>\x81\x8d\x8f\x90\x9d</p>",
+        ],
+    )
+    def test_inferred_encoding_fast_path(self, body: bytes) -> None:
+        r1 = self.response_class("http://www.example.com", body=body)
+        with mock.patch.object(
+            self.response_class, "_infer_ascii_or_utf8", return_value=None
+        ):
+            r2 = self.response_class("http://www.example.com", body=body)
+            assert r1.encoding == r2.encoding
+            assert r1.text == r2.text
+
+    def test_inferred_encoding_fast_path_skipped(self) -> None:
+        class _Response(self.response_class):  # type: ignore[name-defined,misc]
+            _DEFAULT_ENCODING = "utf-8"
+
+        body = b"<p>plain ascii</p>"
+        self._assert_response_values(
+            self.response_class("http://www.example.com", body=body), "cp1252", body
+        )
+        r = _Response("http://www.example.com", body=body)
+        assert r._infer_ascii_or_utf8() is None
+        self._assert_response_values(r, "utf-8", body)
+
     def test_utf16(self):
         """Test utf-16 because UnicodeDammit is known to have problems with"""
         body = b"\xff\xfeh\x00i\x00"
@@ -3,6 +3,8 @@ from __future__ import annotations
 import pickle
 import re
 
+import pytest
+
 from scrapy.http import HtmlResponse, XmlResponse
 from scrapy.link import Link
 from scrapy.linkextractors import lxmlhtml
@@ -782,14 +784,16 @@ class TestLxmlLinkExtractor:
         ]
 
     def test_canonicalize_once_per_link(self, monkeypatch):
-        canonicalize_url = lxmlhtml.canonicalize_url
+        canonicalize_url_cached = lxmlhtml.canonicalize_url_cached
         calls = []
 
         def counting_canonicalize_url(url, *args, **kwargs):
             calls.append(url)
-            return canonicalize_url(url, *args, **kwargs)
+            return canonicalize_url_cached(url, *args, **kwargs)
 
-        monkeypatch.setattr(lxmlhtml, "canonicalize_url", counting_canonicalize_url)
+        monkeypatch.setattr(
+            lxmlhtml, "canonicalize_url_cached", counting_canonicalize_url
+        )
         response = HtmlResponse(
             "https://example.com",
             body=b"".join(b'<a href="/p?b=2&a=1#f%d">x</a>' % i for i in range(10)),
@@ -873,6 +877,119 @@ class TestLxmlLinkExtractor:
         bad_link = Link("should_have_prefix.example")
         assert not LxmlLinkExtractor()._link_allowed(bad_link)
 
+    @pytest.mark.parametrize(
+        ("allow", "combined"),
+        [
+            ([r"/a/\d+", r"/b/(\w+)", "c"], True),
+            ([r"/a/\d+"], False),
+            ([r"/a/(\w)\1", r"/b/"], False),
+            ([r"/a/(?P<x>\w)(?P=x)", r"/b/"], False),
+            ([r"/a/(?P<x>\w)", r"/b/(?P<x>\w)"], False),
+            ([r"(?i)/a/", r"/b/"], False),
+            ([re.compile("/A/", re.IGNORECASE), "/b/"], False),
+        ],
+    )
+    def test_allow_combined(self, allow, combined):
+        lx = LxmlLinkExtractor(allow=allow)
+        assert (lx._allow._combined is not None) is combined
+        for url in ("http://example.com/", "http://example.com/b/"):
+            expected = any(re.compile(regex).search(url) for regex in allow)
+            assert lx.matches(url) is expected
+            assert lx._link_allowed(Link(url)) is expected
+
+    def test_domains(self):
+        lx = LxmlLinkExtractor(
+            allow_domains=["Example.com", "example.org"],
+            deny_domains=["private.example.com"],
+        )
+        assert lx.matches("http://EXAMPLE.com/")
+        assert lx.matches("http://www.example.com/")
+        assert lx.matches("http://a.b.example.org/")
+        assert not lx.matches("http://badexample.com/")
+        assert not lx.matches("http://example.com.evil/")
+        assert not lx.matches("http://private.example.com/")
+        assert not lx.matches("http://www.private.example.com/")
+        assert not lx.matches("http://example.com:8080/")
+        assert not lx.matches("file:///tmp/example.com")
+
+    def test_deny_extensions(self):
+        lx = LxmlLinkExtractor(deny_extensions=["pdf", "tar.gz"])
+        assert not lx._link_allowed(Link("http://example.com/a.PDF"))
+        assert not lx._link_allowed(Link("http://example.com/a.b.tar.gz"))
+        assert lx._link_allowed(Link("http://example.com/a.gz"))
+        assert lx._link_allowed(Link("http://example.com/pdf"))
+        assert lx._link_allowed(Link("http://example.com/a.pdf/"))
+        assert lx._link_allowed(Link("http://example.com/a?file=a.pdf"))
+
+
+_STREAMING_BODIES = [
+    get_testdata("link_extractor", "linkextractor.html"),
+    get_testdata("link_extractor", "linkextractor_latin1.html"),
+    get_testdata("link_extractor", "linkextractor_no_href.html"),
+    b"""<html><head><base href="http://example.org/base/"></head><body>
+    <a href="a.html">A <b>bold</b> &amp; <!-- comment --> <i>text</i></a>tail
+    <a href="b.html" rel="nofollow">B<a href="c.html">nested C</a></a>
+    <p><a href=" d.html ">unclosed <img src="e.png" alt="E">
+    <area href="f.html"><script>var a = "<a href='x.html'>";</script>
+    <div data-url="g.html" href="h.html">H</div>
+    </body></html>""",
+    b"""<?xml version="1.0"?>
+    <html xmlns="http://www.w3.org/1999/xhtml"><body>
+    <a href="/xhtml.html">XHTML</a></body></html>""",
+    b"",
+    b"\x00<a href='/null.html'>null</a>",
+]
+
+
+class TestStreamingLinkExtractor:
+    @pytest.mark.parametrize("body", _STREAMING_BODIES)
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"unique": False},
+            {"tags": "*", "attrs": "*", "deny_extensions": []},
+            {"tags": ("a", "img"), "attrs": ("href", "src"), "deny_attrs": "rel"},
+            {"restrict_text": "bold", "canonicalize": True},
+            {"process_value": lambda value: None if "b" in value else value},
+        ],
+    )
+    def test_same_links(self, body, kwargs):
+        response = HtmlResponse("http://example.com/index.html", body=body)
+        expected = LxmlLinkExtractor(**kwargs).extract_links(response)
+        response = HtmlResponse("http://example.com/index.html", body=body)
+        lx = LxmlLinkExtractor(streaming=True, **kwargs)
+        assert lx.extract_links(response) == expected
+        assert response._cached_selector is None
+
+    @pytest.mark.parametrize(
+        ("kwargs", "response_cls"),
+        [
+            ({"restrict_xpaths": "//p"}, HtmlResponse),
+            ({"restrict_css": "p"}, HtmlResponse),
+            ({}, XmlResponse),
+        ],
+    )
+    def test_fallback(self, kwargs, response_cls):
+        body = b"<html><body><p><a href='/a.html'>a</a></p></body></html>"
+        response = response_cls("http://example.com", body=body)
+        lx = LxmlLinkExtractor(streaming=True, **kwargs)
+        assert lx.extract_links(response) == [
+            Link(url="http://example.com/a.html", text="a")
+        ]
+        assert response._cached_selector is not None
+
+    def test_fallback_cached_selector(self, monkeypatch):
+        response = HtmlResponse("http://example.com", body=b"<a href='/a'>a</a>")
+        response.css("a")
+        monkeypatch.setattr(
+            LxmlParserLinkExtractor, "_stream_links", pytest.fail, raising=True
+        )
+        lx = LxmlLinkExtractor(streaming=True)
+        assert lx.extract_links(response) == [
+            Link(url="http://example.com/a", text="a")
+        ]
+
 
 class TestLxmlParserLinkExtractor:
     def test_extract_links(self):
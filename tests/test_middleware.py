@@ -3,12 +3,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import pytest
+from twisted.internet.defer import succeed
 
 from scrapy import Spider
 from scrapy.exceptions import NotConfigured, ScrapyDeprecationWarning
 from scrapy.middleware import MiddlewareManager
 from scrapy.utils.misc import build_from_crawler
 from scrapy.utils.test import get_crawler
+from tests.utils.decorators import coroutine_test
 
 if TYPE_CHECKING:
     from scrapy.crawler import Crawler
@@ -108,3 +110,51 @@ def test_no_crawler() -> None:
         mwman = MyMiddlewareManager(m1, m2, m3)
     assert mwman.middlewares == (m1, m2, m3)
     assert mwman.crawler is None
+
+
+class MAsyncResult:
+    async def process(self, response, request):
+        return f"{response}-async"
+
+
+class MDeferredResult:
+    def process(self, response, request):
+        return succeed(f"{response}-deferred")
+
+
+class MSyncResult:
+    def process(self, response, request):
+        return f"{response}-sync"
+
+
+@coroutine_test
+async def test_process_chain(crawler: Crawler) -> None:
+    mwman = MyMiddlewareManager(
+        MSyncResult(), MAsyncResult(), MDeferredResult(), M3(), crawler=crawler
+    )
+    with pytest.warns(ScrapyDeprecationWarning, match="returned a Deferred"):
+        result = await mwman._process_chain(
+            "process", "response", "request", warn_deferred=True
+        )
+    assert result is None  # M3.process returns None
+
+    mwman = MyMiddlewareManager(
+        MSyncResult(), MAsyncResult(), MDeferredResult(), crawler=crawler
+    )
+    result = await mwman._process_chain("process", "response", "request")
+    assert result == "response-sync-async-deferred"
+
+
+def test_chain(crawler: Crawler) -> None:
+    m1, m3, m_async = M1(), M3(), MAsyncResult()
+    mwman = MyMiddlewareManager(m1, m3, m_async, crawler=crawler)
+    mwman.methods["process"].appendleft(None)
+    chain = mwman._get_chain("process")
+    assert [compiled.method for compiled in chain] == [
+        m1.process,
+        m3.process,
+        m_async.process,
+    ]
+    assert [compiled.is_async for compiled in chain] == [False, False, True]
+    assert chain[0].name == "tests.test_middleware.M1.process"
+    assert mwman._get_chain("process") is chain
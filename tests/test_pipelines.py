@@ -2,15 +2,19 @@ import asyncio
 from typing import Any
 
 import pytest
-from twisted.internet.defer import Deferred, fail, succeed
+from twisted.internet.defer import Deferred, DeferredList, fail, succeed
 
 from scrapy import Request, Spider, signals
 from scrapy.crawler import Crawler
-from scrapy.exceptions import ScrapyDeprecationWarning
+from scrapy.exceptions import DropItem, ScrapyDeprecationWarning
 from scrapy.pipelines import ItemPipelineManager
 from scrapy.utils.asyncio import call_later
 from scrapy.utils.conf import build_component_list
-from scrapy.utils.defer import deferred_to_future, maybe_deferred_to_future
+from scrapy.utils.defer import (
+    deferred_from_coro,
+    deferred_to_future,
+    maybe_deferred_to_future,
+)
 from scrapy.utils.misc import build_from_crawler
 from scrapy.utils.spider import DefaultSpider
 from scrapy.utils.test import get_crawler, get_from_asyncio_queue
@@ -88,6 +92,30 @@ class AsyncDefNotAsyncioPipeline:
         return item
 
 
+class BatchPipeline:
+    def __init__(self) -> None:
+        self.batches: list[list[Any]] = []
+
+    def process_items(self, items: list[Any]) -> list[Any]:
+        self.batches.append(list(items))
+        outputs = []
+        for item in items:
+            if item.get("drop"):
+                outputs.append(DropItem("drop"))
+                continue
+            item["pipeline_passed"] = True
+            outputs.append(item)
+        return outputs
+
+
+class BatchAsyncPipeline(BatchPipeline):
+    async def process_items(self, items: list[Any]) -> list[Any]:  # type: ignore[override]
+        d: Deferred[Any] = Deferred()
+        call_later(0, d.callback, None)
+        await maybe_deferred_to_future(d)
+        return super().process_items(items)
+
+
 class ProcessItemExceptionPipeline:
     def process_item(self, item):
         raise ValueError("process_item error")
@@ -150,6 +178,8 @@ class TestPipeline:
         [
             SimplePipeline,
             AsyncDefPipeline,
+            BatchPipeline,
+            BatchAsyncPipeline,
             pytest.param(AsyncDefAsyncioPipeline, marks=pytest.mark.only_asyncio),
             pytest.param(
                 AsyncDefNotAsyncioPipeline, marks=pytest.mark.only_not_asyncio
@@ -250,6 +280,105 @@ class TestPipeline:
             await crawler.crawl_async(mockserver=mockserver)
 
 
+class TestBatchPipeline:
+    def _get_manager(self, pipeline: Any, **settings: Any) -> ItemPipelineManager:
+        crawler = get_crawler(DefaultSpider, settings)
+        manager = ItemPipelineManager(pipeline, crawler=crawler)
+        # Pretend that the crawl is busy, so that batches are not flushed
+        # straight away.
+        manager._only_batched_items_left = lambda: False  # type: ignore[method-assign]
+        return manager
+
+    async def _process(
+        self, manager: ItemPipelineManager, items: list[Any]
+    ) -> list[Any]:
+        results = await maybe_deferred_to_future(
+            DeferredList(
+                [deferred_from_coro(manager.process_item_async(i)) for i in items],
+                consumeErrors=True,
+            )
+        )
+        return [result if success else result.value for success, result in results]
+
+    @coroutine_test
+    async def test_max_items(self) -> None:
+        pipeline = BatchPipeline()
+        manager = self._get_manager(
+            pipeline,
+            ITEM_PIPELINE_BATCH_MAX_ITEMS=2,
+            ITEM_PIPELINE_BATCH_MAX_DELAY=0.01,
+        )
+        items = [{"index": index} for index in range(5)]
+        results = await self._process(manager, items)
+        assert results == [{"index": i, "pipeline_passed": True} for i in range(5)]
+        assert [len(batch) for batch in pipeline.batches] == [2, 2, 1]
+
+    @coroutine_test
+    async def test_max_bytes(self) -> None:
+        pipeline = BatchPipeline()
+        manager = self._get_manager(
+            pipeline,
+            ITEM_PIPELINE_BATCH_MAX_BYTES=1000,
+            ITEM_PIPELINE_BATCH_MAX_DELAY=0.01,
+        )
+        items = [{"data": "a" * 400} for _ in range(3)]
+        await self._process(manager, items)
+        assert [len(batch) for batch in pipeline.batches] == [2, 1]
+
+    @coroutine_test
+    async def test_drop(self) -> None:
+        manager = self._get_manager(BatchPipeline(), ITEM_PIPELINE_BATCH_MAX_ITEMS=2)
+        results = await self._process(manager, [{"drop": True}, {}])
+        assert isinstance(results[0], DropItem)
+        assert results[1] == {"pipeline_passed": True}
+
+    @pytest.mark.parametrize(
+        ("outputs", "match"),
+        [
+            (ValueError("foo"), "foo"),
+            ([{}], "returned 1 outputs for 2 items"),
+        ],
+    )
+    @coroutine_test
+    async def test_error(self, outputs: Any, match: str) -> None:
+        class ErrorPipeline:
+            def process_items(self, items):
+                if isinstance(outputs, Exception):
+                    raise outputs
+                return outputs
+
+        manager = self._get_manager(ErrorPipeline(), ITEM_PIPELINE_BATCH_MAX_ITEMS=2)
+        results = await self._process(manager, [{}, {}])
+        for result in results:
+            assert isinstance(result, ValueError)
+            assert match in str(result)
+
+    @coroutine_test
+    async def test_close_spider(self) -> None:
+        pipeline = BatchPipeline()
+        manager = self._get_manager(pipeline, ITEM_PIPELINE_BATCH_MAX_DELAY=60)
+        d = deferred_from_coro(manager.process_item_async({}))
+        d2: Deferred[None] = Deferred()
+        call_later(0, d2.callback, None)
+        await maybe_deferred_to_future(d2)
+        assert not pipeline.batches
+        await manager.close_spider_async()
+        assert pipeline.batches == [[{"pipeline_passed": True}]]
+        assert await maybe_deferred_to_future(d) == {"pipeline_passed": True}
+
+    @coroutine_test
+    async def test_flush_when_idle(self) -> None:
+        pipeline = BatchPipeline()
+        crawler = get_crawler(DefaultSpider, {"ITEM_PIPELINE_BATCH_MAX_DELAY": 60})
+        manager = ItemPipelineManager(pipeline, crawler=crawler)
+        assert await manager.process_item_async({}) == {"pipeline_passed": True}
+
+    def test_chain_name(self) -> None:
+        manager = self._get_manager(BatchPipeline())
+        (compiled,) = manager._get_chain("process_item")
+        assert compiled.name == f"{__name__}.BatchPipeline.process_items"
+
+
 class TestCustomPipelineManager:
     @coroutine_test
     async def test_deprecated_process_item_spider_arg(self) -> None:
@@ -145,6 +145,49 @@ class SchedulerTestMixin(TestSchedulerBase):
 
         assert priorities == sorted([x[1] for x in _PRIORITIES], key=lambda x: -x)
 
+    @coroutine_test
+    async def test_dequeue_batch(self, jobdir: Path | None) -> None:
+        def _setup(scheduler: Scheduler) -> None:
+            for url, priority in _PRIORITIES:
+                scheduler.enqueue_request(Request(url, priority=priority))
+
+        batches = []
+        async with self.create_scheduler_for_assertions(jobdir, _setup) as scheduler:
+            while batch := scheduler.next_requests(2):
+                batches.append([request.priority for request in batch])
+            assert scheduler.stats
+            stats = scheduler.stats.get_stats()
+
+        assert batches == [[2, 1], [0, -1], [-2]]
+        assert stats["scheduler/dequeued"] == len(_PRIORITIES)
+        storage = "disk" if jobdir else "memory"
+        assert stats[f"scheduler/dequeued/{storage}"] == len(_PRIORITIES)
+
+
+class FilteringScheduler(Scheduler):
+    def next_request(self) -> Request | None:
+        while (request := super().next_request()) is not None:
+            if not request.url.endswith("/b"):
+                return request
+        return None
+
+
+@coroutine_test
+async def test_dequeue_batch_next_request_override() -> None:
+    mock_crawler = MockCrawler("scrapy.pqueues.ScrapyPriorityQueue", None)
+    scheduler = build_from_crawler(FilteringScheduler, mock_crawler)
+    spider = Spider.from_crawler(mock_crawler, name="spider")
+    await ensure_awaitable(scheduler.open(spider))
+    for url, priority in _PRIORITIES:
+        scheduler.enqueue_request(Request(url, priority=priority))
+    batches = []
+    while batch := scheduler.next_requests(2):
+        batches.append([request.url[-1] for request in batch])
+    assert batches == [["e", "d"], ["c", "a"]]
+    await ensure_awaitable(scheduler.close("finished"))
+    await mock_crawler.stop_async()
+    mock_crawler.engine.downloader.close()
+
 
 class TestSchedulerInMemoryBase(SchedulerTestMixin):
     pass
@@ -263,6 +306,30 @@ class DownloaderAwareSchedulerTestMixin(TestSchedulerBase):
                 _setup(scheduler)
                 _assert(scheduler)
 
+    @coroutine_test
+    async def test_logic_batch(self, jobdir: Path | None) -> None:
+        async with self.create_scheduler(jobdir) as scheduler:
+            for url, slot in _URLS_WITH_SLOTS:
+                request = Request(url)
+                request.meta[Downloader.DOWNLOAD_SLOT] = slot
+                scheduler.enqueue_request(request)
+            assert scheduler.crawler
+            downloader = scheduler.crawler.engine.downloader
+            assert isinstance(downloader, MockDownloader)
+            downloader.increment("a")
+            batches = []
+            while batch := scheduler.next_requests(4):
+                batches.append([downloader.get_slot_key(r) for r in batch])
+            downloader.decrement("a")
+
+        # Slot "a" already has an active download, and each request in a
+        # batch counts as an active download of its slot.
+        assert [sorted(batch) for batch in batches] == [
+            ["a", "b", "b", "c"],
+            ["a", "c"],
+        ]
+        assert batches[0][:2] in (["b", "c"], ["c", "b"])
+
 
 class TestSchedulerWithDownloaderAwareInMemory(
     DownloaderAwareSchedulerTestMixin, TestSchedulerInMemoryBase
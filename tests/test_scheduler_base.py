@@ -85,6 +85,19 @@ class TestBaseScheduler(InterfaceCheckMixin):
         with pytest.raises(NotImplementedError):
             self.scheduler.next_request()
 
+    def test_next_requests(self):
+        class Scheduler(MinimalScheduler, BaseScheduler):
+            pass
+
+        scheduler = Scheduler()
+        for url in URLS:
+            scheduler.enqueue_request(Request(url))
+        first = scheduler.next_requests(2)
+        assert len(first) == 2
+        last = scheduler.next_requests(2)
+        assert {request.url for request in first + last} == set(URLS)
+        assert scheduler.next_requests(2) == []
+
 
 class TestMinimalScheduler(InterfaceCheckMixin):
     def setup_method(self):
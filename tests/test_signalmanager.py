@@ -1,4 +1,13 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+from typing import Any
+
+from pydispatch import dispatcher
+
 from scrapy.signalmanager import SignalManager
+from tests.utils.decorators import coroutine_test
 
 
 def test_disconnect_all() -> None:
@@ -18,3 +27,103 @@ def test_disconnect_all() -> None:
     sm.disconnect_all(signal)
     sm.send_catch_log(signal)
     assert calls == [1]  # handler no longer called after disconnect_all
+
+
+def test_send_catch_log_arguments() -> None:
+    signal = object()
+    sm = SignalManager(object())
+    received: list[tuple[str, Any]] = []
+
+    def handler(arg):
+        received.append(("handler", arg))
+
+    def handler_kwargs(arg, **kwargs):
+        received.append(("handler_kwargs", sorted(kwargs)))
+
+    class Receiver:
+        def __call__(self, sender, arg):
+            received.append(("callable", sender))
+
+    receiver = Receiver()
+    sm.connect(handler, signal)
+    sm.connect(handler_kwargs, signal)
+    sm.connect(receiver, signal)
+    assert sm.send_catch_log(signal, arg=1, other=2) == [
+        (handler, None),
+        (handler_kwargs, None),
+        (receiver, None),
+    ]
+    assert received == [
+        ("handler", 1),
+        ("handler_kwargs", ["other", "sender", "signal"]),
+        ("callable", sm.sender),
+    ]
+
+
+def test_send_catch_log_no_receivers() -> None:
+    sm = SignalManager(object())
+    assert sm.send_catch_log(object()) == []
+
+
+def test_dispatch_table_invalidation() -> None:
+    signal = object()
+    sender = object()
+    sm = SignalManager(sender)
+    calls: list[str] = []
+
+    def handler1() -> None:
+        calls.append("handler1")
+
+    def handler2() -> None:
+        calls.append("handler2")
+
+    sm.connect(handler1, signal)
+    sm.send_catch_log(signal)
+    assert calls == ["handler1"]
+
+    # Receivers connected and disconnected elsewhere are also detected
+    SignalManager(sender).connect(handler2, signal)
+    sm.send_catch_log(signal)
+    assert calls == ["handler1", "handler1", "handler2"]
+
+    dispatcher.disconnect(handler1, signal, sender=sender)
+    sm.send_catch_log(signal)
+    assert calls == ["handler1", "handler1", "handler2", "handler2"]
+
+    sm.disconnect(handler2, signal)
+    assert sm.send_catch_log(signal) == []
+
+
+def test_dispatch_table_weak_receiver() -> None:
+    signal = object()
+    sm = SignalManager(object())
+    calls: list[int] = []
+
+    class Receiver:
+        def handler(self) -> None:
+            calls.append(1)
+
+    receiver = Receiver()
+    sm.connect(receiver.handler, signal)
+    sm.send_catch_log(signal)
+    assert calls == [1]
+
+    del receiver
+    gc.collect()
+    assert sm.send_catch_log(signal) == []
+    assert calls == [1]
+
+
+@coroutine_test
+async def test_send_catch_log_async_arguments() -> None:
+    signal = object()
+    sm = SignalManager(object())
+
+    async def handler(arg):
+        await asyncio.sleep(0)
+        return arg
+
+    sm.connect(handler, signal)
+    assert await sm.send_catch_log_async(signal, arg=1, other=2) == [(handler, 1)]
+    sm.disconnect(handler, signal)
+    assert await sm.send_catch_log_async(signal, arg=1) == []
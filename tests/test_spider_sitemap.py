@@ -6,12 +6,13 @@ from datetime import datetime
 from io import BytesIO
 from logging import WARNING
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
 from scrapy.http import HtmlResponse, Request, Response, TextResponse, XmlResponse
 from scrapy.spiders import SitemapSpider
+from scrapy.utils import gz
 from scrapy.utils.test import get_crawler
 from tests import tests_datadir
 from tests.spiders import RawResponseSpider
@@ -485,6 +486,101 @@ Sitemap: /sitemap-relative-url.xml
             ),
         ]
 
+    @staticmethod
+    def _get_gzipped_sitemap(count: int) -> bytes:
+        urls = b"".join(
+            b"<url><loc>http://www.example.com/%d</loc></url>" % i for i in range(count)
+        )
+        return gzip.compress(
+            b'<?xml version="1.0" encoding="UTF-8"?>'
+            b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            + urls
+            + b"</urlset>"
+        )
+
+    def test_parse_sitemap_gzip(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        readers = []
+
+        class _GunzipReader(gz._GunzipReader):
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                super().__init__(*args, **kwargs)
+                readers.append(self)
+
+        monkeypatch.setattr("scrapy.spiders.sitemap._GunzipReader", _GunzipReader)
+        body = self._get_gzipped_sitemap(100_000)
+        r = Response(
+            url="http://www.example.com/sitemap.xml.gz",
+            body=body,
+            request=Request("http://www.example.com/sitemap.xml.gz"),
+        )
+        spider = self.spider_class.from_crawler(get_crawler(), "example.com")
+        requests = iter(spider._parse_sitemap(r))
+        assert next(requests).url == "http://www.example.com/0"
+        # The first request is sent before the whole sitemap is decompressed.
+        assert readers[0].size < len(gzip.decompress(body))
+        assert sum(1 for _ in requests) == 99_999
+
+    def test_parse_sitemap_gzip_max_size(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        crawler = get_crawler(
+            settings_dict={"DOWNLOAD_MAXSIZE": 200_000, "DOWNLOAD_WARNSIZE": 100_000}
+        )
+        spider = self.spider_class.from_crawler(crawler, "example.com")
+        body = self._get_gzipped_sitemap(10_000)
+        r = Response(
+            url="http://www.example.com/sitemap.xml.gz",
+            body=body,
+            request=Request("http://www.example.com/sitemap.xml.gz"),
+        )
+        caplog.clear()
+        with caplog.at_level(WARNING, logger="scrapy.spiders.sitemap"):
+            requests = list(spider._parse_sitemap(r))
+        assert 0 < len(requests) < 10_000
+        assert [message for _, _, message in caplog.record_tuples] == [
+            (
+                "Ignoring the rest of sitemap <200 http://www.example.com/sitemap.xml.gz>: "
+                "The number of bytes decompressed so far (229376 B) exceeded the "
+                "specified maximum (200000 B)."
+            ),
+            (
+                "<200 http://www.example.com/sitemap.xml.gz> body size after "
+                "decompression (229376 B) is larger than the download warning "
+                "size (100000 B)."
+            ),
+        ]
+
+    @pytest.mark.parametrize("body", [b"", b" "])
+    def test_parse_sitemap_gzip_invalid(
+        self, body: bytes, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        request = Request("http://www.example.com/sitemap.xml.gz")
+        r = Response(url=request.url, body=gzip.compress(body), request=request)
+        spider = self.spider_class.from_crawler(get_crawler(), "example.com")
+        caplog.clear()
+        with caplog.at_level(WARNING):
+            assert not list(spider._parse_sitemap(r))
+        assert caplog.record_tuples == [
+            (
+                "scrapy.spiders.sitemap",
+                WARNING,
+                "Ignoring invalid sitemap: <200 http://www.example.com/sitemap.xml.gz>",
+            )
+        ]
+
+    def test_parse_sitemap_custom_body(self) -> None:
+        class _Spider(self.spider_class):  # type: ignore[name-defined,misc]
+            def _get_sitemap_body(self, response: Response) -> bytes | None:
+                return gzip.decompress(response.body)
+
+        body = self._get_gzipped_sitemap(2)
+        r = Response(url="http://www.example.com/sitemap.xml.gz", body=body)
+        spider = _Spider.from_crawler(get_crawler(), "example.com")
+        assert [req.url for req in spider._parse_sitemap(r)] == [
+            "http://www.example.com/0",
+            "http://www.example.com/1",
+        ]
+
     @coroutine_test
     async def test_sitemap_urls(self):
         class TestSpider(self.spider_class):  # type: ignore[name-defined,misc]
@@ -12,6 +12,7 @@ from scrapy.spiders import Spider
 from scrapy.statscollectors import DummyStatsCollector, StatsCollector
 from scrapy.utils.misc import build_from_crawler
 from scrapy.utils.test import get_crawler
+from scrapy.utils.url import urljoin_cached
 from tests.spiders import SimpleSpider
 from tests.utils.decorators import coroutine_test
 
@@ -71,6 +72,20 @@ class TestCoreStatsExtension:
         ext.spider_closed(spider, "finished")
         assert ext.stats._stats == {}
 
+    def test_core_stats_url_cache(self, crawler: Crawler, spider: Spider) -> None:
+        crawler.stats = StatsCollector(crawler)
+        ext = build_from_crawler(CoreStats, crawler)
+        url = "https://example.com/test_core_stats_url_cache"
+        urljoin_cached(url, "a")
+        ext.spider_opened(spider)
+        for path in ("a", "a", "a", "b"):
+            urljoin_cached(url, path)
+        ext.spider_closed(spider, "finished")
+        stats = ext.stats.get_stats()
+        assert stats["url_cache/process_hits"] == 3
+        assert stats["url_cache/process_misses"] == 1
+        assert stats["url_cache/process_hit_ratio"] == 0.75
+
 
 class TestStatsCollector:
     def test_collector(self, crawler: Crawler) -> None:
@@ -8,13 +8,15 @@ from asyncio import Future
 from typing import TYPE_CHECKING, Any
 
 import pytest
-from twisted.internet.defer import Deferred, inlineCallbacks
+from twisted.internet.defer import CancelledError, Deferred, inlineCallbacks
 from twisted.internet.interfaces import IReadDescriptor
 from zope.interface import implementer
 
 from scrapy.utils.asyncgen import as_async_generator, collect_asyncgen
 from scrapy.utils.asyncio import is_asyncio_available
 from scrapy.utils.defer import (
+    _create_waiter,
+    _fire_waiter,
     _process_pending_io,
     aiter_errback,
     deferred_f_from_coro_f,
@@ -212,6 +214,33 @@ async def test_process_pending_io() -> None:
     assert reads
 
 
+class TestWaiter:
+    @coroutine_test
+    async def test_result(self):
+        waiter = _create_waiter()
+        if is_asyncio_available():
+            assert isinstance(waiter, Future)
+        else:
+            assert isinstance(waiter, Deferred)
+        _fire_waiter(waiter, 42)
+        assert await waiter == 42
+
+    @coroutine_test
+    async def test_exception(self):
+        waiter = _create_waiter()
+        _fire_waiter(waiter, exception=ValueError("foo"))
+        with pytest.raises(ValueError, match="foo"):
+            await waiter
+
+    @coroutine_test
+    async def test_cancelled(self):
+        waiter = _create_waiter()
+        waiter.cancel()
+        _fire_waiter(waiter, 42)
+        with pytest.raises((asyncio.CancelledError, CancelledError)):
+            await waiter
+
+
 @pytest.mark.requires_reactor  # parallel_async() requires a reactor
 class TestParallelAsync:
     """This tests _AsyncCooperatorAdapter by testing parallel_async which is its only usage.
@@ -7,7 +7,8 @@ import pytest
 from w3lib.encoding import html_to_unicode
 
 from scrapy.http import Response
-from scrapy.utils.gz import gunzip, gzip_magic_number
+from scrapy.utils._compression import _DecompressionMaxSizeExceeded
+from scrapy.utils.gz import _GunzipReader, gunzip, gzip_magic_number
 from tests import tests_datadir
 
 SAMPLEDIR = Path(tests_datadir, "compressed")
@@ -25,6 +26,27 @@ def test_gunzip_basic():
     assert len(r2.body) == 9950
 
 
+def test_gunzip_reader():
+    data = (SAMPLEDIR / "feed-sample1.xml.gz").read_bytes()
+    reader = _GunzipReader(data)
+    chunk = reader.read(100)
+    assert 0 < len(chunk) <= 100
+    assert reader.size == len(chunk)
+    while c := reader.read():
+        chunk += c
+    assert chunk == gunzip(data)
+    assert reader.size == len(chunk)
+
+
+def test_gunzip_reader_max_size():
+    reader = _GunzipReader(
+        (SAMPLEDIR / "feed-sample1.xml.gz").read_bytes(), max_size=1000
+    )
+    assert reader.read(1000)
+    with pytest.raises(_DecompressionMaxSizeExceeded):
+        reader.read(1000)
+
+
 def test_gunzip_truncated():
     text = gunzip((SAMPLEDIR / "truncated-crc-error.gz").read_bytes())
     assert text.endswith(b"</html")
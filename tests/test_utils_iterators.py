@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import mmap
+from io import BytesIO
+from typing import TYPE_CHECKING
+
 import pytest
 
 from scrapy.http import Response, TextResponse, XmlResponse
 from scrapy.utils.iterators import _body_or_str, csviter, xmliter_lxml
 from tests import get_testdata
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 class TestXmliter:
     def test_xmliter(self):
@@ -247,6 +254,35 @@ class TestXmliter:
         with pytest.raises(StopIteration):
             next(my_iter)
 
+    def test_xmliter_file(self, tmp_path: Path) -> None:
+        body = (
+            b"\n" * 70_000
+            + b'<?xml version="1.0" encoding="UTF-8"?><products>'
+            + b"<product>\xc3\xbe</product>" * 10_000
+            + b"</products>"
+        )
+        expected = ["\xfe"] * 10_000
+        assert [
+            x.xpath("text()").get() for x in xmliter_lxml(BytesIO(body), "product")
+        ] == expected
+        path = tmp_path / "feed.xml"
+        path.write_bytes(body)
+        with (
+            path.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            assert [
+                x.xpath("text()").get() for x in xmliter_lxml(mm, "product")
+            ] == expected
+
+    def test_xmliter_nested_nodes(self):
+        body = b"<root><a><a>1</a><b>2</b></a><c/><a>3</a></root>"
+        assert [x.get() for x in xmliter_lxml(body, "a")] == [
+            "<a>1</a>",
+            "<a><a/><b>2</b></a>",
+            "<a>3</a>",
+        ]
+
     def test_xmliter_objtype_exception(self):
         i = xmliter_lxml(42, "product")  # type: ignore[arg-type]
         with pytest.raises(TypeError):
@@ -485,6 +521,40 @@ class TestUtilsCsv:
             },
         ]
 
+    def test_csviter_file(self, tmp_path: Path) -> None:
+        # Rows span several chunks, with multi-byte characters and quoted line
+        # breaks across chunk boundaries.
+        rows = [
+            {"id": str(i), "value": f"\xfan\xedc\xf3d\xe9\n{i}"} for i in range(20_000)
+        ]
+        body = "id,value\n" + "".join(f'{r["id"]},"{r["value"]}"\r\n' for r in rows)
+        data = body.encode()
+        assert list(csviter(BytesIO(data))) == rows
+        assert list(csviter(Response("http://example.com/", body=data))) == rows
+        path = tmp_path / "feed.csv"
+        path.write_bytes(data)
+        with (
+            path.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            assert list(csviter(mm)) == rows
+
+    def test_csviter_bom(self):
+        response = TextResponse(
+            url="http://example.com/",
+            body="id,name\n1,\u0105\n".encode("utf-16"),
+        )
+        assert list(csviter(response)) == [{"id": "1", "name": "\u0105"}]
+
+    def test_csviter_binary_response_invalid_utf8(self):
+        response = Response(url="http://example.com/", body=b"id\n\xff\n")
+        with pytest.raises(UnicodeDecodeError):
+            list(csviter(response))
+
+    def test_csviter_objtype_exception(self):
+        with pytest.raises(TypeError):
+            list(csviter(42))  # type: ignore[arg-type]
+
 
 class TestBodyOrStr:
     bbody = b"utf8-body"
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from io import BytesIO
+
 import pytest
 
 from scrapy.exceptions import ScrapyDeprecationWarning
@@ -41,6 +43,23 @@ def test_sitemap():
     ]
 
 
+def test_sitemap_file():
+    s = Sitemap(
+        BytesIO(
+            b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+<url><loc>http://www.example.com/</loc></url>
+<url><loc>http://www.example.com/2</loc></url>
+</urlset>"""
+        )
+    )
+    assert s.type == "urlset"
+    assert list(s) == [
+        {"loc": "http://www.example.com/"},
+        {"loc": "http://www.example.com/2"},
+    ]
+
+
 def test_sitemap_str():
     xmltext = """<?xml version="1.0" encoding="UTF-8"?>
 <urlset xmlns="http://www.google.com/schemas/sitemap/0.84">
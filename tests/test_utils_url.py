@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from w3lib.url import canonicalize_url
 
 from scrapy.linkextractors import IGNORED_EXTENSIONS
 from scrapy.spiders import Spider
+from scrapy.utils import url as url_utils
 from scrapy.utils.url import (
     _is_filesystem_path,
+    _set_url_cache_size,
+    _URLCache,
     add_http_if_no_scheme,
+    canonicalize_url_cached,
     guess_scheme,
+    safe_url_string_cached,
     strip_url,
     url_has_any_extension,
     url_is_from_any_domain,
     url_is_from_spider,
+    urljoin_cached,
 )
 
 
@@ -40,6 +49,15 @@ def test_url_is_from_any_domain():
     assert not url_is_from_any_domain(url + ".testdomain.com", ["testdomain.com"])
 
 
+def test_url_is_from_any_domain_many_domains():
+    domains = [f"{i}.Example" for i in range(10_000)]
+    for _ in range(2):
+        assert url_is_from_any_domain("http://www.9999.example/", domains)
+        assert url_is_from_any_domain("http://9999.example/", iter(domains))
+        assert not url_is_from_any_domain("http://10000.example/", domains)
+        assert not url_is_from_any_domain("http://example/", domains)
+
+
 def test_url_is_from_spider():
     class MySpider(Spider):
         name = "example.com"
@@ -446,3 +464,96 @@ class TestStripUrl:
 )
 def test__is_filesystem_path(path: str, expected: bool) -> None:
     assert _is_filesystem_path(path) == expected
+
+
+class TestURLCache:
+    def test_lru(self) -> None:
+        calls: list[str] = []
+
+        def func(url: str) -> str:
+            calls.append(url)
+            return url.upper()
+
+        cache = _URLCache(func, maxsize=2)
+        assert cache("a") == "A"
+        assert cache("b") == "B"
+        assert cache("a") == "A"
+        assert cache("c") == "C"  # evicts "b", the least recently used
+        assert cache("a") == "A"
+        assert cache("b") == "B"
+        assert calls == ["a", "b", "c", "b"]
+        assert (cache.hits, cache.misses) == (2, 4)
+
+    def test_resize(self) -> None:
+        cache = _URLCache(str.upper)
+        for url in "abc":
+            cache(url)
+        cache.resize(1)
+        cache("c")
+        assert (cache.hits, cache.misses) == (1, 3)
+        cache("a")
+        assert (cache.hits, cache.misses) == (1, 4)
+
+    def test_disabled(self) -> None:
+        cache = _URLCache(str.upper, maxsize=0)
+        assert cache("a") == "A"
+        assert cache("a") == "A"
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_exception(self) -> None:
+        def func(url: str) -> str:
+            raise ValueError(url)
+
+        cache = _URLCache(func)
+        for _ in range(2):
+            with pytest.raises(ValueError, match="a"):
+                cache("a")
+        assert cache.misses == 2
+
+    def test_threads(self) -> None:
+        cache = _URLCache(str.upper, maxsize=8)
+        urls = [f"u{i % 20}" for i in range(20000)]
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(cache, urls))
+        assert results == [url.upper() for url in urls]
+        assert cache.hits + cache.misses == len(urls)
+        assert len(cache._results) <= 8
+
+
+def test_set_url_cache_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    caches = (_URLCache(str.upper), _URLCache(str.lower))
+    monkeypatch.setattr(url_utils, "_url_caches", caches)
+    monkeypatch.setattr(url_utils, "_url_cache_size", None)
+    for size, expected in ((0, 0), (5, 5), (0, 5), (3, 5), (20, 20)):
+        _set_url_cache_size(size)
+        assert [cache.maxsize for cache in caches] == [expected, expected]
+
+
+def test_canonicalize_url_cached() -> None:
+    url = "http://example.com/?b=2&a=1#fragment"
+    for _ in range(2):
+        assert canonicalize_url_cached(url) == canonicalize_url(url)
+        assert canonicalize_url_cached(url, keep_fragments=True) == canonicalize_url(
+            url, keep_fragments=True
+        )
+
+
+def test_safe_url_string_cached() -> None:
+    for _ in range(2):
+        assert (
+            safe_url_string_cached("http://example.com/?q=£", encoding="latin1")
+            == "http://example.com/?q=%A3"
+        )
+        assert safe_url_string_cached("http://example.com/?q=£") == (
+            "http://example.com/?q=%C2%A3"
+        )
+
+
+def test_urljoin_cached() -> None:
+    for _ in range(2):
+        assert urljoin_cached("http://example.com/a/b", "c") == (
+            "http://example.com/a/c"
+        )
+        assert urljoin_cached("http://example.com/a/", "c") == (
+            "http://example.com/a/c"
+        )
@@ -612,6 +612,29 @@ class TestHttpBase(ABC):
         else:
             assert latency > 0
 
+    @coroutine_test
+    async def test_download_timing(self, mockserver: MockServer) -> None:
+        request1 = Request(mockserver.url("/text", is_secure=self.is_secure))
+        request2 = Request(mockserver.url("/text", is_secure=self.is_secure))
+        async with self.get_dh() as download_handler:
+            await download_handler.download_request(request1)
+            await download_handler.download_request(request2)
+
+        timing = request1.meta["download_timing"]
+        assert not timing["connection_reused"]
+        assert timing["connect"] >= 0
+        assert (timing["tls"] is not None) == self.is_secure
+        for phase in ("ttfb", "transfer", "total"):
+            assert timing[phase] >= 0
+        assert timing["total"] >= timing["ttfb"]
+
+        timing = request2.meta["download_timing"]
+        assert timing["connection_reused"]
+        assert timing["dns"] is None
+        assert timing["connect"] is None
+        assert timing["tls"] is None
+        assert timing["ttfb"] >= 0
+
     @coroutine_test
     async def test_response_class_choosing_request(
         self, mockserver: MockServer